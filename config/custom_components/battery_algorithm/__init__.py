@@ -0,0 +1,87 @@
+"""Battery management algorithm for the Huawei Luna battery."""
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.json import json_loads
+
+from .const import (
+    CONF_CONSTANTS,
+    CONF_ENGINE,
+    CONF_SHADOW,
+    DOMAIN,
+    SERVICE_DRY_RUN,
+    SERVICE_EXPLAIN,
+    SERVICE_RUN,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from .coordinator import BatteryAlgorithmCoordinator, load_candidate
+from .shadow import ShadowStats
+
+_LOGGER = logging.getLogger(__name__)
+
+SHADOW_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ENGINE): cv.string,
+        vol.Optional(CONF_CONSTANTS, default={}): {
+            cv.matches_regex(r"^[A-Z][A-Z0-9_]*$"): vol.Any(bool, int, float, str)
+        },
+    }
+)
+
+CONFIG_SCHEMA = vol.Schema(
+    {DOMAIN: vol.Maybe(vol.Schema({vol.Optional(CONF_SHADOW): SHADOW_SCHEMA}))},
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+def _response(outcome: dict) -> ServiceResponse:
+    """Outcome as a plain JSON response (the engine's inputs hold tuples)."""
+    return json_loads(json_bytes(outcome))
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the run, dry_run and explain services."""
+    conf = config.get(DOMAIN) or {}
+    coordinator = BatteryAlgorithmCoordinator(hass)
+
+    if (shadow := conf.get(CONF_SHADOW)) is not None:
+        path = hass.config.path(shadow[CONF_ENGINE]) if CONF_ENGINE in shadow else None
+        try:
+            candidate = await hass.async_add_executor_job(load_candidate, path, shadow[CONF_CONSTANTS])
+        except (OSError, SyntaxError, ValueError) as err:
+            _LOGGER.error("Shadow candidate not loaded: %s", err)
+        else:
+            store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+            stats = ShadowStats.from_dict(await store.async_load())
+            coordinator = BatteryAlgorithmCoordinator(hass, candidate, stats, store)
+    hass.data[DOMAIN] = coordinator
+    hass.async_create_task(async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config))
+
+    async def _async_run(call: ServiceCall) -> ServiceResponse:
+        outcome = await coordinator.async_run()
+        return _response(outcome) if call.return_response else None
+
+    async def _async_dry_run(call: ServiceCall) -> ServiceResponse:
+        return _response(await coordinator.async_run(dry_run=True))
+
+    async def _async_explain(call: ServiceCall) -> ServiceResponse:
+        if coordinator.last_run is None:
+            raise HomeAssistantError("The battery algorithm has not run yet")
+        return _response(coordinator.last_run)
+
+    hass.services.async_register(DOMAIN, SERVICE_RUN, _async_run, supports_response=SupportsResponse.OPTIONAL)
+    hass.services.async_register(DOMAIN, SERVICE_DRY_RUN, _async_dry_run, supports_response=SupportsResponse.ONLY)
+    hass.services.async_register(DOMAIN, SERVICE_EXPLAIN, _async_explain, supports_response=SupportsResponse.ONLY)
+    return True
@@ -0,0 +1,23 @@
+"""Constants for the Battery Algorithm integration."""
+
+DOMAIN = "battery_algorithm"
+
+SERVICE_RUN = "run"
+SERVICE_DRY_RUN = "dry_run"
+SERVICE_EXPLAIN = "explain"
+
+CONF_SHADOW = "shadow"
+CONF_ENGINE = "engine"
+CONF_CONSTANTS = "constants"
+
+# A/B statistics of the shadow candidate
+STORAGE_KEY = f"{DOMAIN}_shadow"
+STORAGE_VERSION = 1
+SAVE_DELAY = 300
+SHADOW_HISTORY_SIZE = 50
+
+SIGNAL_SHADOW_UPDATED = f"{DOMAIN}_shadow_updated"
+
+# Timing of the runs: a run over the budget counts as slow
+RUN_BUDGET_MS = 2000
+SIGNAL_TIMING_UPDATED = f"{DOMAIN}_timing_updated"
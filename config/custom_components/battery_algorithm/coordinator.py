@@ -0,0 +1,190 @@
+"""Runs the battery algorithm engine and keeps the outcome of the last run."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import importlib.util
+import logging
+from pathlib import Path
+import time
+from types import ModuleType
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from . import engine
+from .const import SAVE_DELAY, SHADOW_HISTORY_SIZE, SIGNAL_SHADOW_UPDATED, SIGNAL_TIMING_UPDATED
+from .shadow import ShadowStats, project_hour_cost
+from .timing import RunTimings, SpanTimer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _RecordingServices:
+    """hass.services for the engine: records every call, executes it unless dry-run."""
+
+    def __init__(self, hass: HomeAssistant, dry_run: bool, timer: SpanTimer):
+        self._hass = hass
+        self._dry_run = dry_run
+        self._timer = timer
+        self.writes: list[dict[str, Any]] = []
+
+    def call(self, domain: str, service: str, service_data: dict | None = None, blocking: bool = False) -> None:
+        self.writes.append({"domain": domain, "service": service, "data": dict(service_data or {})})
+        with self._timer.span("service_call"):
+            if not self._dry_run:
+                self._hass.services.call(domain, service, service_data, blocking=blocking)
+
+
+class _TimedStates:
+    """hass.states for the engine: every read goes into the state_read span."""
+
+    def __init__(self, hass: HomeAssistant, timer: SpanTimer):
+        self._states = hass.states
+        self._timer = timer
+
+    def get(self, entity_id: str):
+        with self._timer.span("state_read"):
+            return self._states.get(entity_id)
+
+
+class _EngineHass:
+    """The part of hass the engine uses: states read and services recorded, both timed."""
+
+    def __init__(self, hass: HomeAssistant, dry_run: bool, timer: SpanTimer | None = None):
+        self.timer = timer or SpanTimer()
+        self.states = _TimedStates(hass, self.timer)
+        self.services = _RecordingServices(hass, dry_run, self.timer)
+
+
+def load_candidate(path: str | None, constants: dict[str, Any]) -> ModuleType:
+    """Separate copy of an engine (the built-in one by default) with constants overridden."""
+    spec = importlib.util.spec_from_file_location(
+        f"{__package__}.candidate", path or Path(engine.__file__)
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if not callable(getattr(module, "decide_strategy", None)):
+        raise ValueError(f"{spec.origin} has no decide_strategy()")
+    for name, value in constants.items():
+        if not hasattr(module, name):
+            raise ValueError(f"{spec.origin} has no constant {name}")
+        setattr(module, name, value)
+    return module
+
+
+class BatteryAlgorithmCoordinator:
+    """Runs the engine one pass at a time in the executor.
+
+    The engine module is imported once, so a run costs only the pass itself.
+    The plan and the service calls of the last real run are kept for the
+    explain service; dry runs go through the same code with calls recorded
+    but not executed.
+
+    With a shadow candidate, every run also asks the candidate's
+    decide_strategy() for its decision on the same inputs, with all of its
+    service calls dropped, and compares the projected cost of both.
+
+    Each pass is timed per phase (spans set by the engine) and per state
+    read and service call (spans set by the proxies); real runs go into a
+    rolling window for the timing sensor.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        candidate: ModuleType | None = None,
+        shadow_stats: ShadowStats | None = None,
+        store: Store | None = None,
+    ):
+        self.hass = hass
+        self.last_run: dict[str, Any] | None = None
+        self.candidate = candidate
+        self.shadow_stats = shadow_stats
+        self.shadow_history: deque[dict] = deque(maxlen=SHADOW_HISTORY_SIZE)
+        self.timings = RunTimings()
+        self.last_timing: dict[str, float] | None = None
+        self._store = store
+        self._lock = asyncio.Lock()
+
+    def _shadow(self, plan: dict) -> dict[str, Any] | None:
+        """The candidate's decision on the live run's inputs (executor thread)."""
+        data, balance = plan.get("data"), plan.get("balance")
+        if self.candidate is None or data is None or balance is None:
+            return None
+        started = time.perf_counter()
+        candidate_hass = _EngineHass(self.hass, dry_run=True)
+        self.candidate.hass = candidate_hass
+        try:
+            strategy = self.candidate.decide_strategy(data, balance)
+        except Exception as err:
+            _LOGGER.warning("Shadow candidate failed: %r", err)
+            return None
+        finally:
+            self.candidate.hass = None
+        live_strategy = plan["strategy"]
+        return {
+            "live": {"mode": live_strategy.get("mode"), "reason": live_strategy.get("reason"),
+                     **project_hour_cost(live_strategy, data, balance)},
+            "candidate": {"mode": strategy.get("mode"), "reason": strategy.get("reason"),
+                          **project_hour_cost(strategy, data, balance)},
+            "dropped_calls": len(candidate_hass.services.writes),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def _run(self, dry_run: bool) -> dict[str, Any]:
+        """One engine pass (executor thread)."""
+        engine_hass = _EngineHass(self.hass, dry_run)
+        engine.hass, engine.timer = engine_hass, engine_hass.timer
+        started = time.perf_counter()
+        try:
+            plan = engine.run() or {}
+        finally:
+            engine.hass = engine.timer = None
+        duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        strategy = plan.get("strategy") or {}
+        return {
+            "time": dt_util.now().isoformat(timespec="seconds"),
+            "dry_run": dry_run,
+            "duration_ms": duration_ms,
+            "mode": strategy.get("mode"),
+            "priority": strategy.get("priority"),
+            "reason": strategy.get("reason"),
+            "result": plan.get("result"),
+            "error": plan.get("error"),
+            "strategy": strategy,
+            "balance": plan.get("balance"),
+            "inputs": plan.get("data"),
+            "writes": engine_hass.services.writes,
+            "timings": engine_hass.timer.as_dict(),
+            "shadow": self._shadow(plan),
+        }
+
+    async def async_run(self, dry_run: bool = False) -> dict[str, Any]:
+        """Run the algorithm; with dry_run nothing is written."""
+        async with self._lock:
+            outcome = await self.hass.async_add_executor_job(self._run, dry_run)
+        if outcome["error"]:
+            _LOGGER.error("Battery algorithm failed: %s", outcome["error"])
+        _LOGGER.debug(
+            "%s: %s (%s), %d service calls in %.1f ms",
+            "Dry run" if dry_run else "Run", outcome["mode"], outcome["reason"],
+            len(outcome["writes"]), outcome["duration_ms"],
+        )
+        if not dry_run:
+            self.last_run = outcome
+            self.last_timing = self.timings.add(outcome["duration_ms"], outcome["timings"])
+            async_dispatcher_send(self.hass, SIGNAL_TIMING_UPDATED)
+            if (shadow := outcome["shadow"]) is not None:
+                self._async_record_shadow(outcome["time"], shadow)
+        return outcome
+
+    def _async_record_shadow(self, when: str, shadow: dict) -> None:
+        self.shadow_history.appendleft({"time": when, **shadow})
+        self.shadow_stats.add(when[:10], shadow["live"], shadow["candidate"])
+        if self._store is not None:
+            self._store.async_delay_save(self.shadow_stats.as_dict, SAVE_DELAY)
+        async_dispatcher_send(self.hass, SIGNAL_SHADOW_UPDATED)
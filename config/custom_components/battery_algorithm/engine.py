@@ -2,9 +2,25 @@
 Algorytm zarządzania baterią Huawei Luna 15kWh
 Implementacja zgodna z ALGORITHM.md
 
-Autor: Claude Code
+Silnik integracji battery_algorithm (wcześniej python_scripts/battery_algorithm.py).
+Moduł importowany raz; `hass` ustawia BatteryAlgorithmCoordinator przed każdym
+przebiegiem, run() wykonuje jeden przebieg i zwraca plan.
+
 Data: 2025-11-11
 """
+from contextlib import nullcontext
+import json
+from datetime import date, datetime, timedelta
+
+# Ustawiane przez koordynator (lub testy) przed wywołaniem run()
+hass = None
+# Pomiar czasu faz (SpanTimer z timing.py), None = bez pomiaru
+timer = None
+
+
+def span(name):
+    """Mierzy czas fazy przebiegu, gdy koordynator ustawił timer"""
+    return timer.span(name) if timer is not None else nullcontext()
 
 # ============================================
 # KONFIGURACJA - PROGI
@@ -13,6 +29,9 @@ Data: 2025-11-11
 # Progi prognozy PV (kWh) - używane w handle_pv_surplus()
 FORECAST_POOR = 12
 
+# Godzina z prognozą PV poniżej tego progu (kWh) nie jest godziną słoneczną
+PV_HOUR_MIN_KWH = 0.05
+
 # Progi baterii (%) - DYNAMICZNE W ZALEŻNOŚCI OD SEZONU
 BATTERY_CRITICAL = 5   # SOC krytyczne - natychmiastowe ładowanie 24/7 (stałe)
 BATTERY_GOOD = 65      # SOC dobre
@@ -88,13 +107,14 @@ def execute_strategy():
     """
     Główna funkcja wykonywana co godzinę
     """
-    data = collect_input_data()
+    with span('collect'):
+        data = collect_input_data()
 
     if not validate_data(data):
         # logger.error("Dane niekompletne - fallback mode")
         strategy = get_fallback_strategy(data)
-        apply_battery_mode(strategy)
-        return
+        result = apply_battery_mode(strategy)
+        return {'data': data, 'strategy': strategy, 'result': result}
 
     # PRIORYTET 0: Sprawdź temperaturę baterii - jeśli niebezpieczna, ZATRZYMAJ ładowanie NATYCHMIAST!
     temp_safe_state = hass.states.get('binary_sensor.bateria_bezpieczna_temperatura')
@@ -113,11 +133,13 @@ def execute_strategy():
             })
             # Zapisz powód decyzji
             battery_temp = data.get('battery_temp', 'N/A')
+            reason = f'🚨 ZATRZYMANO - temperatura baterii ({battery_temp}°C) poza bezpiecznym zakresem!'
             hass.services.call('input_text', 'set_value', {
                 'entity_id': 'input_text.battery_decision_reason',
-                'value': f'🚨 ZATRZYMANO - temperatura baterii ({battery_temp}°C) poza bezpiecznym zakresem!'
+                'value': reason
             })
-            return
+            strategy = {'mode': 'stop_charging', 'priority': 'critical', 'reason': reason}
+            return {'data': data, 'strategy': strategy, 'result': True}
 
     # PRIORYTET 1: Sprawdź czy osiągnięto Target SOC - jeśli tak, ZATRZYMAJ ładowanie
     # ALE kontynuuj do decide_strategy() żeby obsłużyć L1/L2!
@@ -152,7 +174,8 @@ def execute_strategy():
     # ZAWSZE obliczaj najtańsze godziny - niezależnie od nadwyżki PV
     # To wypełnia input_text.battery_storage_status i input_text.battery_cheapest_hours
     try:
-        calculate_cheapest_hours_to_store(data)
+        with span('cheapest_hours'):
+            calculate_cheapest_hours_to_store(data)
     except Exception as e:
         # Jeśli błąd - zapisz info
         hass.services.call('input_text', 'set_value', {
@@ -160,19 +183,22 @@ def execute_strategy():
             'value': f"Błąd analizy: {str(e)[:200]}"
         })
 
-    strategy = decide_strategy(data, balance)
-    result = apply_battery_mode(strategy, data)
+    with span('decide'):
+        strategy = decide_strategy(data, balance)
+    with span('apply'):
+        result = apply_battery_mode(strategy, data)
 
     # Event Log - logowanie decyzji
     try:
-        log_decision(data, balance, strategy, result)
+        with span('log_decision'):
+            log_decision(data, balance, strategy, result)
     except Exception as e:
         # Loguj błąd do input_text żeby zobaczyć co jest nie tak
         hass.services.call('input_text', 'set_value', {
             'entity_id': 'input_text.event_log_1',
-            'value': '{"ts":"","lvl":"ERROR","cat":"DEBUG","msg":"log_decision error: ' + str(e)[:100].replace('"', "'") + '"}'
+            'value': json.dumps({'ts': '', 'lvl': 'ERROR', 'cat': 'DEBUG', 'msg': 'log_decision error: ' + str(e)[:100]}, ensure_ascii=False)
         })
-    return result
+    return {'data': data, 'balance': balance, 'strategy': strategy, 'result': result}
 
 
 # ============================================
@@ -225,6 +251,12 @@ def collect_input_data():
             'forecast_today': float(get_state('sensor.prognoza_pv_dzisiaj') or 0),
             'forecast_tomorrow': float(get_state('sensor.prognoza_pv_jutro') or 0),
             'forecast_6h': float(get_state('sensor.prognoza_pv_6h') or 0),
+            # Skorygowana prognoza godzinowa (24 x kWh) z pv_calibration, None gdy brak
+            'pv_hourly_today': get_pv_hourly('today'),
+            'pv_hourly_tomorrow': get_pv_hourly('tomorrow'),
+            # Okno godzin słonecznych z efemerydy (solar_ephemeris, czas lokalny), None gdy brak
+            'sun_window_today': get_sun_window('today'),
+            'sun_window_tomorrow': get_sun_window('tomorrow'),
 
             # Temperatura i PC
             'temp_outdoor': float(get_state('sensor.temperatura_zewnetrzna') or 10),
@@ -328,21 +360,11 @@ def decide_strategy(data, balance):
     workday_state = hass.states.get('binary_sensor.dzien_roboczy')
     is_workday = workday_state and workday_state.state == 'on'
 
-    # Oblicz dzień tygodnia bez importu datetime (algorytm Tomohiko Sakamoto)
+    # Dzień tygodnia z sensor.date: 0=pon, 4=pt, 5=sob, 6=ndz
     date_sensor = hass.states.get('sensor.date')
-    today_str = date_sensor.state if date_sensor else ''
-    if today_str and len(today_str) >= 10:
-        y = int(today_str[0:4])
-        m = int(today_str[5:7])
-        d = int(today_str[8:10])
-        # Algorytm: zwraca 0=niedziela, 1=pon, ... 5=pt, 6=sob
-        t = [0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4]
-        if m < 3:
-            y = y - 1
-        dow = (y + y//4 - y//100 + y//400 + t[m-1] + d) % 7
-        # Konwersja na format Python: 0=pon, 4=pt, 5=sob, 6=ndz
-        weekday = (dow + 6) % 7
-    else:
+    try:
+        weekday = date.fromisoformat(date_sensor.state[:10]).weekday()
+    except (AttributeError, ValueError):
         weekday = 0  # Fallback na poniedziałek
 
     is_friday_evening = (weekday == 4 and hour >= 22)   # Piątek 22:00+ = START weekendu
@@ -554,6 +576,98 @@ def decide_strategy(data, balance):
         }
 
 
+def get_tomorrow_str(today_str):
+    """Jutrzejsza data 'YYYY-MM-DD' dla daty z sensor.date."""
+    return (date.fromisoformat(today_str[:10]) + timedelta(days=1)).isoformat()
+
+
+def get_pv_hourly(day_key):
+    """
+    Skorygowana prognoza PV per godzina (24 wartości kWh, indeks = godzina).
+    Suma płaszczyzn wschód/południe/zachód z sensor.pv_prognoza_skorygowana
+    (pv_calibration, odświeżana razem z REST Forecast.Solar co 2h).
+    day_key: 'today' lub 'tomorrow'. Returns: list lub None gdy brak danych.
+    """
+    state = hass.states.get('sensor.pv_prognoza_skorygowana')
+    if not state or state.state in ['unavailable', 'unknown']:
+        return None
+    values = state.attributes.get(day_key)
+    if not values or len(values) != 24:
+        return None
+    try:
+        return [float(v) for v in values]
+    except (TypeError, ValueError):
+        return None
+
+
+def get_sun_window(day_key):
+    """
+    Godziny słoneczne dnia z sensor.efemeryda_slonca (solar_ephemeris):
+    (pierwsza godzina, ostatnia godzina + 1), czas lokalny.
+    Tabela wschodów/zachodów dla lokalizacji liczona raz przy starcie HA.
+    day_key: 'today' lub 'tomorrow'. Returns: tuple lub None gdy brak danych.
+    """
+    state = hass.states.get('sensor.efemeryda_slonca')
+    if not state or state.state in ['unavailable', 'unknown']:
+        return None
+    window = state.attributes.get(day_key + '_window')
+    if not window or len(window) != 2:
+        return None
+    try:
+        return int(window[0]), int(window[1])
+    except (TypeError, ValueError):
+        return None
+
+
+def get_seasonal_sun_window(month):
+    """
+    Przybliżone godziny słoneczne per sezon - tylko gdy efemeryda niedostępna
+    (np. zaraz po starcie HA). Returns: (wschód, zachód).
+    """
+    if month in [11, 12, 1, 2]:  # Zima
+        return 7, 16
+    elif month in [3, 4]:  # Wiosna
+        return 6, 18
+    elif month in [5, 6, 7, 8]:  # Lato
+        return 5, 20
+    else:  # Jesień
+        return 6, 17
+
+
+def get_pv_sun_window(pv_hourly):
+    """
+    Okno produkcji PV z prognozy godzinowej: (pierwsza godzina, ostatnia godzina + 1).
+    Returns: tuple lub None gdy brak prognozy / brak produkcji.
+    """
+    if not pv_hourly:
+        return None
+    sun_hours = [h for h in range(24) if pv_hourly[h] >= PV_HOUR_MIN_KWH]
+    if not sun_hours:
+        return None
+    return sun_hours[0], sun_hours[-1] + 1
+
+
+def pick_storage_hours(sun_prices_sorted, energy_to_store, pv_hourly, hours_needed):
+    """
+    Wybiera najtańsze godziny do magazynowania.
+
+    Z prognozą godzinową: dokłada godziny od najtańszej, aż ich prognozowana
+    produkcja pokryje energię do zmagazynowania (tania godzina o 7:00 z 0.2 kWh
+    znaczy mniej niż tania godzina w południe).
+    Bez prognozy: hours_needed najtańszych godzin (średnia produkcja na godzinę).
+    """
+    if not pv_hourly:
+        return [p['hour'] for p in sun_prices_sorted[:hours_needed]]
+    hours = []
+    stored = 0
+    for p in sun_prices_sorted:
+        hours.append(p['hour'])
+        stored = stored + pv_hourly[p['hour']]
+        if stored >= energy_to_store:
+            break
+    return hours
+
+
 def get_first_cheap_pv_hour(data):
     """
     Zwraca najwcześniejszą z najtańszych godzin RCE na jutro (do planowania nocnego ładowania).
@@ -565,19 +679,16 @@ def get_first_cheap_pv_hour(data):
         soc_max = data['soc_max']
         month = data.get('month', 3)
 
-        # Czasy słoneczne (te same co w calculate_cheapest_hours_to_store)
-        if month in [11, 12, 1, 2]:
-            sunrise_hour = 7
-            sunset_hour = 16
-        elif month in [3, 4]:
-            sunrise_hour = 6
-            sunset_hour = 18
-        elif month in [5, 6, 7, 8]:
-            sunrise_hour = 5
-            sunset_hour = 20
+        # Godziny słoneczne jutro z efemerydy
+        sunrise_hour, sunset_hour = data.get('sun_window_tomorrow') or get_seasonal_sun_window(month)
+
+        # Prognoza godzinowa na jutro: okno słoneczne i produkcja per godzina
+        pv_hourly = data.get('pv_hourly_tomorrow')
+        pv_window = get_pv_sun_window(pv_hourly)
+        if pv_window:
+            sunrise_hour, sunset_hour = pv_window
         else:
-            sunrise_hour = 6
-            sunset_hour = 17
+            pv_hourly = None
 
         sun_hours = sunset_hour - sunrise_hour
         battery_capacity = 15  # kWh
@@ -602,23 +713,9 @@ def get_first_cheap_pv_hour(data):
         if not all_prices:
             return None
 
-        # Oblicz jutrzejszą datę
+        # Jutrzejsza data
         date_state = hass.states.get('sensor.date')
-        today_str = date_state.state if date_state else "2026-01-01"
-        year = int(today_str[0:4])
-        month_num = int(today_str[5:7])
-        day_num = int(today_str[8:10])
-        days_in_month = [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-        if (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0):
-            days_in_month[2] = 29
-        day_num = day_num + 1
-        if day_num > days_in_month[month_num]:
-            day_num = 1
-            month_num = month_num + 1
-            if month_num > 12:
-                month_num = 1
-                year = year + 1
-        tomorrow_str = f"{year:04d}-{month_num:02d}-{day_num:02d}"
+        tomorrow_str = get_tomorrow_str(date_state.state if date_state else "2026-01-01")
 
         # Zbierz średnie ceny per godzina (godziny słoneczne jutro)
         hourly_sums = {}
@@ -653,9 +750,9 @@ def get_first_cheap_pv_hour(data):
         for h in hourly_sums:
             sun_prices.append({'hour': h, 'price': hourly_sums[h] / hourly_counts[h]})
 
-        # Sortuj po cenie, wybierz N najtańszych
+        # Sortuj po cenie, wybierz najtańsze pokrywające energię do zmagazynowania
         sun_prices_sorted = sorted(sun_prices, key=lambda x: x['price'])
-        cheapest_hours = [p['hour'] for p in sun_prices_sorted[:hours_needed]]
+        cheapest_hours = pick_storage_hours(sun_prices_sorted, energy_to_store, pv_hourly, hours_needed)
 
         # Zwróć najwcześniejszą z najtańszych
         return min(cheapest_hours)
@@ -690,27 +787,17 @@ def calculate_cheapest_hours_to_store(data):
         # Zapamiętaj czy bateria naładowana (użyjemy później)
         battery_already_charged = energy_to_store <= 0.5
 
-        # 2. Ile godzin słonecznych zostało? (użyj rzeczywistych czasów wschodu/zachodu)
-        # UWAGA: sun.sun zwraca czasy UTC! W Polsce (CET/CEST) trzeba dodać 1-2h
-        # Dla uproszczenia używamy stałych sezonowych dla Polski:
-        # - Listopad-Luty: wschód ~7:00, zachód ~15:30-16:30
-        # - Marzec-Kwiecień: wschód ~6:00, zachód ~18:00-19:00
-        # - Maj-Sierpień: wschód ~5:00, zachód ~20:00-21:00
-        # - Wrzesień-Październik: wschód ~6:30, zachód ~17:00-18:00
+        # 2. Ile godzin słonecznych zostało? (efemeryda dla lokalizacji, czas lokalny)
         month = data.get('month', 11)
+        sunrise_hour, sunset_hour = data.get('sun_window_today') or get_seasonal_sun_window(month)
 
-        if month in [11, 12, 1, 2]:  # Zima
-            sunrise_hour = 7
-            sunset_hour = 16  # bezpieczny margines (faktycznie 15:30-16:30)
-        elif month in [3, 4]:  # Wiosna
-            sunrise_hour = 6
-            sunset_hour = 18
-        elif month in [5, 6, 7, 8]:  # Lato
-            sunrise_hour = 5
-            sunset_hour = 20
-        else:  # month in [9, 10] - Jesień
-            sunrise_hour = 6
-            sunset_hour = 17
+        # Prognoza godzinowa (pv_calibration) wyznacza okno słoneczne dokładniej niż tabela
+        pv_hourly = data.get('pv_hourly_today')
+        pv_window = get_pv_sun_window(pv_hourly)
+        if pv_window:
+            sunrise_hour, sunset_hour = pv_window
+        else:
+            pv_hourly = None
 
         # Oblicz ile godzin słonecznych zostało
         if hour < sunrise_hour:
@@ -739,27 +826,21 @@ def calculate_cheapest_hours_to_store(data):
         date_state = hass.states.get('sensor.date')
         today_str = date_state.state if date_state else "2025-01-07"
 
-        # Oblicz jutrzejszą datę
-        year = int(today_str[0:4])
-        month_num = int(today_str[5:7])
-        day_num = int(today_str[8:10])
-        days_in_month = [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-        if (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0):
-            days_in_month[2] = 29
-        day_num += 1
-        if day_num > days_in_month[month_num]:
-            day_num = 1
-            month_num += 1
-            if month_num > 12:
-                month_num = 1
-                year += 1
-        tomorrow_str = f"{year:04d}-{month_num:02d}-{day_num:02d}"
+        tomorrow_str = get_tomorrow_str(today_str)
 
         # Po zachodzie słońca → używaj danych na jutro
         if hour >= sunset_hour:
             target_date = tomorrow_str
             day_label = "Jutro"
             rce_sensor_name = 'sensor.rce_pse_cena_jutro'
+            # Okno i produkcja jutra z efemerydy i prognozy godzinowej na jutro
+            sunrise_hour, sunset_hour = data.get('sun_window_tomorrow') or get_seasonal_sun_window(month)
+            pv_hourly = data.get('pv_hourly_tomorrow')
+            pv_window = get_pv_sun_window(pv_hourly)
+            if pv_window:
+                sunrise_hour, sunset_hour = pv_window
+            else:
+                pv_hourly = None
         else:
             target_date = today_str
             day_label = "Dziś"
@@ -835,7 +916,6 @@ def calculate_cheapest_hours_to_store(data):
                 # Tylko target_date (dziś lub jutro) + godziny słoneczne (sunrise <= hour < sunset)
                 if date_part == target_date and sunrise_hour <= price_hour < sunset_hour:
                     # Agreguj ceny per godzina
-                    # UWAGA: RestrictedPython nie pozwala na += dla dict items!
                     if price_hour not in hourly_prices_sum:
                         hourly_prices_sum[price_hour] = 0
                         hourly_prices_count[price_hour] = 0
@@ -870,8 +950,9 @@ def calculate_cheapest_hours_to_store(data):
         # 5. Sortuj godziny po średniej cenie (rosnąco - najtańsze pierwsze)
         sun_prices_sorted = sorted(sun_prices, key=lambda x: x['price'])
 
-        # 6. Wybierz N najtańszych UNIKALNYCH godzin
-        cheapest_hours = [p['hour'] for p in sun_prices_sorted[:hours_needed]]
+        # 6. Wybierz najtańsze godziny: z prognozą godzinową tyle, ile pokrywa energię do zmagazynowania
+        cheapest_hours = pick_storage_hours(sun_prices_sorted, energy_to_store, pv_hourly, hours_needed)
+        hours_needed = len(cheapest_hours)
 
         # 7. Czy aktualna godzina jest w najtańszych?
         is_cheap_hour = hour in cheapest_hours
@@ -1577,12 +1658,8 @@ def log_decision(data, balance, strategy, result):
     - SAFETY: Alarm bezpieczeństwa
     - ERROR: Błąd systemu
     """
-    # UWAGA: W python_scripts HA nie można używać import!
-    # Używamy wbudowanych funkcji
-
     # Określ poziom i kategorię na podstawie wyniku
     # UWAGA: result to True/False, strategy to słownik!
-    # Używamy try/except bo isinstance() nie działa w python_scripts
     try:
         reason = str(strategy.get('reason', '') or '')
         mode = str(strategy.get('mode', 'unknown') or 'unknown')
@@ -1618,21 +1695,19 @@ def log_decision(data, balance, strategy, result):
 
     # Skróć wiadomość do 150 znaków (żeby zmieścić się w JSON w 255 znakach)
     msg = reason[:150] if reason else f"Mode: {mode}"
-    # Escapuj cudzysłowy w wiadomości
+    # Cudzysłowy zamieniane na apostrofy - escapowanie wydłużyłoby wpis
     msg = msg.replace('"', "'")
 
-    # Utwórz event JSON ręcznie (bez import json)
-    # Pobierz czas z sensora HA zamiast datetime
+    # Czas z sensorów HA (strefa HA), bez nich czas systemowy
     time_state = hass.states.get('sensor.time')
     date_state = hass.states.get('sensor.date')
     if time_state and date_state:
         timestamp = date_state.state + 'T' + time_state.state + ':00'
     else:
-        timestamp = '2025-01-01T00:00:00'
-    event_json = '{"ts":"' + timestamp + '","lvl":"' + level + '","cat":"' + category + '","msg":"' + msg + '"}'
+        timestamp = datetime.now().isoformat(timespec='seconds')
+    event_json = json.dumps({'ts': timestamp, 'lvl': level, 'cat': category, 'msg': msg}, ensure_ascii=False, separators=(',', ':'))
 
     # Rotacja: przesuń wszystkie sloty (5 -> usuń, 4->5, 3->4, 2->3, 1->2, new->1)
-    # Odczytaj obecne wartości - bez range() bo może nie być dostępne
     slot1 = hass.states.get('input_text.event_log_1')
     slot2 = hass.states.get('input_text.event_log_2')
     slot3 = hass.states.get('input_text.event_log_3')
@@ -1688,25 +1763,35 @@ def log_decision(data, balance, strategy, result):
 # URUCHOMIENIE
 # ============================================
 
-try:
-    execute_strategy()
-except Exception as e:
-    # ZAWSZE aktualizuj decision_reason - nawet przy błędzie!
-    # To zapobiega alertom watchdoga gdy algorytm się wysypie
-    error_msg = f"🚨 BŁĄD ALGORYTMU: {str(e)[:200]}"
+def run():
+    """
+    Jeden przebieg algorytmu. Przy błędzie ustawia bezpieczny tryb awaryjny.
+    Returns: plan (dict: data, balance, strategy, result) lub opis błędu.
+    """
     try:
-        hass.services.call('input_text', 'set_value', {
-            'entity_id': 'input_text.battery_decision_reason',
-            'value': error_msg
-        })
-        # Ustaw tryb awaryjny - bezpieczny fallback
-        hass.services.call('select', 'select_option', {
-            'entity_id': 'select.akumulatory_tryb_pracy',
-            'option': 'maximise_self_consumption'
-        })
-        # Wyłącz ładowanie z sieci (bezpieczeństwo)
-        hass.services.call('switch', 'turn_off', {
-            'entity_id': 'switch.akumulatory_ladowanie_z_sieci'
-        })
-    except:
-        pass  # Jeśli nawet to nie działa, nie możemy nic zrobić
+        return execute_strategy()
+    except Exception as e:
+        # ZAWSZE aktualizuj decision_reason - nawet przy błędzie!
+        # To zapobiega alertom watchdoga gdy algorytm się wysypie
+        error_msg = f"🚨 BŁĄD ALGORYTMU: {str(e)[:200]}"
+        try:
+            hass.services.call('input_text', 'set_value', {
+                'entity_id': 'input_text.battery_decision_reason',
+                'value': error_msg
+            })
+            # Ustaw tryb awaryjny - bezpieczny fallback
+            hass.services.call('select', 'select_option', {
+                'entity_id': 'select.akumulatory_tryb_pracy',
+                'option': 'maximise_self_consumption'
+            })
+            # Wyłącz ładowanie z sieci (bezpieczeństwo)
+            hass.services.call('switch', 'turn_off', {
+                'entity_id': 'switch.akumulatory_ladowanie_z_sieci'
+            })
+        except Exception:
+            pass  # Jeśli nawet to nie działa, nie możemy nic zrobić
+        return {
+            'strategy': {'mode': 'error', 'priority': 'critical', 'reason': error_msg},
+            'result': False,
+            'error': repr(e),
+        }
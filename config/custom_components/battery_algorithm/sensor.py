@@ -0,0 +1,103 @@
+"""Diagnostic sensors: run timing and the shadow candidate's A/B comparison."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from .const import DOMAIN, RUN_BUDGET_MS, SIGNAL_SHADOW_UPDATED, SIGNAL_TIMING_UPDATED
+from .coordinator import BatteryAlgorithmCoordinator
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the timing sensor, and the shadow sensor when a candidate is loaded."""
+    if discovery_info is None:
+        return
+    coordinator: BatteryAlgorithmCoordinator = hass.data[DOMAIN]
+    entities: list[SensorEntity] = [RunTimingSensor(coordinator)]
+    if coordinator.candidate is not None:
+        entities.append(ShadowComparisonSensor(coordinator))
+    async_add_entities(entities)
+
+
+class RunTimingSensor(SensorEntity):
+    """Wall time of the last run, with p50/p95 of every phase over the recent runs."""
+
+    _attr_name = "Bateria czas algorytmu"
+    _attr_unique_id = f"{DOMAIN}_run_time"
+    _attr_icon = "mdi:timer-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"last"})
+
+    def __init__(self, coordinator: BatteryAlgorithmCoordinator):
+        self._coordinator = coordinator
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_TIMING_UPDATED, self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        last = self._coordinator.last_timing
+        return last["total_ms"] if last else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        timings = self._coordinator.timings
+        return {
+            **timings.summary(),
+            "budget_ms": RUN_BUDGET_MS,
+            "slow_runs": timings.slow_runs(RUN_BUDGET_MS),
+            "last": self._coordinator.last_timing,
+        }
+
+
+class ShadowComparisonSensor(SensorEntity):
+    """Projected cost of the candidate minus the live strategy, summed over the kept days."""
+
+    _attr_name = "Bateria shadow różnica kosztu"
+    _attr_unique_id = f"{DOMAIN}_shadow_difference"
+    _attr_icon = "mdi:scale-balance"
+    _attr_native_unit_of_measurement = "PLN"
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"daily", "recent"})
+
+    def __init__(self, coordinator: BatteryAlgorithmCoordinator):
+        self._coordinator = coordinator
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_SHADOW_UPDATED, self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> float:
+        return self._coordinator.shadow_stats.totals()["difference"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        totals = self._coordinator.shadow_stats.totals()
+        history = self._coordinator.shadow_history
+        last = history[0] if history else {}
+        return {
+            **{key: value for key, value in totals.items() if key != "difference"},
+            "last_live_mode": last.get("live", {}).get("mode"),
+            "last_candidate_mode": last.get("candidate", {}).get("mode"),
+            "last_duration_ms": last.get("duration_ms"),
+            "daily": self._coordinator.shadow_stats.days,
+            "recent": list(history)[:10],
+        }
@@ -0,0 +1,111 @@
+"""Projected cost of a strategy and the running A/B comparison of shadow runs."""
+from typing import Any
+
+# Prices as used by the engine: G12w import (brutto) and RCE x 1.23 for export
+IMPORT_PRICE = {"L1": 1.16, "L2": 0.78}
+EXPORT_FACTOR = 1.23
+# Energy left in (or taken from) the battery is valued at the cheap import price
+STORED_ENERGY_VALUE = IMPORT_PRICE["L2"]
+
+BATTERY_CAPACITY_KWH = 15.0
+BATTERY_POWER_KW = 5.0
+
+HISTORY_DAYS = 60
+
+
+def battery_power(strategy: dict, data: dict, balance: dict) -> float:
+    """kW into (+) or out of (-) the battery over the next hour for a strategy."""
+    mode = strategy.get("mode")
+    surplus, deficit = balance.get("surplus", 0.0), balance.get("deficit", 0.0)
+    if mode == "charge_from_grid":
+        power = BATTERY_POWER_KW
+    elif mode == "charge_from_pv":
+        power = min(surplus, BATTERY_POWER_KW)
+    elif mode == "discharge_to_home":
+        power = -min(deficit, BATTERY_POWER_KW)
+    elif mode == "discharge_to_grid":
+        power = -BATTERY_POWER_KW
+    elif mode == "idle":
+        # Self-consumption: surplus into the battery, deficit out of it
+        power = min(surplus, BATTERY_POWER_KW) if surplus > 0 else -min(deficit, BATTERY_POWER_KW)
+    else:  # grid_to_home, stop_charging, error
+        power = 0.0
+
+    soc = data.get("soc", 50.0)
+    if power > 0:
+        room = max(data.get("soc_max", 100) - soc, 0) / 100 * BATTERY_CAPACITY_KWH
+        return min(power, room)
+    available = max(soc - data.get("soc_min", 0), 0) / 100 * BATTERY_CAPACITY_KWH
+    return max(power, -available)
+
+
+def project_hour_cost(strategy: dict, data: dict, balance: dict) -> dict[str, float]:
+    """Cash flow of the next hour under a strategy, with the battery change valued.
+
+    Grid energy = load - PV + battery charge, for one hour at the current
+    power. Import is paid at the G12w zone price, export earns RCE x 1.23,
+    and the energy added to the battery is credited at STORED_ENERGY_VALUE.
+    """
+    battery = battery_power(strategy, data, balance)
+    grid = balance.get("load", 0.0) - balance.get("pv", 0.0) + battery
+    if grid > 0:
+        cash = grid * IMPORT_PRICE.get(data.get("tariff_zone"), IMPORT_PRICE["L1"])
+    else:
+        cash = grid * data.get("rce_now", 0.0) * EXPORT_FACTOR
+    return {
+        "battery_kwh": round(battery, 3),
+        "grid_kwh": round(grid, 3),
+        "cost": round(cash - battery * STORED_ENERGY_VALUE, 4),
+    }
+
+
+class ShadowStats:
+    """Running comparison of the live and the candidate strategy, per day.
+
+    Stored as plain dicts so it can go straight into a Store.
+    """
+
+    def __init__(self):
+        self.days: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def from_dict(cls, data: dict | None) -> "ShadowStats":
+        stats = cls()
+        for day, values in ((data or {}).get("days") or {}).items():
+            try:
+                stats.days[day] = {
+                    "runs": int(values["runs"]),
+                    "disagreements": int(values["disagreements"]),
+                    "live_cost": float(values["live_cost"]),
+                    "candidate_cost": float(values["candidate_cost"]),
+                }
+            except (KeyError, TypeError, ValueError):
+                continue
+        return stats
+
+    def as_dict(self) -> dict:
+        return {"days": self.days}
+
+    def add(self, day: str, live: dict, candidate: dict) -> None:
+        """Record one evaluation: projected costs and whether the modes differ."""
+        entry = self.days.setdefault(day, {"runs": 0, "disagreements": 0, "live_cost": 0.0, "candidate_cost": 0.0})
+        entry["runs"] += 1
+        entry["disagreements"] += live["mode"] != candidate["mode"]
+        entry["live_cost"] = round(entry["live_cost"] + live["cost"], 4)
+        entry["candidate_cost"] = round(entry["candidate_cost"] + candidate["cost"], 4)
+        for old in sorted(self.days)[:-HISTORY_DAYS]:
+            del self.days[old]
+
+    def totals(self) -> dict[str, Any]:
+        """Sums over all kept days; difference < 0 means the candidate is cheaper."""
+        runs = sum(entry["runs"] for entry in self.days.values())
+        live = sum(entry["live_cost"] for entry in self.days.values())
+        candidate = sum(entry["candidate_cost"] for entry in self.days.values())
+        return {
+            "days": len(self.days),
+            "runs": runs,
+            "disagreements": sum(entry["disagreements"] for entry in self.days.values()),
+            "live_cost": round(live, 2),
+            "candidate_cost": round(candidate, 2),
+            "difference": round(candidate - live, 2),
+        }
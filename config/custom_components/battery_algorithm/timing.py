@@ -0,0 +1,72 @@
+"""Span timing of one engine pass and rolling percentiles over recent runs."""
+from collections import deque
+from contextlib import contextmanager
+import time
+from typing import Any, Iterator
+
+WINDOW = 100
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    """q-th percentile (0-100) with linear interpolation between the closest ranks."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class SpanTimer:
+    """Wall time and count per named span; spans with the same name add up."""
+
+    def __init__(self):
+        self.spans: dict[str, dict[str, float]] = {}
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name: str, seconds: float) -> None:
+        entry = self.spans.setdefault(name, {"ms": 0.0, "count": 0})
+        entry["ms"] += seconds * 1000
+        entry["count"] += 1
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        return {
+            name: {"ms": round(entry["ms"], 2), "count": entry["count"]}
+            for name, entry in self.spans.items()
+        }
+
+
+class RunTimings:
+    """The last WINDOW runs as flat samples: total_ms plus <span>_ms and <span>_count."""
+
+    def __init__(self, size: int = WINDOW):
+        self.runs: deque[dict[str, float]] = deque(maxlen=size)
+
+    def add(self, total_ms: float, spans: dict[str, dict[str, float]]) -> dict[str, float]:
+        sample = {"total_ms": round(total_ms, 2)}
+        for name, entry in spans.items():
+            sample[f"{name}_ms"] = entry["ms"]
+            sample[f"{name}_count"] = entry["count"]
+        self.runs.append(sample)
+        return sample
+
+    def slow_runs(self, budget_ms: float) -> int:
+        return sum(run["total_ms"] > budget_ms for run in self.runs)
+
+    def summary(self) -> dict[str, Any]:
+        """p50 and p95 of every key; a run without a span counts as 0 for it."""
+        keys = sorted({key for run in self.runs for key in run})
+        result: dict[str, Any] = {"runs": len(self.runs)}
+        for key in keys:
+            values = [run.get(key, 0) for run in self.runs]
+            result[f"{key}_p50"] = round(percentile(values, 50), 2)
+            result[f"{key}_p95"] = round(percentile(values, 95), 2)
+        return result
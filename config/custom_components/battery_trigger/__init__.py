@@ -0,0 +1,35 @@
+"""Debounced, event-driven triggering of the battery algorithm."""
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.typing import ConfigType
+
+from .const import ATTR_FORCE, ATTR_REASON, DOMAIN, SERVICE_REQUEST
+from .coordinator import BatteryTriggerCoordinator
+
+CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
+
+REQUEST_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_REASON): cv.string,
+        vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+    }
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the request service and the status sensor."""
+    coordinator = BatteryTriggerCoordinator(hass)
+    hass.data[DOMAIN] = coordinator
+
+    async def _async_request(call: ServiceCall) -> None:
+        coordinator.async_request(call.data[ATTR_REASON], call.data[ATTR_FORCE])
+
+    hass.services.async_register(DOMAIN, SERVICE_REQUEST, _async_request, schema=REQUEST_SCHEMA)
+    hass.async_create_task(async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config))
+    return True
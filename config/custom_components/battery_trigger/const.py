@@ -0,0 +1,28 @@
+"""Constants for the Battery Algorithm Trigger integration."""
+
+DOMAIN = "battery_trigger"
+
+SERVICE_REQUEST = "request"
+ATTR_REASON = "reason"
+ATTR_FORCE = "force"
+
+# The algorithm being triggered
+ALGORITHM_DOMAIN = "battery_algorithm"
+ALGORITHM_SERVICE = "run"
+
+# Requests within DEBOUNCE_SECONDS are merged; runs are at least MIN_INTERVAL_SECONDS apart
+DEBOUNCE_SECONDS = 5
+MIN_INTERVAL_SECONDS = 30
+
+# Inputs compared to decide whether a run that is not forced is worth it
+SENSOR_SOC = "sensor.akumulatory_stan_pojemnosci"
+SENSOR_PRICE = "sensor.rce_pse_cena"
+SENSOR_THRESHOLDS = "sensor.rce_progi_cenowe"
+SENSOR_TARIFF_ZONE = "sensor.strefa_taryfowa"
+SOC_DELTA = 2.0
+# A run that is not forced is never skipped if the last run is older than this
+MAX_SKIP_AGE_SECONDS = 2 * 3600
+
+HISTORY_SIZE = 20
+
+SIGNAL_TRIGGER_UPDATED = f"{DOMAIN}_updated"
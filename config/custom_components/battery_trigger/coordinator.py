@@ -0,0 +1,119 @@
+"""Runs the battery algorithm for merged, debounced trigger requests."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from datetime import datetime
+import logging
+import time
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ALGORITHM_DOMAIN,
+    ALGORITHM_SERVICE,
+    DEBOUNCE_SECONDS,
+    HISTORY_SIZE,
+    MAX_SKIP_AGE_SECONDS,
+    MIN_INTERVAL_SECONDS,
+    SENSOR_PRICE,
+    SENSOR_SOC,
+    SENSOR_TARIFF_ZONE,
+    SENSOR_THRESHOLDS,
+    SIGNAL_TRIGGER_UPDATED,
+    SOC_DELTA,
+)
+from .run_queue import RunQueue, price_bucket, snapshot_changes
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BatteryTriggerCoordinator:
+    """Single entry point for everything that wants the algorithm to run.
+
+    Requests are merged for DEBOUNCE_SECONDS and runs are spaced at least
+    MIN_INTERVAL_SECONDS apart. A run nobody forced (the hourly tick) is
+    skipped when SOC, price bucket, tariff zone and local hour are the same
+    as at the last run. Every decision is kept in ``history`` with its reasons.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self.queue = RunQueue(DEBOUNCE_SECONDS, MIN_INTERVAL_SECONDS)
+        self.history: deque[dict] = deque(maxlen=HISTORY_SIZE)
+        self.runs = 0
+        self.skipped = 0
+        self._snapshot: dict | None = None
+        self._lock = asyncio.Lock()
+
+    def _number(self, entity_id: str) -> float | None:
+        state = self.hass.states.get(entity_id)
+        if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            return None
+        try:
+            return float(state.state)
+        except ValueError:
+            return None
+
+    def _current_snapshot(self) -> dict:
+        price = self._number(SENSOR_PRICE)
+        thresholds = self.hass.states.get(SENSOR_THRESHOLDS)
+        attributes = thresholds.attributes if thresholds is not None else {}
+        zone = self.hass.states.get(SENSOR_TARIFF_ZONE)
+        return {
+            "soc": self._number(SENSOR_SOC),
+            "price_bucket": price_bucket(
+                price / 1000 if price is not None else None, attributes.get("p33"), attributes.get("p66")
+            ),
+            "tariff_zone": zone.state if zone is not None else None,
+            "hour": dt_util.now().hour,
+        }
+
+    @callback
+    def async_request(self, reason: str, force: bool = False) -> None:
+        """Ask for a run; merged with other requests that arrive before it starts."""
+        delay = self.queue.add(reason, force, time.monotonic())
+        _LOGGER.debug("Run requested: %s%s", reason, " (forced)" if force else "")
+        if delay is not None:
+            async_call_later(self.hass, delay, self._async_due)
+        async_dispatcher_send(self.hass, SIGNAL_TRIGGER_UPDATED)
+
+    async def _async_due(self, _now: datetime) -> None:
+        async with self._lock:
+            reasons, forced = self.queue.take()
+            if not reasons:
+                return
+            snapshot = self._current_snapshot()
+            changes = snapshot_changes(self._snapshot, snapshot, SOC_DELTA)
+            stale = self.queue.last_run is None or time.monotonic() - self.queue.last_run >= MAX_SKIP_AGE_SECONDS
+            entry = {
+                "time": dt_util.now().isoformat(timespec="seconds"),
+                "reasons": reasons,
+                "changes": changes,
+                "snapshot": snapshot,
+            }
+
+            if not forced and not changes and not stale:
+                entry["action"] = "skipped"
+                self.skipped += 1
+                _LOGGER.debug("Run for %s skipped, inputs unchanged: %s", reasons, snapshot)
+            else:
+                entry["action"] = "run"
+                try:
+                    await self.hass.services.async_call(ALGORITHM_DOMAIN, ALGORITHM_SERVICE, blocking=True)
+                except HomeAssistantError as err:
+                    entry["action"] = "failed"
+                    _LOGGER.error("Battery algorithm failed (%s): %s", ", ".join(reasons), err)
+                else:
+                    self._snapshot = snapshot
+                    self.runs += 1
+                self.queue.mark_run(time.monotonic())
+                _LOGGER.debug("Battery algorithm run for %s, changed: %s", reasons, changes)
+
+            self.history.appendleft(entry)
+        async_dispatcher_send(self.hass, SIGNAL_TRIGGER_UPDATED)
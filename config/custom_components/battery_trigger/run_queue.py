@@ -0,0 +1,70 @@
+"""Debounced run queue and input snapshots for the battery algorithm."""
+# The local hour is part of the snapshot: the algorithm picks storage hours, so
+# whether to store or sell can change at every hour boundary
+SNAPSHOT_KEYS = ("soc", "price_bucket", "tariff_zone", "hour")
+
+
+def price_bucket(price: float | None, p33: float | None, p66: float | None) -> str | None:
+    """Colour bucket of a PLN/kWh price against the day's thresholds."""
+    if price is None or p33 is None or p66 is None:
+        return None
+    if price < p33:
+        return "low"
+    if price < p66:
+        return "mid"
+    return "high"
+
+
+def snapshot_changes(previous: dict | None, current: dict, soc_delta: float) -> list[str]:
+    """Inputs that changed materially since ``previous``; all of them without one."""
+    if previous is None:
+        return list(SNAPSHOT_KEYS)
+    changes = []
+    soc, previous_soc = current.get("soc"), previous.get("soc")
+    if soc is None or previous_soc is None:
+        if soc != previous_soc:
+            changes.append("soc")
+    elif abs(soc - previous_soc) >= soc_delta:
+        changes.append("soc")
+    changes.extend(key for key in SNAPSHOT_KEYS[1:] if current.get(key) != previous.get(key))
+    return changes
+
+
+class RunQueue:
+    """Merges run requests into debounced runs with a minimum spacing.
+
+    Times are monotonic seconds. add() returns the delay after which the
+    caller should call take(), or None when a run is already scheduled.
+    """
+
+    def __init__(self, debounce: float, min_interval: float):
+        self.debounce = debounce
+        self.min_interval = min_interval
+        self.last_run: float | None = None
+        self._reasons: dict[str, bool] = {}
+        self._scheduled = False
+
+    @property
+    def pending(self) -> list[str]:
+        return list(self._reasons)
+
+    def add(self, reason: str, force: bool, now: float) -> float | None:
+        """Queue a request; the delay until the merged run if one must be scheduled."""
+        self._reasons[reason] = self._reasons.get(reason, False) or force
+        if self._scheduled:
+            return None
+        self._scheduled = True
+        delay = self.debounce
+        if self.last_run is not None:
+            delay = max(delay, self.last_run + self.min_interval - now)
+        return delay
+
+    def take(self) -> tuple[list[str], bool]:
+        """Reasons of the due run and whether any of them was forced; empties the queue."""
+        reasons, forced = list(self._reasons), any(self._reasons.values())
+        self._reasons = {}
+        self._scheduled = False
+        return reasons, forced
+
+    def mark_run(self, now: float) -> None:
+        self.last_run = now
@@ -0,0 +1,64 @@
+"""Sensor with the last battery algorithm trigger decision."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from .const import DOMAIN, SIGNAL_TRIGGER_UPDATED
+from .coordinator import BatteryTriggerCoordinator
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the trigger sensor."""
+    if discovery_info is None:
+        return
+    async_add_entities([BatteryTriggerSensor(hass.data[DOMAIN])])
+
+
+class BatteryTriggerSensor(SensorEntity):
+    """Last decision (run / skipped / failed), with its reasons and recent history."""
+
+    _attr_name = "Bateria wyzwalacz algorytmu"
+    _attr_unique_id = f"{DOMAIN}_last"
+    _attr_icon = "mdi:timer-play-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"history"})
+
+    def __init__(self, coordinator: BatteryTriggerCoordinator):
+        self._coordinator = coordinator
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_TRIGGER_UPDATED, self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> str | None:
+        history = self._coordinator.history
+        return history[0]["action"] if history else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        history = self._coordinator.history
+        last = history[0] if history else {}
+        return {
+            "last_time": last.get("time"),
+            "last_reasons": last.get("reasons"),
+            "last_changes": last.get("changes"),
+            "pending": self._coordinator.queue.pending,
+            "runs": self._coordinator.runs,
+            "skipped": self._coordinator.skipped,
+            "history": list(history),
+        }
@@ -0,0 +1,132 @@
+"""Hourly energy snapshots for the ML scripts, recorded in-process."""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+import os
+
+import voluptuous as vol
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_LEGACY_CSV,
+    CONF_PATH,
+    DEFAULT_LEGACY_CSV,
+    DEFAULT_PATH,
+    DOMAIN,
+    SENSOR_BATTERY_CHARGE,
+    SENSOR_BATTERY_DISCHARGE,
+    SENSOR_GRID_EXPORT,
+    SENSOR_GRID_IMPORT,
+    SENSOR_PV_PRODUCTION,
+    SENSOR_RCE_PRICE,
+    SENSOR_SOC,
+    SENSOR_TARIFF_ZONE,
+    SENSOR_TEMPERATURE,
+    SNAPSHOT_MINUTE,
+    SNAPSHOT_SECOND,
+)
+from .hourly_store import HourlyEnergyStore, SchemaError, StoreLockedError
+
+_LOGGER = logging.getLogger(__name__)
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Maybe(
+            vol.Schema(
+                {
+                    vol.Optional(CONF_PATH, default=DEFAULT_PATH): cv.string,
+                    vol.Optional(CONF_LEGACY_CSV, default=DEFAULT_LEGACY_CSV): cv.string,
+                }
+            )
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+def _number(hass: HomeAssistant, entity_id: str, digits: int) -> float | None:
+    state = hass.states.get(entity_id)
+    if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+        return None
+    try:
+        return round(float(state.state), digits)
+    except ValueError:
+        return None
+
+
+def _snapshot(hass: HomeAssistant) -> dict:
+    """Current values of the recorded sensors, None where a sensor has no value."""
+    grid_import = _number(hass, SENSOR_GRID_IMPORT, 3)
+    charge = _number(hass, SENSOR_BATTERY_CHARGE, 3)
+    discharge = _number(hass, SENSOR_BATTERY_DISCHARGE, 3)
+    tariff = hass.states.get(SENSOR_TARIFF_ZONE)
+
+    consumption = None
+    if grid_import is not None:
+        # House consumption: grid import without battery charging, plus battery discharge
+        consumption = round(max(grid_import - (charge or 0.0) + (discharge or 0.0), 0.0), 3)
+
+    return {
+        "consumption_kwh": consumption,
+        "grid_import_kwh": grid_import,
+        "pv_production_kwh": _number(hass, SENSOR_PV_PRODUCTION, 3),
+        "grid_export_kwh": _number(hass, SENSOR_GRID_EXPORT, 3),
+        "battery_charge_kwh": charge,
+        "battery_discharge_kwh": discharge,
+        "soc_percent": _number(hass, SENSOR_SOC, 1),
+        "tariff_zone": tariff.state if tariff and tariff.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE) else None,
+        "temperature_c": _number(hass, SENSOR_TEMPERATURE, 1),
+        "rce_price_pln_mwh": _number(hass, SENSOR_RCE_PRICE, 2),
+    }
+
+
+def _open_store(store: HourlyEnergyStore, legacy_csv: str, time_zone: str) -> int:
+    """Open the store, importing the old CSV into an empty one."""
+    store.open()
+    if len(store) == 0 and os.path.isfile(legacy_csv):
+        return store.import_csv(legacy_csv, time_zone)
+    return 0
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Open the store and snapshot the hourly meters every hour."""
+    conf = config.get(DOMAIN) or {}
+    store = HourlyEnergyStore(hass.config.path(conf.get(CONF_PATH, DEFAULT_PATH)))
+    legacy_csv = conf.get(CONF_LEGACY_CSV, DEFAULT_LEGACY_CSV)
+
+    try:
+        imported = await hass.async_add_executor_job(
+            _open_store, store, hass.config.path(legacy_csv), hass.config.time_zone
+        )
+    except (OSError, SchemaError, StoreLockedError) as err:
+        _LOGGER.error("Cannot open hourly energy store %s: %s", store.path, err)
+        return False
+    if imported:
+        _LOGGER.info("Imported %d hours from %s", imported, legacy_csv)
+    hass.data[DOMAIN] = store
+
+    async def _async_record(now: datetime) -> None:
+        hour = dt_util.as_local(now).replace(minute=0, second=0, microsecond=0)
+        values = _snapshot(hass)
+        try:
+            added = await hass.async_add_executor_job(store.append, int(hour.timestamp()), values)
+        except OSError as err:
+            _LOGGER.error("Cannot record hour %s: %s", hour, err)
+            return
+        if not added:
+            _LOGGER.debug("Hour %s is already recorded", hour)
+
+    async def _async_close(_event: Event) -> None:
+        unsub()
+        await hass.async_add_executor_job(store.close)
+
+    unsub = async_track_time_change(hass, _async_record, minute=SNAPSHOT_MINUTE, second=SNAPSHOT_SECOND)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close)
+    return True
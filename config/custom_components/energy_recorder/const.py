@@ -0,0 +1,24 @@
+"""Constants for the Hourly Energy Recorder integration."""
+
+DOMAIN = "energy_recorder"
+
+CONF_PATH = "path"
+CONF_LEGACY_CSV = "legacy_csv"
+
+DEFAULT_PATH = "data/hourly_energy"
+DEFAULT_LEGACY_CSV = "data/hourly_energy.csv"
+
+# Hourly utility meters reset on the hour, snapshot them just before
+SNAPSHOT_MINUTE = 59
+SNAPSHOT_SECOND = 30
+
+# Utility meter (hourly) and state sensors per stored column
+SENSOR_GRID_IMPORT = "sensor.zuzycie_godzinowe"
+SENSOR_PV_PRODUCTION = "sensor.produkcja_pv_godzinowa_dc"
+SENSOR_GRID_EXPORT = "sensor.eksport_godzinowy"
+SENSOR_BATTERY_CHARGE = "sensor.ladowanie_baterii_godzinowe"
+SENSOR_BATTERY_DISCHARGE = "sensor.rozladowanie_baterii_godzinowe"
+SENSOR_SOC = "sensor.akumulatory_stan_pojemnosci"
+SENSOR_TARIFF_ZONE = "sensor.strefa_taryfowa"
+SENSOR_TEMPERATURE = "sensor.bateria_temperatura_maksymalna"
+SENSOR_RCE_PRICE = "sensor.rce_pse_cena"
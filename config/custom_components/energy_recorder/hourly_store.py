@@ -0,0 +1,327 @@
+"""Append-only columnar store of hourly energy snapshots.
+
+Layout of the store directory:
+
+    schema.json     schema version, columns, string dictionaries
+    timestamp.col   int64 epoch seconds of the hour start, ascending
+    <column>.col    one value per row: float64 (NaN = missing) or
+                    uint16 dictionary code (0 = missing)
+
+A row is complete once it is in every column file, readers use the shortest
+column, so they never see half a row. The writer truncates leftovers of an
+interrupted append when it opens the store.
+
+No Home Assistant imports, so the ML scripts can load it by path.
+"""
+import array
+import csv
+import fcntl
+import json
+import math
+import os
+import sys
+from bisect import bisect_left
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+# 2: grid_import_kwh
+SCHEMA_VERSION = 2
+
+FLOAT = "f64"
+STRING = "str"
+TYPECODES = {"timestamp": "q", FLOAT: "d", STRING: "H"}
+MAX_DICTIONARY_SIZE = 65535
+
+# The columns of the old /config/data/hourly_energy.csv, then the ones added since
+COLUMNS = (
+    ("consumption_kwh", FLOAT),
+    ("pv_production_kwh", FLOAT),
+    ("grid_export_kwh", FLOAT),
+    ("battery_charge_kwh", FLOAT),
+    ("battery_discharge_kwh", FLOAT),
+    ("soc_percent", FLOAT),
+    ("tariff_zone", STRING),
+    ("temperature_c", FLOAT),
+    ("rce_price_pln_mwh", FLOAT),
+    ("grid_import_kwh", FLOAT),
+)
+
+DEFAULT_FSYNC_ROWS = 6
+DEFAULT_TIMEZONE = "Europe/Warsaw"
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class SchemaError(Exception):
+    """The store was written with a schema this code cannot use."""
+
+
+class StoreLockedError(Exception):
+    """Another writer has the store open."""
+
+
+def _float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _epoch(value, tz: ZoneInfo) -> int:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=tz)
+        return int(value.timestamp())
+    return int(value)
+
+
+class HourlyEnergyStore:
+    """One row per hour, keyed by the epoch of the hour start.
+
+    Rows are kept in time order. A row for an hour at or before the last
+    stored one is dropped, which makes a repeated snapshot (a restart right
+    after the hour, a re-run import) harmless.
+
+    Appends go to the OS right away and are fsynced every ``fsync_rows`` rows
+    and on sync()/close(), so the SD card is not flushed every hour.
+    """
+
+    def __init__(self, path: str, columns=COLUMNS, fsync_rows: int = DEFAULT_FSYNC_ROWS):
+        self.path = path
+        self._wanted = tuple(columns)
+        self._fsync_rows = fsync_rows
+        self._schema: dict | None = None
+        self._timestamps = array.array("q")
+        self._files = {}
+        self._lock = None
+        self._unsynced = 0
+
+    # Reading
+
+    def _column_path(self, name: str) -> str:
+        return os.path.join(self.path, f"{name}.col")
+
+    def _load_schema(self) -> dict | None:
+        try:
+            with open(os.path.join(self.path, "schema.json"), encoding="utf-8") as file:
+                schema = json.load(file)
+        except FileNotFoundError:
+            return None
+        if schema.get("version", 0) > SCHEMA_VERSION:
+            raise SchemaError(f"{self.path} has schema version {schema['version']}, newest known is {SCHEMA_VERSION}")
+        return schema
+
+    @staticmethod
+    def _columns(schema: dict) -> list[tuple[str, str]]:
+        return [("timestamp", "timestamp")] + [(column["name"], column["type"]) for column in schema["columns"]]
+
+    def _row_count(self, schema: dict) -> int:
+        counts = []
+        for name, kind in self._columns(schema):
+            try:
+                size = os.path.getsize(self._column_path(name))
+            except FileNotFoundError:
+                return 0
+            counts.append(size // array.array(TYPECODES[kind]).itemsize)
+        return min(counts)
+
+    def _read_column(self, schema: dict, name: str, kind: str, start: int, stop: int) -> array.array:
+        values = array.array(TYPECODES[kind])
+        if stop <= start:
+            return values
+        with open(self._column_path(name), "rb") as file:
+            file.seek(start * values.itemsize)
+            values.frombytes(file.read((stop - start) * values.itemsize))
+        if schema.get("byteorder", sys.byteorder) != sys.byteorder:
+            values.byteswap()
+        return values
+
+    def __len__(self) -> int:
+        if self._schema is not None:
+            return len(self._timestamps)
+        schema = self._load_schema()
+        return self._row_count(schema) if schema else 0
+
+    def read(self, start=None, end=None, columns=None, tz: str = DEFAULT_TIMEZONE) -> dict[str, list]:
+        """Return ``{"timestamp": [...], column: [...]}`` for hours in ``start`` <= hour < ``end``.
+
+        ``start`` and ``end`` are datetimes (naive ones are in ``tz``) or epoch
+        seconds. Missing values are None.
+        """
+        zone = ZoneInfo(tz)
+        schema = self._schema or self._load_schema()
+        if schema is None:
+            return {"timestamp": [], **{name: [] for name in columns or (name for name, _ in self._wanted)}}
+        rows = len(self._timestamps) if self._schema is not None else self._row_count(schema)
+        timestamps = (
+            self._timestamps if self._schema is not None
+            else self._read_column(schema, "timestamp", "timestamp", 0, rows)
+        )
+        first = bisect_left(timestamps, _epoch(start, zone)) if start is not None else 0
+        last = bisect_left(timestamps, _epoch(end, zone)) if end is not None else rows
+
+        kinds = {column["name"]: column["type"] for column in schema["columns"]}
+        result = {"timestamp": list(timestamps[first:last])}
+        for name in columns or [column["name"] for column in schema["columns"]]:
+            if name not in kinds:
+                result[name] = [None] * (last - first)
+                continue
+            values = self._read_column(schema, name, kinds[name], first, last)
+            if kinds[name] == FLOAT:
+                result[name] = [None if math.isnan(value) else value for value in values]
+            else:
+                dictionary = schema["dictionaries"].get(name, [])
+                result[name] = [dictionary[code - 1] if code else None for code in values]
+        return result
+
+    def rows(self, start=None, end=None, columns=None, tz: str = DEFAULT_TIMEZONE) -> list[dict]:
+        """Rows like csv.DictReader gave for the old CSV, timestamp as a local hour string."""
+        zone = ZoneInfo(tz)
+        data = self.read(start, end, columns, tz)
+        names = [name for name in data if name != "timestamp"]
+        return [
+            {
+                "timestamp": datetime.fromtimestamp(timestamp, zone).strftime(TIMESTAMP_FORMAT),
+                **{name: data[name][index] for name in names},
+            }
+            for index, timestamp in enumerate(data["timestamp"])
+        ]
+
+    # Writing
+
+    def open(self):
+        """Open for appending: take the writer lock, migrate the schema, drop partial rows."""
+        os.makedirs(self.path, exist_ok=True)
+        lock = open(os.path.join(self.path, ".lock"), "w", encoding="utf-8")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError as err:
+            lock.close()
+            raise StoreLockedError(f"{self.path} is open by another writer") from err
+        self._lock = lock
+
+        try:
+            schema = self._load_schema()
+            rows = self._row_count(schema) if schema else 0
+            schema = self._migrate(schema, rows)
+            for name, kind in self._columns(schema):
+                path = self._column_path(name)
+                size = rows * array.array(TYPECODES[kind]).itemsize
+                if not os.path.exists(path) or os.path.getsize(path) != size:
+                    with open(path, "ab") as file:
+                        file.truncate(size)
+            self._timestamps = self._read_column(schema, "timestamp", "timestamp", 0, rows)
+            self._files = {name: open(self._column_path(name), "ab") for name, _ in self._columns(schema)}
+            self._schema = schema
+        except Exception:
+            self.close()
+            raise
+
+    def _migrate(self, schema: dict | None, rows: int) -> dict:
+        """Create the schema, or add wanted columns missing from it (backfilled as missing)."""
+        if schema is None:
+            schema = {"version": SCHEMA_VERSION, "byteorder": sys.byteorder, "columns": [], "dictionaries": {}}
+            rows = 0
+        changed = schema.get("version") != SCHEMA_VERSION
+        known = {column["name"]: column["type"] for column in schema["columns"]}
+        for name, kind in self._wanted:
+            if name in known:
+                if known[name] != kind:
+                    raise SchemaError(f"Column {name} is {known[name]} in {self.path}, not {kind}")
+                continue
+            missing = array.array(TYPECODES[kind], [math.nan if kind == FLOAT else 0] * rows)
+            if schema.get("byteorder", sys.byteorder) != sys.byteorder:
+                missing.byteswap()
+            with open(self._column_path(name), "wb") as file:
+                file.write(missing.tobytes())
+            schema["columns"].append({"name": name, "type": kind})
+            changed = True
+        if changed or not os.path.exists(os.path.join(self.path, "schema.json")):
+            schema["version"] = SCHEMA_VERSION
+            self._save_schema(schema)
+        return schema
+
+    def _save_schema(self, schema: dict):
+        path = os.path.join(self.path, "schema.json")
+        temp = f"{path}.tmp"
+        with open(temp, "w", encoding="utf-8") as file:
+            json.dump(schema, file, indent=2)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp, path)
+
+    def _code(self, name: str, value) -> int:
+        if value is None or value == "":
+            return 0
+        dictionary = self._schema["dictionaries"].setdefault(name, [])
+        value = str(value)
+        if value not in dictionary:
+            if len(dictionary) >= MAX_DICTIONARY_SIZE:
+                return 0
+            dictionary.append(value)
+            # Saved before any row refers to the new code
+            self._save_schema(self._schema)
+        return dictionary.index(value) + 1
+
+    def append(self, timestamp: int, values: dict) -> bool:
+        """Append the row of the hour starting at ``timestamp``; False if it is a duplicate."""
+        if self._schema is None:
+            raise RuntimeError("Store is not open for appending")
+        if self._timestamps and timestamp <= self._timestamps[-1]:
+            return False
+
+        swap = self._schema.get("byteorder", sys.byteorder) != sys.byteorder
+        encoded = {"timestamp": array.array("q", [timestamp])}
+        for column in self._schema["columns"]:
+            name = column["name"]
+            if column["type"] == FLOAT:
+                encoded[name] = array.array("d", [_float(values.get(name))])
+            else:
+                encoded[name] = array.array("H", [self._code(name, values.get(name))])
+
+        for name, column in encoded.items():
+            if swap:
+                column.byteswap()
+            self._files[name].write(column.tobytes())
+            self._files[name].flush()
+        self._timestamps.append(timestamp)
+
+        self._unsynced += 1
+        if self._unsynced >= self._fsync_rows:
+            self.sync()
+        return True
+
+    def sync(self):
+        """fsync appended rows."""
+        for file in self._files.values():
+            file.flush()
+            os.fsync(file.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        """Sync, close the column files and release the writer lock."""
+        if self._files:
+            self.sync()
+            for file in self._files.values():
+                file.close()
+        self._files = {}
+        self._schema = None
+        if self._lock is not None:
+            self._lock.close()
+            self._lock = None
+
+    def import_csv(self, path: str, tz: str = DEFAULT_TIMEZONE) -> int:
+        """Append the rows of an old hourly CSV, return how many were new."""
+        zone = ZoneInfo(tz)
+        pending = []
+        with open(path, encoding="utf-8", newline="") as file:
+            for row in csv.DictReader(file):
+                try:
+                    when = datetime.strptime(row["timestamp"], TIMESTAMP_FORMAT).replace(tzinfo=zone)
+                except (KeyError, TypeError, ValueError):
+                    continue
+                hour = when.replace(minute=0, second=0)
+                pending.append((int(hour.timestamp()), row))
+        pending.sort(key=lambda item: item[0])
+        appended = sum(self.append(timestamp, row) for timestamp, row in pending)
+        self.sync()
+        return appended
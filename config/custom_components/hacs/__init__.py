@@ -25,6 +25,7 @@ from .const import DOMAIN, HACS_SYSTEM_ID, MINIMUM_HA_VERSION, STARTUP
 from .data_client import HacsDataClient
 from .enums import HacsDisabledReason, HacsStage, LovelaceMode
 from .frontend import async_register_frontend
+from .utils.conditional_cache import ConditionalRequestCache
 from .utils.data import HacsData
 from .utils.queue_manager import QueueManager
 from .utils.version import version_left_higher_or_equal_then_right
@@ -66,11 +67,14 @@ async def _async_initialize_integration(
     hacs.version = integration.version
     hacs.configuration.dev = integration.version == "0.0.0"
     hacs.hass = hass
-    hacs.queue = QueueManager(hass=hass)
+    hacs.queue = QueueManager(hass=hass, store_key="queue")
     hacs.data = HacsData(hacs=hacs)
+    hacs.conditional_cache = ConditionalRequestCache(hass)
+    await hacs.conditional_cache.async_load()
     hacs.data_client = HacsDataClient(
         session=clientsession,
         client_name=f"HACS/{integration.version}",
+        cache=hacs.conditional_cache,
     )
     hacs.system.running = True
     hacs.session = clientsession
@@ -196,7 +200,7 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         return False
 
     # Clear out pending queue
-    hacs.queue.clear()
+    hacs.queue.cancel()
 
     for task in hacs.recurring_tasks:
         # Cancel all pending tasks
@@ -37,7 +37,15 @@ from homeassistant.helpers.issue_registry import IssueSeverity, async_create_iss
 from homeassistant.loader import Integration
 from homeassistant.util import dt
 
-from .const import DOMAIN, TV, URL_BASE
+from .const import (
+    DOMAIN,
+    MIN_REQUESTS_PER_REPOSITORY,
+    QUEUE_CONCURRENCY,
+    QUEUE_PRIORITY_INSTALLED,
+    REQUESTS_PER_REPOSITORY,
+    TV,
+    URL_BASE,
+)
 from .coordinator import HacsUpdateCoordinator
 from .data_client import HacsDataClient
 from .enums import (
@@ -69,6 +77,7 @@ from .utils.workarounds import async_register_static_path
 
 if TYPE_CHECKING:
     from .repositories.base import HacsRepository
+    from .utils.conditional_cache import ConditionalRequestCache
     from .utils.data import HacsData
     from .validate.manager import ValidationManager
 
@@ -107,6 +116,23 @@ class RemovedRepository:
         }
 
 
+@dataclass(slots=True)
+class RepositoryCatalogEntry:
+    """Compact record of a known repository that has no repository object yet.
+
+    ``data`` is a copy of the stored or remote repository data, applied when
+    the repository object is created. ``changed`` is set when ``data`` changes
+    and cleared once it is written to the store.
+    """
+
+    id: str
+    full_name: str
+    category: str
+    installed: bool = False
+    data: dict[str, Any] = field(default_factory=dict)
+    changed: bool = False
+
+
 @dataclass
 class HacsConfiguration:
     """HacsConfiguration class."""
@@ -201,12 +227,35 @@ class HacsRepositories:
     _repositories_by_full_name: dict[str, HacsRepository] = field(default_factory=dict)
     _repositories_by_id: dict[str, HacsRepository] = field(default_factory=dict)
     _removed_repositories_by_full_name: dict[str, RemovedRepository] = field(default_factory=dict)
+    _catalog: dict[str, RepositoryCatalogEntry] = field(default_factory=dict)
+    _catalog_by_full_name: dict[str, str] = field(default_factory=dict)
+    _materializer: Callable[[RepositoryCatalogEntry], HacsRepository | None] | None = None
 
     @property
     def list_all(self) -> list[HacsRepository]:
-        """Return a list of repositories."""
+        """Return a list of repositories with a repository object."""
         return list(self._repositories)
 
+    @property
+    def list_catalog(self) -> list[RepositoryCatalogEntry]:
+        """Return a list of catalog entries without a repository object."""
+        return list(self._catalog.values())
+
+    @property
+    def count(self) -> int:
+        """Return the number of known repositories."""
+        return len(self._repositories) + len(self._catalog)
+
+    def list_by_category(self, categories: set[str] | list[str]) -> list[HacsRepository]:
+        """Return repositories with a repository object in categories."""
+        return [repo for repo in self._repositories if repo.data.category in categories]
+
+    def list_catalog_by_category(
+        self, categories: set[str] | list[str]
+    ) -> list[RepositoryCatalogEntry]:
+        """Return catalog entries in categories, without creating repository objects."""
+        return [entry for entry in self._catalog.values() if entry.category in categories]
+
     @property
     def list_removed(self) -> list[RemovedRepository]:
         """Return a list of removed repositories."""
@@ -231,6 +280,10 @@ class HacsRepositories:
         if repo_id == "0":
             return
 
+        # The repository object replaces its catalog entry
+        if (entry := self._catalog.pop(repo_id, None)) is not None:
+            self._catalog_by_full_name.pop(entry.full_name.lower(), None)
+
         if registered_repo := self._repositories_by_id.get(repo_id):
             if registered_repo.data.full_name == repository.data.full_name:
                 return
@@ -281,6 +334,62 @@ class HacsRepositories:
 
         self._default_repositories.add(repo_id)
 
+    def add_to_catalog(self, entry: RepositoryCatalogEntry, default: bool = False) -> None:
+        """Add a catalog entry for a repository without a repository object."""
+        if entry.id == "0" or entry.id in self._repositories_by_id:
+            return
+
+        if (previous := self._catalog.get(entry.id)) is not None:
+            self._catalog_by_full_name.pop(previous.full_name.lower(), None)
+
+        self._catalog[entry.id] = entry
+        self._catalog_by_full_name[entry.full_name.lower()] = entry.id
+
+        if default:
+            self._default_repositories.add(entry.id)
+
+    def mark_catalog_default(self, entry: RepositoryCatalogEntry) -> None:
+        """Mark a catalog entry as default."""
+        if entry.id in self._catalog:
+            self._default_repositories.add(entry.id)
+
+    def remove_from_catalog(self, repository_id: str) -> None:
+        """Remove a catalog entry."""
+        if (entry := self._catalog.pop(repository_id, None)) is None:
+            return
+
+        self._catalog_by_full_name.pop(entry.full_name.lower(), None)
+        self._default_repositories.discard(repository_id)
+
+    def catalog_entry(
+        self,
+        repository_id: str | None = None,
+        repository_full_name: str | None = None,
+    ) -> RepositoryCatalogEntry | None:
+        """Get a catalog entry by id or full name."""
+        if repository_id is None and repository_full_name is not None:
+            repository_id = self._catalog_by_full_name.get(repository_full_name.lower())
+        if not repository_id:
+            return None
+        return self._catalog.get(str(repository_id))
+
+    def materialize(
+        self,
+        repository_id: str | None = None,
+        repository_full_name: str | None = None,
+    ) -> HacsRepository | None:
+        """Get a repository object, creating it from its catalog entry if needed."""
+        if repository_id is not None:
+            repository = self.get_by_id(repository_id)
+        else:
+            repository = self.get_by_full_name(repository_full_name)
+        if repository is not None:
+            return repository
+        entry = self.catalog_entry(repository_id, repository_full_name)
+        if entry is None or self._materializer is None:
+            return None
+        return self._materializer(entry)
+
     def set_repository_id(self, repository: HacsRepository, repo_id: str):
         """Update a repository id."""
         existing_repo_id = str(repository.data.id)
@@ -307,9 +416,12 @@ class HacsRepositories:
     ) -> bool:
         """Check if a repository is registered."""
         if repository_id is not None:
-            return repository_id in self._repositories_by_id
+            return repository_id in self._repositories_by_id or repository_id in self._catalog
         if repository_full_name is not None:
-            return repository_full_name in self._repositories_by_full_name
+            return (
+                repository_full_name in self._repositories_by_full_name
+                or repository_full_name.lower() in self._catalog_by_full_name
+            )
         return False
 
     def is_downloaded(
@@ -318,6 +430,8 @@ class HacsRepositories:
         repository_full_name: str | None = None,
     ) -> bool:
         """Check if a repository is registered."""
+        if (entry := self.catalog_entry(repository_id, repository_full_name)) is not None:
+            return entry.installed
         if repository_id is not None:
             repo = self.get_by_id(repository_id)
         if repository_full_name is not None:
@@ -355,6 +469,7 @@ class HacsRepositories:
 class HacsBase:
     """Base HACS class."""
 
+    conditional_cache: ConditionalRequestCache | None = None
     data: HacsData | None = None
     data_client: HacsDataClient | None = None
     frontend_version: str | None = None
@@ -377,7 +492,7 @@ class HacsBase:
         self.core = HacsCore()
         self.log = LOGGER
         self.recurring_tasks: list[Callable[[], None]] = []
-        self.repositories = HacsRepositories()
+        self.repositories = HacsRepositories(_materializer=self.async_materialize_repository)
         self.status = HacsStatus()
         self.system = HacsSystem()
 
@@ -428,6 +543,22 @@ class HacsBase:
             self.common.categories.pop(category)
             self.coordinators.pop(category)
 
+    @callback
+    def async_materialize_repository(
+        self, entry: RepositoryCatalogEntry
+    ) -> HacsRepository | None:
+        """Create and register the repository object of a catalog entry."""
+        if entry.category not in REPOSITORY_CLASSES:
+            return None
+
+        repository: HacsRepository = REPOSITORY_CLASSES[entry.category](self, entry.full_name)
+        repository.data.id = entry.id
+        self.repositories.register(repository)
+        if self.data is not None:
+            self.data.async_restore_repository(entry.id, entry.data)
+        repository.data.changed = entry.changed
+        return repository
+
     async def async_save_file(self, file_path: str, content: Any) -> bool:
         """Save a file."""
 
@@ -471,8 +602,19 @@ class HacsBase:
         """Helper to calculate the number of repositories we can fetch data for."""
         try:
             response = await self.async_github_api_method(self.githubapi.rate_limit)
+            # 304 answers are not counted by GitHub, but the ratio is an estimate
+            # over past responses, so never budget less than the lower bound
+            requests_per_repository = REQUESTS_PER_REPOSITORY
+            if self.conditional_cache is not None:
+                requests_per_repository = max(
+                    MIN_REQUESTS_PER_REPOSITORY,
+                    round(
+                        REQUESTS_PER_REPOSITORY
+                        * (1 - self.conditional_cache.not_modified_ratio)
+                    ),
+                )
             if ((limit := response.data.resources.core.remaining or 0) - 1000) >= 10:
-                return math.floor((limit - 1000) / 10)
+                return math.floor((limit - 1000) / requests_per_repository)
             reset = dt.as_local(dt.utc_from_timestamp(response.data.resources.core.reset))
             self.log.info(
                 "GitHub API ratelimited - %s remaining (%s)",
@@ -495,19 +637,45 @@ class HacsBase:
         raise_exception: bool = True,
         **kwargs,
     ) -> TV | None:
-        """Call a GitHub API method"""
+        """Call a GitHub API method
+
+        Responses are cached with their ETag, the next identical call sends it
+        and a 304 is answered from the cache.
+        """
         _exception = None
+        cache_key = None
+        cached = None
+        if (
+            self.conditional_cache is not None
+            and "etag" not in kwargs
+            and getattr(method, "__name__", None) != "rate_limit"
+        ):
+            cache_key = (
+                f"{getattr(method, '__qualname__', method)}:{args!r}:{sorted(kwargs.items())!r}"
+            )
+            if (cached := self.conditional_cache.get(cache_key)) is not None and cached.etag:
+                kwargs["etag"] = cached.etag
 
         try:
-            return await method(*args, **kwargs)
+            response = await method(*args, **kwargs)
+            if cache_key is not None:
+                self.conditional_cache.async_count_response(not_modified=False)
+                self.conditional_cache.async_set(
+                    cache_key, response, etag=getattr(response, "etag", None)
+                )
+            return response
+        except GitHubNotModifiedException as exception:
+            if self.conditional_cache is not None:
+                self.conditional_cache.async_count_response(not_modified=True)
+            if cached is not None:
+                return cached.data
+            raise exception
         except GitHubAuthenticationException as exception:
             self.disable_hacs(HacsDisabledReason.INVALID_TOKEN)
             _exception = exception
         except GitHubRatelimitException as exception:
             self.disable_hacs(HacsDisabledReason.RATE_LIMIT)
             _exception = exception
-        except GitHubNotModifiedException as exception:
-            raise exception
         except GitHubException as exception:
             _exception = exception
         except (
@@ -671,6 +839,7 @@ class HacsBase:
         self.async_dispatch(HacsDispatchEvent.RELOAD, {"force": True})
 
         await self.async_handle_critical_repositories()
+        await self.async_resume_queue()
         await self.async_process_queue()
 
         self.async_dispatch(HacsDispatchEvent.STATUS, {})
@@ -801,7 +970,7 @@ class HacsBase:
                 repository = self.repositories.get_by_full_name(HacsGitHubRepo.INTEGRATION)
             elif not self.status.startup:
                 self.log.error("Scheduling update of hacs/integration")
-                self.queue.add(repository.common_update())
+                self.queue.add(repository.common_update(), priority=QUEUE_PRIORITY_INSTALLED)
             if repository is None:
                 raise HacsException("Unknown error")
 
@@ -858,6 +1027,12 @@ class HacsBase:
                 continue
             if repo_name in self.common.archived_repositories:
                 continue
+            if (entry := self.repositories.catalog_entry(repository_full_name=repo_name)) is not None:
+                self.repositories.mark_catalog_default(entry)
+                if (entry.data.get("last_fetched") or 0) < repo_data["last_fetched"]:
+                    entry.data = {**entry.data, **repo_data}
+                    entry.changed = True
+                continue
             if repository := self.repositories.get_by_full_name(repo_name):
                 self.repositories.set_repository_id(repository, repo_id)
                 self.repositories.mark_default(repository)
@@ -884,6 +1059,14 @@ class HacsBase:
                         "%s Unregister stale custom repository", repository.string
                     )
                     self.repositories.unregister(repository)
+            for entry in self.repositories.list_catalog:
+                if (
+                    entry.category == category
+                    and not entry.installed
+                    and not self.repositories.is_default(entry.id)
+                ):
+                    self.log.debug("Removing stale custom repository %s", entry.full_name)
+                    self.repositories.remove_from_catalog(entry.id)
 
         self.async_dispatch(HacsDispatchEvent.REPOSITORY, {})
         self.coordinators[category].async_update_listeners()
@@ -912,25 +1095,45 @@ class HacsBase:
             self.log.debug("Queue is already running")
             return
 
-        async def _handle_queue():
-            if not self.queue.has_pending_tasks:
-                await self.data.async_write()
-                return
+        while self.queue.has_pending_tasks:
             can_update = await self.async_can_update()
             self.log.debug(
                 "Can update %s repositories, items in queue %s",
                 can_update,
                 self.queue.pending_tasks,
             )
-            if can_update != 0:
-                try:
-                    await self.queue.execute(can_update)
-                except HacsExecutionStillInProgress:
-                    return
+            if can_update == 0:
+                return
+            try:
+                await self.queue.execute(
+                    can_update,
+                    concurrency=QUEUE_CONCURRENCY,
+                    keep_going=lambda: not self.system.disabled,
+                )
+            except HacsExecutionStillInProgress:
+                return
+            if self.system.disabled:
+                # Ratelimited while running, async_check_rate_limit resumes the queue
+                return
 
-                await _handle_queue()
+        await self.data.async_write()
 
-        await _handle_queue()
+    async def async_resume_queue(self) -> None:
+        """Queue repository updates that did not finish before the last stop."""
+        progress = await self.queue.async_load_progress()
+        if not progress:
+            return
+        self.log.info("Resuming %s repository updates from the last run", len(progress))
+        for repository_id, priority in progress.items():
+            repository = self.repositories.materialize(repository_id=repository_id)
+            if repository is None:
+                self.queue.forget(repository_id)
+                continue
+            self.queue.add(
+                repository.update_repository(ignore_issues=True),
+                priority=priority,
+                key=repository_id,
+            )
 
     async def async_handle_removed_repositories(self, _=None) -> None:
         """Handle removed repositories."""
@@ -949,6 +1152,14 @@ class HacsBase:
             removed.update_data(item)
 
         for removed in self.repositories.list_removed:
+            if (
+                entry := self.repositories.catalog_entry(repository_full_name=removed.repository)
+            ) is not None:
+                # Catalog entries are never downloaded, so only drop them
+                if entry.full_name not in self.common.ignored_repositories:
+                    need_to_save = True
+                    self.repositories.remove_from_catalog(entry.id)
+                continue
             if (repository := self.repositories.get_by_full_name(removed.repository)) is None:
                 continue
             if repository.data.full_name in self.common.ignored_repositories:
@@ -1006,7 +1217,16 @@ class HacsBase:
                 and not self.repositories.is_default(repository.data.id)
             ):
                 repositories_to_update += 1
-                self.queue.add(update_repository(repository))
+                if not self.queue.add(
+                    update_repository(repository),
+                    priority=QUEUE_PRIORITY_INSTALLED,
+                    key=str(repository.data.id),
+                ):
+                    # Already queued, possibly resumed from the last run
+                    repositories_to_update -= 1
+
+        if not repositories_to_update:
+            repositories_updated.set()
 
         async def update_coordinators() -> None:
             """Update all coordinators."""
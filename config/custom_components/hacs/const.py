@@ -18,6 +18,21 @@ PACKAGE_NAME = "custom_components.hacs"
 DEFAULT_CONCURRENT_TASKS = 15
 DEFAULT_CONCURRENT_BACKOFF_TIME = 1
 
+QUEUE_CONCURRENCY = 4
+QUEUE_PRIORITY_INSTALLED = 0
+QUEUE_PRIORITY_CATALOG = 10
+QUEUE_PROGRESS_SAVE_DELAY = 10
+
+DATA_STORE_SHARDS = 16
+DATA_WRITE_DEBOUNCE = 5
+DATA_WRITE_MIN_INTERVAL = 60
+
+CONDITIONAL_CACHE_MAX_ENTRIES = 500
+CONDITIONAL_CACHE_SAVE_DELAY = 30
+# GitHub API requests budgeted per repository update, without and with 304 answers
+REQUESTS_PER_REPOSITORY = 10
+MIN_REQUESTS_PER_REPOSITORY = 5
+
 HACS_REPOSITORY_ID = "172733314"
 
 HACS_ACTION_GITHUB_API_HEADERS = {
@@ -9,6 +9,7 @@ from aiohttp import ClientSession, ClientTimeout
 import voluptuous as vol
 
 from .exceptions import HacsException, HacsNotModifiedException
+from .utils.conditional_cache import ConditionalRequestCache
 from .utils.logger import LOGGER
 from .utils.validate import (
     VALIDATE_FETCHED_V2_CRITICAL_REPO_SCHEMA,
@@ -25,9 +26,16 @@ CRITICAL_REMOVED_VALIDATORS = {
 class HacsDataClient:
     """HACS Data client."""
 
-    def __init__(self, session: ClientSession, client_name: str) -> None:
+    def __init__(
+        self,
+        session: ClientSession,
+        client_name: str,
+        cache: ConditionalRequestCache | None = None,
+    ) -> None:
         """Initialize."""
+        self._cache = cache
         self._client_name = client_name
+        self._delivered: set[str] = set()
         self._etags = {}
         self._session = session
 
@@ -38,16 +46,28 @@ class HacsDataClient:
     ) -> dict[str, dict[str, Any]] | list[str]:
         """Do request."""
         endpoint = "/".join([v for v in [section, filename] if v is not None])
+        url = f"https://data-v2.hacs.xyz/{endpoint}"
+        cached = self._cache.get(url) if self._cache is not None else None
+        cached_data = None
+        if cached is not None and url not in self._delivered:
+            # Unchanged data is still handed out once after a start
+            cached_data = await self._cache.async_load_data(url)
+        headers = {"User-Agent": self._client_name}
+        if cached is not None and (url in self._delivered or cached_data is not None):
+            headers.update(cached.request_headers)
+        else:
+            headers["If-None-Match"] = self._etags.get(endpoint, "")
         try:
             response = await self._session.get(
-                f"https://data-v2.hacs.xyz/{endpoint}",
+                url,
                 timeout=ClientTimeout(total=60),
-                headers={
-                    "User-Agent": self._client_name,
-                    "If-None-Match": self._etags.get(endpoint, ""),
-                },
+                headers=headers,
             )
             if response.status == 304:
+                if cached_data is not None:
+                    # Unchanged since the last run, but not handed out since this start
+                    self._delivered.add(url)
+                    return cached_data
                 raise HacsNotModifiedException() from None
             response.raise_for_status()
         except HacsNotModifiedException:
@@ -59,7 +79,17 @@ class HacsDataClient:
 
         self._etags[endpoint] = response.headers.get("etag")
 
-        return await response.json()
+        data = await response.json()
+        if self._cache is not None:
+            self._cache.async_set(
+                url,
+                data,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+                persist=True,
+            )
+            self._delivered.add(url)
+        return data
 
     async def get_data(self, section: str | None, *, validate: bool) -> dict[str, dict[str, Any]]:
         """Get data."""
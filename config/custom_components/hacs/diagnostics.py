@@ -39,6 +39,11 @@ async def async_get_config_entry_diagnostics(
             repo.data.full_name
             for repo in hacs.repositories.list_all
             if not hacs.repositories.is_default(str(repo.data.id))
+        ]
+        + [
+            entry.full_name
+            for entry in hacs.repositories.list_catalog
+            if not hacs.repositories.is_default(entry.id)
         ],
         "repositories": [],
     }
@@ -136,9 +136,22 @@ class FileInformation:
         self.name = name
 
 
-@attr.s(auto_attribs=True)
+def _mark_changed(instance: RepositoryData, attribute: attr.Attribute, value: Any) -> Any:
+    """Flag the repository data as changed when an attribute gets a new value."""
+    if instance.__dict__.get(attribute.name) != value:
+        instance.changed = True
+    return value
+
+
+@attr.s(auto_attribs=True, on_setattr=_mark_changed)
 class RepositoryData:
-    """RepositoryData class."""
+    """RepositoryData class.
+
+    ``changed`` is set when an attribute changes and cleared once the data
+    is written to the store.
+    """
+
+    changed = False
 
     archived: bool = False
     authors: list[str] = []
@@ -1010,8 +1023,12 @@ class HacsRepository:
         """Return a repository object."""
         try:
             repository = await self.hacs.github.get_repo(self.data.full_name, etag)
+            if self.hacs.conditional_cache is not None:
+                self.hacs.conditional_cache.async_count_response(not_modified=False)
             return repository, self.hacs.github.client.last_response.etag
         except AIOGitHubAPINotModifiedException as exception:
+            if self.hacs.conditional_cache is not None:
+                self.hacs.conditional_cache.async_count_response(not_modified=True)
             raise HacsNotModifiedException(exception) from exception
         except (ValueError, AIOGitHubAPIException, Exception) as exception:
             raise HacsException(exception) from exception
@@ -1053,9 +1070,11 @@ class HacsRepository:
     ) -> None:
         """Common update data."""
         releases = []
+        # Downloaded repositories need a repository object to continue with on a 304
+        use_etag = not force and (not self.data.installed or self.repository_object is not None)
         try:
             repository_object, etag = await self.async_get_legacy_repository_object(
-                etag=None if force or self.data.installed else self.data.etag_repository,
+                etag=self.data.etag_repository if use_etag else None,
             )
             self.repository_object = repository_object
             if self.data.full_name.lower() != repository_object.full_name.lower():
@@ -1073,7 +1092,9 @@ class HacsRepository:
             )
             self.data.etag_repository = etag
         except HacsNotModifiedException:
-            return
+            if not self.data.installed:
+                return
+            # Unchanged, continue with the repository object from the last update
         except HacsRepositoryExistException:
             raise HacsRepositoryExistException from None
         except (AIOGitHubAPIException, HacsException) as exception:
@@ -0,0 +1,145 @@
+"""Cache of conditional (ETag/Last-Modified) responses."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from ..const import CONDITIONAL_CACHE_MAX_ENTRIES, CONDITIONAL_CACHE_SAVE_DELAY
+from .logger import LOGGER
+from .store import get_store_for_key
+
+_LOGGER = LOGGER
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """A cached response and the validators to revalidate it with."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    data: Any = None
+    persist: bool = False
+
+    @property
+    def request_headers(self) -> dict[str, str]:
+        """Return the conditional request headers for this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ConditionalRequestCache:
+    """Responses keyed by URL (or request key), answered again on a 304.
+
+    Entries added with ``persist`` hold JSON data that survives a restart.
+    Only their validators are kept in memory and in the cache store, the
+    data is saved to a store of its own per key and loaded on demand with
+    async_load_data. Other entries (GitHub API response objects) are kept
+    in memory, the least recently used ones are dropped once there are more
+    than CONDITIONAL_CACHE_MAX_ENTRIES.
+    """
+
+    def __init__(self, hass: HomeAssistant, store_key: str = "conditional_cache") -> None:
+        """Initialize."""
+        self._hass = hass
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._store_key = store_key
+        self._store = get_store_for_key(hass, store_key)
+        self._data_stores: dict[str, Store] = {}
+        self.not_modified = 0
+        self.modified = 0
+
+    async def async_load(self) -> None:
+        """Load the validators of persisted entries."""
+        data = await self._store.async_load() or {}
+        for key, entry in data.items():
+            self._entries[key] = CachedResponse(
+                etag=entry.get("etag"),
+                last_modified=entry.get("last_modified"),
+                persist=True,
+            )
+        _LOGGER.debug("<ConditionalRequestCache> Loaded %s cached responses", len(data))
+
+    async def async_load_data(self, key: str) -> Any:
+        """Return the cached data for a key, loading persisted data from its store."""
+        if (entry := self._entries.get(key)) is None:
+            return None
+        if not entry.persist:
+            return entry.data
+        return await self._data_store(key).async_load()
+
+    def _data_store(self, key: str) -> Store:
+        """Return the store holding the data of a persisted entry."""
+        if (store := self._data_stores.get(key)) is None:
+            digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+            store = get_store_for_key(self._hass, f"{self._store_key}.{digest}")
+            self._data_stores[key] = store
+        return store
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the cached response for a key."""
+        if (entry := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    @callback
+    def async_set(
+        self,
+        key: str,
+        data: Any,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        persist: bool = False,
+    ) -> None:
+        """Cache a response, responses without validators are not cached."""
+        if not etag and not last_modified:
+            if (entry := self._entries.pop(key, None)) is not None and entry.persist:
+                self._hass.async_create_task(self._data_store(key).async_remove())
+                self._store.async_delay_save(self._data_to_save, CONDITIONAL_CACHE_SAVE_DELAY)
+            return
+
+        if persist:
+            # The data lives in its own store only, not in memory
+            self._data_store(key).async_delay_save(lambda: data, CONDITIONAL_CACHE_SAVE_DELAY)
+        self._entries[key] = CachedResponse(
+            etag, last_modified, None if persist else data, persist
+        )
+        self._entries.move_to_end(key)
+
+        memory_only = [cached for cached, entry in self._entries.items() if not entry.persist]
+        for stale in memory_only[: max(0, len(memory_only) - CONDITIONAL_CACHE_MAX_ENTRIES)]:
+            del self._entries[stale]
+
+        if persist:
+            self._store.async_delay_save(self._data_to_save, CONDITIONAL_CACHE_SAVE_DELAY)
+
+    @callback
+    def async_count_response(self, not_modified: bool) -> None:
+        """Count a rate limited (GitHub API) response."""
+        if not_modified:
+            self.not_modified += 1
+        else:
+            self.modified += 1
+
+    @property
+    def not_modified_ratio(self) -> float:
+        """Return the share of counted responses that were a 304."""
+        total = self.not_modified + self.modified
+        return self.not_modified / total if total else 0.0
+
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        return {
+            key: {"etag": entry.etag, "last_modified": entry.last_modified}
+            for key, entry in self._entries.items()
+            if entry.persist
+        }
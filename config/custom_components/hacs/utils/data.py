@@ -4,18 +4,28 @@ from __future__ import annotations
 
 import asyncio
 from datetime import UTC, datetime
+import time
 from typing import Any
+import zlib
 
-from homeassistant.core import callback
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.exceptions import HomeAssistantError
-
-from ..base import HacsBase
-from ..const import HACS_REPOSITORY_ID
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
+
+from ..base import HacsBase, RepositoryCatalogEntry
+from ..const import (
+    DATA_STORE_SHARDS,
+    DATA_WRITE_DEBOUNCE,
+    DATA_WRITE_MIN_INTERVAL,
+    HACS_REPOSITORY_ID,
+)
 from ..enums import HacsDisabledReason, HacsDispatchEvent
+from ..repositories import REPOSITORY_CLASSES
 from ..repositories.base import TOPIC_FILTER, HacsManifest, HacsRepository
 from .logger import LOGGER
 from .path import is_safe
-from .store import async_load_from_store, async_save_to_store
+from .store import async_load_from_store, get_store_for_key
 
 EXPORTED_BASE_DATA = (
     ("new", False),
@@ -55,6 +65,16 @@ EXPORTED_DOWNLOADED_REPOSITORY_DATA = EXPORTED_REPOSITORY_DATA + (
 )
 
 
+def shard_for_repository(repository_id: str) -> int:
+    """Return the repositories shard a repository is stored in."""
+    return zlib.crc32(repository_id.encode()) % DATA_STORE_SHARDS
+
+
+def shard_store_key(shard: int) -> str:
+    """Return the store key of a repositories shard."""
+    return f"repositories.{shard:02d}"
+
+
 class HacsData:
     """HacsData class."""
 
@@ -62,57 +82,140 @@ class HacsData:
         """Initialize."""
         self.logger = LOGGER
         self.hacs = hacs
-        self.content = {}
+        # Data per repository id as last written, by shard
+        self._shards: dict[int, dict[str, dict[str, Any]]] = {}
+        self._written_hacs: bytes | None = None
+        self._last_write = 0.0
+        self._write_lock = asyncio.Lock()
+        self._write_timer: CALLBACK_TYPE | None = None
 
     async def async_force_write(self, _=None):
         """Force write."""
         await self.async_write(force=True)
 
     async def async_write(self, force: bool = False) -> None:
-        """Write content to the store files."""
+        """Write content to the store files.
+
+        Writes are coalesced and run at most once every DATA_WRITE_MIN_INTERVAL,
+        only shards holding changed repositories are written. A forced write
+        runs right away.
+        """
         if not force and self.hacs.system.disabled:
             return
 
-        self.logger.debug("<HacsData async_write> Saving data")
+        for event in (HacsDispatchEvent.REPOSITORY, HacsDispatchEvent.CONFIG):
+            self.hacs.async_dispatch(event, {})
 
-        # Hacs
-        await async_save_to_store(
-            self.hacs.hass,
-            "hacs",
-            {
+        if not force:
+            self._async_schedule_write()
+            return
+
+        if self._write_timer is not None:
+            self._write_timer()
+            self._write_timer = None
+        await self._async_write_changes()
+
+    @callback
+    def _async_schedule_write(self) -> None:
+        """Schedule a write of the changes, unless one is already scheduled."""
+        if self._write_timer is not None:
+            return
+        delay = max(
+            DATA_WRITE_DEBOUNCE,
+            self._last_write + DATA_WRITE_MIN_INTERVAL - time.monotonic(),
+        )
+        self._write_timer = async_call_later(self.hacs.hass, delay, self._async_scheduled_write)
+
+    async def _async_scheduled_write(self, _=None) -> None:
+        self._write_timer = None
+        await self._async_write_changes()
+
+    async def _async_write_changes(self) -> None:
+        """Write the hacs file and the repository shards that changed."""
+        async with self._write_lock:
+            self._last_write = time.monotonic()
+
+            hacs_data = {
                 "archived_repositories": self.hacs.common.archived_repositories,
                 "renamed_repositories": self.hacs.common.renamed_repositories,
                 "ignored_repositories": self.hacs.common.ignored_repositories,
-            },
-        )
-        await self._async_store_experimental_content_and_repos()
-        await self._async_store_content_and_repos()
+            }
+            if (serialized := json_bytes(hacs_data)) != self._written_hacs:
+                await get_store_for_key(self.hacs.hass, "hacs").async_save(hacs_data)
+                self._written_hacs = serialized
+
+            dirty_shards = self._async_update_shards()
+            if not dirty_shards:
+                self.logger.debug("<HacsData async_write> No repository data changed")
+                return
+
+            self.logger.debug(
+                "<HacsData async_write> Saving %s of %s repository shards",
+                len(dirty_shards),
+                DATA_STORE_SHARDS,
+            )
+            for shard in sorted(dirty_shards):
+                await get_store_for_key(self.hacs.hass, shard_store_key(shard)).async_save(
+                    dict(self._shards.get(shard, {}))
+                )
 
-    async def _async_store_content_and_repos(self, _=None):  # bb: ignore
-        """Store the main repos file and each repo that is out of date."""
-        # Repositories
-        self.content = {}
-        for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
-                self.async_store_repository_data(repository)
+    @callback
+    def _async_update_shards(self) -> set[int]:
+        """Put changed, new and removed repositories in the shards.
 
-        await async_save_to_store(self.hacs.hass, "repositories", self.content)
-        for event in (HacsDispatchEvent.REPOSITORY, HacsDispatchEvent.CONFIG):
-            self.hacs.async_dispatch(event, {})
+        Only repositories flagged as changed, or missing from the shards, are
+        exported. Returns the shards that need to be written.
+        """
+        stored = {repo_id for shard in self._shards.values() for repo_id in shard}
+        current: set[str] = set()
+        dirty_shards: set[int] = set()
 
-    async def _async_store_experimental_content_and_repos(self, _=None):
-        """Store the main repos file and each repo that is out of date."""
-        # Repositories
-        self.content = {}
-        for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
-                self.async_store_experimental_repository_data(repository)
+        def _set(repo_id: str, data: dict[str, Any]) -> None:
+            shard = shard_for_repository(repo_id)
+            self._shards.setdefault(shard, {})[repo_id] = data
+            dirty_shards.add(shard)
 
-        await async_save_to_store(self.hacs.hass, "data", {"repositories": self.content})
+        for repository in self.hacs.repositories.list_all:
+            if repository.data.category not in self.hacs.common.categories:
+                continue
+            repo_id = str(repository.data.id)
+            current.add(repo_id)
+            if repository.data.changed or repo_id not in stored:
+                _set(repo_id, self.async_get_repository_data(repository))
+                repository.data.changed = False
+
+        for entry in self.hacs.repositories.list_catalog:
+            if entry.category not in self.hacs.common.categories:
+                continue
+            current.add(entry.id)
+            if entry.changed or entry.id not in stored:
+                _set(entry.id, self.async_get_catalog_entry_data(entry))
+                entry.changed = False
+
+        for repo_id in stored - current:
+            shard = shard_for_repository(repo_id)
+            self._shards[shard].pop(repo_id, None)
+            dirty_shards.add(shard)
+
+        return dirty_shards
+
+    async def _async_load_shards(self) -> dict[str, dict[str, Any]]:
+        """Load repository data from the shards."""
+        shards = await asyncio.gather(
+            *(
+                async_load_from_store(self.hacs.hass, shard_store_key(shard))
+                for shard in range(DATA_STORE_SHARDS)
+            )
+        )
+        self._shards = {shard: data for shard, data in enumerate(shards) if data}
+        repositories = {}
+        for shard in self._shards.values():
+            repositories.update(shard)
+        return repositories
 
     @callback
-    def async_store_repository_data(self, repository: HacsRepository) -> dict:
-        """Store the repository data."""
+    def async_get_repository_data(self, repository: HacsRepository) -> dict[str, Any]:
+        """Return the stored data of a repository."""
         data = {"repository_manifest": repository.repository_manifest.manifest}
 
         for key, default in (
@@ -128,30 +231,27 @@ class HacsData:
         if repository.data.last_fetched:
             data["last_fetched"] = repository.data.last_fetched.timestamp()
 
-        self.content[str(repository.data.id)] = data
+        return data
 
     @callback
-    def async_store_experimental_repository_data(self, repository: HacsRepository) -> None:
-        """Store the experimental repository data for non downloaded repositories."""
-        data = {}
-        self.content.setdefault(repository.data.category, [])
+    def async_get_catalog_entry_data(self, entry: RepositoryCatalogEntry) -> dict[str, Any]:
+        """Return the stored data of a catalog entry, in the same shape as a repository."""
+        data = {
+            "repository_manifest": entry.data.get("repository_manifest")
+            or entry.data.get("manifest")
+            or {}
+        }
+
+        for key, default in EXPORTED_REPOSITORY_DATA:
+            if (value := entry.data.get(key, default)) != default:
+                data[key] = value
 
-        if repository.data.installed:
-            data["repository_manifest"] = repository.repository_manifest.manifest
-            for key, default in EXPORTED_DOWNLOADED_REPOSITORY_DATA:
-                if (value := getattr(repository.data, key, default)) != default:
-                    data[key] = value
-
-            if repository.data.installed_version:
-                data["version_installed"] = repository.data.installed_version
-            if repository.data.last_fetched:
-                data["last_fetched"] = repository.data.last_fetched.timestamp()
-        else:
-            for key, default in EXPORTED_BASE_DATA:
-                if (value := getattr(repository.data, key, default)) != default:
-                    data[key] = value
-
-        self.content[repository.data.category].append({"id": str(repository.data.id), **data})
+        data["category"] = entry.category
+        data["full_name"] = entry.full_name
+        if last_fetched := entry.data.get("last_fetched"):
+            data["last_fetched"] = last_fetched
+
+        return data
 
     async def restore(self):
         """Restore saved data."""
@@ -165,7 +265,9 @@ class HacsData:
             pass
 
         try:
-            repositories = await async_load_from_store(self.hacs.hass, "repositories")
+            repositories = await self._async_load_shards()
+            if not repositories:
+                repositories = await async_load_from_store(self.hacs.hass, "repositories")
             if not repositories and (data := await async_load_from_store(self.hacs.hass, "data")):
                 for category, entries in data.get("repositories", {}).items():
                     for repository in entries:
@@ -219,6 +321,9 @@ class HacsData:
                         "<HacsData restore> Found repository with ID %s - %s", entry, repo_data
                     )
                     continue
+                if self.hacs.repositories.catalog_entry(repository_id=entry) is not None:
+                    # Restored when the repository object is created
+                    continue
                 self.async_restore_repository(entry, repo_data)
 
             self.logger.info("<HacsData restore> Restore done")
@@ -235,16 +340,37 @@ class HacsData:
     async def register_unknown_repositories(
         self, repositories: dict[str, dict[str, Any]], category: str | None = None
     ):
-        """Registry any unknown repositories."""
+        """Registry any unknown repositories.
+
+        Repositories that are not downloaded only get a catalog entry, their
+        repository object is created when something looks them up.
+        """
         for repo_idx, (entry, repo_data) in enumerate(repositories.items()):
             # async_register_repository is awaited in a loop
             # since its unlikely to ever suspend at startup
+            repo_category = repo_data.get("category", category)
             if (
                 entry == "0"
-                or repo_data.get("category", category) is None
+                or repo_category is None
                 or self.hacs.repositories.is_registered(repository_id=entry)
             ):
                 continue
+            if (
+                not repo_data.get("installed")
+                and entry != HACS_REPOSITORY_ID
+                and repo_category in REPOSITORY_CLASSES
+                and not self.hacs.system.generator
+            ):
+                full_name = repo_data["full_name"]
+                self.hacs.repositories.add_to_catalog(
+                    RepositoryCatalogEntry(
+                        id=entry,
+                        full_name=self.hacs.common.renamed_repositories.get(full_name, full_name),
+                        category=repo_category,
+                        data=dict(repo_data),
+                    )
+                )
+                continue
             await self.hacs.async_register_repository(
                 repository_full_name=repo_data["full_name"],
                 category=repo_data.get("category", category),
@@ -307,6 +433,8 @@ class HacsData:
         repository.repository_manifest = HacsManifest.from_dict(
             repository_data.get("manifest") or repository_data.get("repository_manifest") or {}
         )
+        # Restored as stored, only the adjustments below need a write
+        repository.data.changed = False
 
         if repository.data.prerelease == repository.data.last_version:
             repository.data.prerelease = None
@@ -3,24 +3,49 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Coroutine
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+import heapq
+import itertools
 import time
 
 from homeassistant.core import HomeAssistant
 
+from ..const import QUEUE_PRIORITY_CATALOG, QUEUE_PROGRESS_SAVE_DELAY
 from ..exceptions import HacsExecutionStillInProgress
 from .logger import LOGGER
+from .store import get_store_for_key
 
 _LOGGER = LOGGER
 
 
+@dataclass(slots=True)
+class QueueItem:
+    """A queued task."""
+
+    task: Coroutine
+    priority: int
+    key: str | None = None
+
+
 class QueueManager:
-    """The QueueManager class."""
+    """The QueueManager class.
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    Tasks run in priority order (lowest first) on a pool of workers. Tasks added
+    with a key are tracked as progress, and when the manager has a store key
+    that progress is saved, so an interrupted scan can be queued again after a
+    restart.
+    """
+
+    def __init__(self, hass: HomeAssistant, store_key: str | None = None) -> None:
         self.hass = hass
-        self.queue: list[Coroutine] = []
+        self.queue: list[tuple[int, int, QueueItem]] = []
         self.running = False
+        self._counter = itertools.count()
+        self._queued_keys: set[str] = set()
+        self._progress: dict[str, int] = {}
+        self._workers: list[asyncio.Task] = []
+        self._store = get_store_for_key(hass, store_key) if store_key else None
 
     @property
     def pending_tasks(self) -> int:
@@ -33,15 +58,74 @@ class QueueManager:
         return self.pending_tasks != 0
 
     def clear(self) -> None:
-        """Clear the queue."""
+        """Clear the queue, saved progress is kept."""
+        for _, _, item in self.queue:
+            item.task.close()
         self.queue = []
-
-    def add(self, task: Coroutine) -> None:
-        """Add a task to the queue."""
-        self.queue.append(task)
-
-    async def execute(self, number_of_tasks: int | None = None) -> None:
-        """Execute the tasks in the queue."""
+        self._queued_keys = set()
+
+    def cancel(self) -> None:
+        """Cancel running tasks and clear the queue."""
+        for worker in self._workers:
+            worker.cancel()
+        self.clear()
+
+    def add(
+        self,
+        task: Coroutine,
+        *,
+        priority: int = QUEUE_PRIORITY_CATALOG,
+        key: str | None = None,
+    ) -> bool:
+        """Add a task to the queue, return False if a task with the key is queued."""
+        if key is not None:
+            if key in self._queued_keys:
+                task.close()
+                return False
+            self._queued_keys.add(key)
+            self._progress[key] = priority
+            self._async_save_progress()
+        heapq.heappush(self.queue, (priority, next(self._counter), QueueItem(task, priority, key)))
+        return True
+
+    def forget(self, key: str) -> None:
+        """Drop saved progress for a key."""
+        if self._progress.pop(key, None) is not None:
+            self._async_save_progress()
+
+    async def async_load_progress(self) -> dict[str, int]:
+        """Return keys and priorities of tasks that did not finish before the last stop."""
+        if self._store is None:
+            return {}
+        data = await self._store.async_load() or {}
+        for entry in data.get("pending", []):
+            self._progress.setdefault(entry["key"], entry.get("priority", QUEUE_PRIORITY_CATALOG))
+        return dict(self._progress)
+
+    def _async_save_progress(self) -> None:
+        if self._store is not None:
+            self._store.async_delay_save(self._progress_data, QUEUE_PROGRESS_SAVE_DELAY)
+
+    def _progress_data(self) -> dict:
+        return {
+            "pending": [
+                {"key": key, "priority": priority} for key, priority in self._progress.items()
+            ]
+        }
+
+    async def execute(
+        self,
+        number_of_tasks: int | None = None,
+        *,
+        concurrency: int | None = None,
+        keep_going: Callable[[], bool] | None = None,
+    ) -> None:
+        """Execute the tasks in the queue.
+
+        At most ``number_of_tasks`` tasks are taken from the queue, by at most
+        ``concurrency`` workers (one per task when not set). Workers stop taking
+        tasks once ``keep_going`` returns False.
+        """
         if self.running:
             _LOGGER.debug("<QueueManager> Execution is already running")
             raise HacsExecutionStillInProgress
@@ -51,32 +135,44 @@ class QueueManager:
 
         self.running = True
 
-        _LOGGER.debug("<QueueManager> Checking out tasks to execute")
-        local_queue = []
-
-        if number_of_tasks:
-            for task in self.queue[:number_of_tasks]:
-                local_queue.append(task)
-        else:
-            for task in self.queue:
-                local_queue.append(task)
-
-        _LOGGER.debug("<QueueManager> Starting queue execution for %s tasks", len(local_queue))
+        budget = min(number_of_tasks or len(self.queue), len(self.queue))
+        executed = 0
+
+        async def _worker() -> None:
+            nonlocal budget, executed
+            while self.queue and budget > 0 and (keep_going is None or keep_going()):
+                budget -= 1
+                _, _, item = heapq.heappop(self.queue)
+                if item.key is not None:
+                    self._queued_keys.discard(item.key)
+                try:
+                    await item.task
+                except Exception as exception:  # pylint: disable=broad-except
+                    _LOGGER.error("<QueueManager> %s", exception)
+                executed += 1
+                if item.key is not None and item.key not in self._queued_keys:
+                    self.forget(item.key)
+
+        workers = min(concurrency or budget, budget)
+        _LOGGER.debug(
+            "<QueueManager> Starting queue execution for %s tasks on %s workers", budget, workers
+        )
         start = time.time()
-        result = await asyncio.gather(*local_queue, return_exceptions=True)
-        for entry in result:
-            if isinstance(entry, Exception):
-                _LOGGER.error("<QueueManager> %s", entry)
-        end = time.time() - start
-
-        for task in local_queue:
-            self.queue.remove(task)
+        self._workers = [self.hass.async_create_task(_worker()) for _ in range(workers)]
+        try:
+            await asyncio.gather(*self._workers)
+        except asyncio.CancelledError:
+            if (current := asyncio.current_task()) is not None and current.cancelling():
+                raise
+            _LOGGER.debug("<QueueManager> Queue execution was cancelled")
+        finally:
+            self._workers = []
+            self.running = False
 
         _LOGGER.debug(
             "<QueueManager> Queue execution finished for %s tasks finished in %.2f seconds",
-            len(local_queue),
-            end,
+            executed,
+            time.time() - start,
         )
         if self.has_pending_tasks:
             _LOGGER.debug("<QueueManager> %s tasks remaining in the queue", len(self.queue))
-        self.running = False
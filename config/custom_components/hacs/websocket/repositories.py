@@ -13,11 +13,14 @@ from custom_components.hacs.utils import regex
 
 from ..const import DOMAIN
 from ..enums import HacsDispatchEvent
+from ..repositories.base import TOPIC_FILTER, HacsManifest
+from ..utils.version import version_left_higher_or_equal_then_right
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
-    from ..base import HacsBase
+    from ..base import HacsBase, RepositoryCatalogEntry
+    from ..repositories.base import HacsRepository
 
 
 @websocket_api.websocket_command(
@@ -35,47 +38,125 @@ async def hacs_repositories_list(
 ) -> None:
     """List repositories."""
     hacs: HacsBase = hass.data.get(DOMAIN)
+    categories = msg.get("categories", hacs.common.categories)
     connection.send_message(
         websocket_api.result_message(
             msg["id"],
             [
-                {
-                    "authors": repo.data.authors,
-                    "available_version": repo.display_available_version,
-                    "installed_version": repo.display_installed_version,
-                    "config_flow": repo.data.config_flow,
-                    "can_download": repo.can_download,
-                    "category": repo.data.category,
-                    "country": repo.repository_manifest.country,
-                    "custom": not hacs.repositories.is_default(str(repo.data.id)),
-                    "description": repo.data.description,
-                    "domain": repo.data.domain,
-                    "downloads": repo.data.downloads,
-                    "file_name": repo.data.file_name,
-                    "full_name": repo.data.full_name,
-                    "hide": repo.data.hide,
-                    "homeassistant": repo.repository_manifest.homeassistant,
-                    "id": repo.data.id,
-                    "installed": repo.data.installed,
-                    "last_updated": repo.data.last_updated,
-                    "local_path": repo.content.path.local,
-                    "name": repo.display_name,
-                    "new": repo.data.new,
-                    "pending_upgrade": repo.pending_update,
-                    "stars": repo.data.stargazers_count,
-                    "state": repo.state,
-                    "status": repo.display_status,
-                    "topics": repo.data.topics,
-                }
-                for repo in hacs.repositories.list_all
-                if repo.data.category in msg.get("categories", hacs.common.categories)
-                and not repo.ignored_by_country_configuration
+                _repository_row(hacs, repo)
+                for repo in hacs.repositories.list_by_category(categories)
+                if not repo.ignored_by_country_configuration
                 and repo.data.last_fetched
+            ]
+            + [
+                row
+                for entry in hacs.repositories.list_catalog_by_category(categories)
+                if (row := _catalog_entry_row(hacs, entry)) is not None
             ],
         )
     )
 
 
+def _repository_row(hacs: HacsBase, repo: HacsRepository) -> dict[str, Any]:
+    """Return the list row of a repository object."""
+    return {
+        "authors": repo.data.authors,
+        "available_version": repo.display_available_version,
+        "installed_version": repo.display_installed_version,
+        "config_flow": repo.data.config_flow,
+        "can_download": repo.can_download,
+        "category": repo.data.category,
+        "country": repo.repository_manifest.country,
+        "custom": not hacs.repositories.is_default(str(repo.data.id)),
+        "description": repo.data.description,
+        "domain": repo.data.domain,
+        "downloads": repo.data.downloads,
+        "file_name": repo.data.file_name,
+        "full_name": repo.data.full_name,
+        "hide": repo.data.hide,
+        "homeassistant": repo.repository_manifest.homeassistant,
+        "id": repo.data.id,
+        "installed": repo.data.installed,
+        "last_updated": repo.data.last_updated,
+        "local_path": repo.content.path.local,
+        "name": repo.display_name,
+        "new": repo.data.new,
+        "pending_upgrade": repo.pending_update,
+        "stars": repo.data.stargazers_count,
+        "state": repo.state,
+        "status": repo.display_status,
+        "topics": repo.data.topics,
+    }
+
+
+def _catalog_entry_row(hacs: HacsBase, entry: RepositoryCatalogEntry) -> dict[str, Any] | None:
+    """Return the list row of a catalog entry, None if it is not listed.
+
+    Built from the stored data so listing does not create repository objects.
+    Catalog entries are never downloaded, so the download related fields
+    have the values of a repository that is not installed.
+    """
+    data = entry.data
+    if not data.get("last_fetched"):
+        return None
+
+    manifest = HacsManifest.from_dict(
+        data.get("repository_manifest") or data.get("manifest") or {}
+    )
+    configuration = hacs.configuration.country.lower()
+    countries = [country.lower() for country in manifest.country or []]
+    if configuration != "all" and countries and configuration not in countries:
+        return None
+
+    prerelease = data.get("prerelease")
+    if data.get("show_beta") and prerelease is not None and prerelease != data.get("last_version"):
+        available = prerelease
+    else:
+        available = data.get("last_version") or data.get("last_commit") or ""
+
+    can_download = True
+    if manifest.homeassistant is not None and data.get("releases"):
+        can_download = version_left_higher_or_equal_then_right(
+            hacs.core.ha_version.string, manifest.homeassistant
+        )
+
+    if manifest.name is not None:
+        name = manifest.name
+    elif entry.category == "integration" and data.get("manifest_name") is not None:
+        name = data["manifest_name"]
+    else:
+        name = entry.full_name.split("/")[-1].replace("-", " ").replace("_", " ").title()
+
+    return {
+        "authors": data.get("authors", []),
+        "available_version": str(available),
+        "installed_version": "",
+        "config_flow": data.get("config_flow", False),
+        "can_download": can_download,
+        "category": entry.category,
+        "country": manifest.country,
+        "custom": not hacs.repositories.is_default(entry.id),
+        "description": data.get("description", ""),
+        "domain": data.get("domain"),
+        "downloads": data.get("downloads", 0),
+        "file_name": data.get("file_name", ""),
+        "full_name": entry.full_name,
+        "hide": data.get("hide", False),
+        "homeassistant": manifest.homeassistant,
+        "id": entry.id,
+        "installed": False,
+        "last_updated": data.get("last_updated", 0),
+        "local_path": None,
+        "name": name,
+        "new": data.get("new", False),
+        "pending_upgrade": False,
+        "stars": data.get("stargazers_count") or data.get("stars", 0),
+        "state": None,
+        "status": "new" if data.get("new") else "default",
+        "topics": [topic for topic in data.get("topics", []) if topic not in TOPIC_FILTER],
+    }
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "hacs/repositories/clear_new",
@@ -94,7 +175,7 @@ async def hacs_repositories_clear_new(
     hacs: HacsBase = hass.data.get(DOMAIN)
 
     if repo := msg.get("repository"):
-        repository = hacs.repositories.get_by_id(repo)
+        repository = hacs.repositories.materialize(repository_id=repo)
         repository.data.new = False
 
     else:
@@ -105,6 +186,10 @@ async def hacs_repositories_clear_new(
                     repo.data.full_name,
                 )
                 repo.data.new = False
+        for entry in hacs.repositories.list_catalog:
+            if entry.data.get("new") and entry.category in msg.get("categories", []):
+                entry.data["new"] = False
+                entry.changed = True
     hacs.async_dispatch(HacsDispatchEvent.REPOSITORY, {})
     await hacs.data.async_write()
     connection.send_message(websocket_api.result_message(msg["id"]))
@@ -162,7 +247,7 @@ async def hacs_repositories_add(
     if category not in hacs.common.categories:
         hacs.log.error("%s is not a valid category for %s", category, repository)
 
-    elif not hacs.repositories.get_by_full_name(repository):
+    elif not hacs.repositories.is_registered(repository_full_name=repository.lower()):
         try:
             await hacs.async_register_repository(
                 repository_full_name=repository,
@@ -208,7 +293,7 @@ async def hacs_repositories_remove(
 ) -> None:
     """Remove custom repositoriy."""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.materialize(repository_id=msg["repository"])
 
     repository.remove()
     await hacs.data.async_write()
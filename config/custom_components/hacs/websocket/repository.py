@@ -35,7 +35,7 @@ async def hacs_repository_info(
     """Return information about a repository."""
     hacs: HacsBase = hass.data.get(DOMAIN)
     repository_id = msg["repository_id"]
-    repository = hacs.repositories.get_by_id(repository_id)
+    repository = hacs.repositories.materialize(repository_id=repository_id)
     if repository is None:
         connection.send_error(
             msg["id"],
@@ -115,7 +115,7 @@ async def hacs_repository_ignore(
     hacs: HacsBase = hass.data.get(DOMAIN)
     repository_id = msg["repository"]
     hacs.log.info("Ignoring %s", repository_id)
-    repository = hacs.repositories.get_by_id(repository_id)
+    repository = hacs.repositories.materialize(repository_id=repository_id)
     if repository is None:
         connection.send_error(
             msg["id"],
@@ -146,7 +146,7 @@ async def hacs_repository_state(
 ) -> None:
     """Set the state of a repository"""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.materialize(repository_id=msg["repository"])
 
     repository.state = msg["state"]
 
@@ -170,7 +170,7 @@ async def hacs_repository_version(
 ) -> None:
     """Set the version of a repository"""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.materialize(repository_id=msg["repository"])
 
     if msg["version"] == repository.data.default_branch:
         repository.data.selected_tag = None
@@ -200,7 +200,7 @@ async def hacs_repository_beta(
 ) -> None:
     """Show or hide beta versions of a repository"""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.materialize(repository_id=msg["repository"])
 
     repository.data.show_beta = msg["show_beta"]
 
@@ -227,7 +227,7 @@ async def hacs_repository_download(
 ) -> None:
     """Set the version of a repository"""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.materialize(repository_id=msg["repository"])
 
     try:
         was_installed = repository.data.installed
@@ -258,7 +258,7 @@ async def hacs_repository_remove(
 ) -> None:
     """Remove a repository."""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.materialize(repository_id=msg["repository"])
 
     repository.data.new = False
     try:
@@ -286,7 +286,7 @@ async def hacs_repository_refresh(
 ) -> None:
     """Refresh a repository."""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.materialize(repository_id=msg["repository"])
 
     await repository.update_repository(ignore_issues=True, force=True)
     await hacs.data.async_write()
@@ -311,7 +311,7 @@ async def hacs_repository_release_notes(
 ) -> None:
     """Return release notes."""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.materialize(repository_id=msg["repository"])
 
     connection.send_message(
         websocket_api.result_message(
@@ -345,7 +345,7 @@ async def hacs_repository_releases(
 ) -> None:
     """Return releases."""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository_id"])
+    repository = hacs.repositories.materialize(repository_id=msg["repository_id"])
     try:
         releases = await repository.async_get_releases()
     except Exception as exception:
@@ -0,0 +1,38 @@
+"""Shifts heat pump hot water and space heating into cheap hours."""
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.typing import ConfigType
+
+from .const import ATTR_MODE, DOMAIN, MODE_AUTO, MODE_PLAN, SERVICE_RUN
+from .coordinator import HeatPumpSchedulerCoordinator
+
+CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
+
+RUN_SCHEMA = vol.Schema({vol.Optional(ATTR_MODE, default=MODE_AUTO): vol.In([MODE_AUTO, MODE_PLAN])})
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the run service and the plan sensor."""
+    coordinator = HeatPumpSchedulerCoordinator(hass)
+    hass.data[DOMAIN] = coordinator
+
+    async def _async_run(call: ServiceCall) -> ServiceResponse:
+        result = await coordinator.async_run(call.data[ATTR_MODE])
+        if not call.return_response:
+            return None
+        if result is None:
+            raise HomeAssistantError("Heat pump scheduler failed, see the log")
+        return result
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_RUN, _async_run, schema=RUN_SCHEMA, supports_response=SupportsResponse.OPTIONAL
+    )
+    hass.async_create_task(async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config))
+    return True
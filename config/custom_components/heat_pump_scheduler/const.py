@@ -0,0 +1,13 @@
+"""Constants for the Heat Pump Scheduler integration."""
+
+DOMAIN = "heat_pump_scheduler"
+
+SERVICE_RUN = "run"
+ATTR_MODE = "mode"
+MODE_AUTO = "auto"
+MODE_PLAN = "plan"
+
+# ML consumption profile, relative to the config directory
+PROFILE_PATH = "data/ml_hourly_profile.json"
+
+SIGNAL_PLAN_UPDATED = f"{DOMAIN}_updated"
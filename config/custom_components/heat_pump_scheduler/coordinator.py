@@ -0,0 +1,51 @@
+"""Runs the heat pump scheduler engine and keeps the current plan."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from . import engine
+from .const import MODE_AUTO, PROFILE_PATH, SIGNAL_PLAN_UPDATED
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HeatPumpSchedulerCoordinator:
+    """Runs the engine one pass at a time in the executor.
+
+    A pass reads the ML profile from disk and calls the climate and switch
+    services, so it never runs in the event loop. The result of the last
+    pass is handed to the next one, which keeps the plan and base setpoint
+    across hours.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self.result: dict[str, Any] | None = None
+        self._profile_path = hass.config.path(PROFILE_PATH)
+        self._lock = asyncio.Lock()
+
+    def _run(self, mode: str, previous: dict[str, Any] | None) -> dict[str, Any]:
+        """One engine pass (executor thread)."""
+        engine.hass = self.hass
+        try:
+            return engine.run_scheduler(mode, previous, self._profile_path)
+        finally:
+            engine.hass = None
+
+    async def async_run(self, mode: str = MODE_AUTO) -> dict[str, Any] | None:
+        """Update the plan and apply the current hour; None if the pass failed."""
+        async with self._lock:
+            try:
+                result = await self.hass.async_add_executor_job(self._run, mode, self.result)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Heat pump scheduler failed")
+                return None
+            self.result = result
+        _LOGGER.debug("Heat pump plan (%s): CWU %s", mode, result["cwu_hours"])
+        async_dispatcher_send(self.hass, SIGNAL_PLAN_UPDATED)
+        return result
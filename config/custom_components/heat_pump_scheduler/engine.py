@@ -0,0 +1,381 @@
+"""
+Harmonogram pompy ciepła (Aquarea) - przesuwanie CWU i ogrzewania do tanich godzin
+
+Plan na 24h liczony raz dziennie (21:10, obejmuje 21:00-20:59 następnego dnia), potem co godzinę:
+- przeliczany przyrostowo (tylko godziny od teraz) gdy zmieniły się ceny RCE
+  lub temperatura zewnętrzna,
+- wykonywany dla bieżącej godziny (jeśli input_boolean.pc_harmonogram_aktywny).
+
+Wejścia:
+- Taryfa G12w (L1/L2) + ceny RCE PSE (sensor.rce_pse_cena, sensor.rce_pse_cena_jutro)
+- Temperatura zewnętrzna, sezon grzewczy
+- Profil zużycia ML (data/ml_hourly_profile.json)
+
+Silnik integracji heat_pump_scheduler (wcześniej python_scripts/heat_pump_scheduler.py).
+Moduł importowany raz; `hass` ustawia HeatPumpSchedulerCoordinator przed każdym
+przebiegiem, run_scheduler() liczy plan i zwraca go zamiast zapisywać stan encji.
+Plan pokazuje sensor.plan_pompy_ciepla (atrybut 'plan').
+
+Data: 2026-10-19
+"""
+
+import logging
+import json
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+# Ustawiane przez koordynator (lub testy) przed wywołaniem run_scheduler()
+hass = None
+
+# ============================================
+# KONFIGURACJA
+# ============================================
+
+ENABLE_ENTITY = 'input_boolean.pc_harmonogram_aktywny'
+ZONE_ENTITY = 'climate.bodynek_nb_zone_1'
+TANK_ENTITY = 'water_heater.bodynek_nb_tank'
+CWU_FORCE_SWITCH = 'switch.bodynek_nb_wymus_c_w_u'
+
+# Ceny G12w (PLN/kWh, brutto z dystrybucją)
+TARIFF_PRICES = {'L1': 1.16, 'L2': 0.78}
+
+# Okna CWU: (pierwsza godzina, liczba godzin) - grzanie przed porannym i wieczornym poborem
+CWU_WINDOWS = [(22, 8), (10, 7)]
+
+# Granice komfortu względem nastawy bazowej strefy (°C)
+PREHEAT_OFFSET = 2
+SETBACK_OFFSET = 2
+# Ile godzin przed obniżeniem można podgrzewać
+PREHEAT_LOOKBACK = 3
+
+TEMP_HEATING_THRESHOLD = 12  # °C - powyżej nie ogrzewamy (jak w battery_algorithm)
+
+DEFAULT_HOURLY_PROFILE = {str(h): 1.2 for h in range(24)}
+
+
+# ============================================
+# DANE WEJŚCIOWE
+# ============================================
+
+def is_workday(dt):
+    """Dzień roboczy wg binary_sensor.dzien_roboczy (dla dzisiaj) lub kalendarza."""
+    if dt.date() == datetime.now().date():
+        workday_state = hass.states.get('binary_sensor.dzien_roboczy')
+        if workday_state and workday_state.state in ('on', 'off'):
+            return workday_state.state == 'on'
+    return dt.weekday() < 5
+
+
+def get_tariff_zone(dt):
+    """Strefa G12w dla godziny (L2: 22-06, 13-15 oraz weekendy/święta)."""
+    if not is_workday(dt):
+        return 'L2'
+    if dt.hour >= 22 or dt.hour < 6 or 13 <= dt.hour < 15:
+        return 'L2'
+    return 'L1'
+
+
+def get_float_state(entity_id, default):
+    state = hass.states.get(entity_id)
+    if not state or state.state in ('unknown', 'unavailable', None):
+        return default
+    try:
+        return float(state.state)
+    except (ValueError, TypeError):
+        return default
+
+
+def get_rce_hourly():
+    """
+    Średnie godzinowe RCE (PLN/kWh) z 15-minutowych okresów.
+    Klucz: 'YYYY-MM-DD HH'. dtime to KONIEC okresu.
+    """
+    sums = {}
+    counts = {}
+    for entity_id in ('sensor.rce_pse_cena', 'sensor.rce_pse_cena_jutro'):
+        sensor = hass.states.get(entity_id)
+        if not sensor:
+            continue
+        for entry in sensor.attributes.get('prices', []) or []:
+            try:
+                end = datetime.strptime(str(entry['dtime'])[:16], '%Y-%m-%d %H:%M')
+                price = float(entry['rce_pln'])
+            except (KeyError, ValueError, TypeError):
+                continue
+            price = price / 1000  # rce_pln jest zawsze w PLN/MWh
+            key = (end - timedelta(minutes=15)).strftime('%Y-%m-%d %H')
+            sums[key] = sums.get(key, 0.0) + price
+            counts[key] = counts.get(key, 0) + 1
+    return {key: round(sums[key] / counts[key], 4) for key in sums}
+
+
+def load_ml_profile(path):
+    """Profil godzinowy ML (jak w calculate_daily_strategy). Czyta plik - tylko w executorze."""
+    if path is None:
+        return None
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"Could not load ML profile: {e}, using default")
+        return None
+
+
+def predicted_consumption(profile, dt):
+    weekday_profile = profile.get('by_hour', DEFAULT_HOURLY_PROFILE) if profile else DEFAULT_HOURLY_PROFILE
+    weekend_profile = profile.get('by_hour_weekend') if profile else None
+    if not is_workday(dt) and weekend_profile:
+        return float(weekend_profile.get(str(dt.hour), 1.2))
+    return float(weekday_profile.get(str(dt.hour), 1.2))
+
+
+# ============================================
+# PLANOWANIE
+# ============================================
+
+def build_hours(start, rce_hourly, profile):
+    """Godziny planu z kosztem: taryfa + RCE (utracony przychód z eksportu)."""
+    # Brak ceny RCE (np. jutro przed publikacją) = średnia znanych, żeby nie faworyzować
+    rce_default = sum(rce_hourly.values()) / len(rce_hourly) if rce_hourly else 0.0
+    hours = []
+    for i in range(24):
+        dt = start + timedelta(hours=i)
+        tariff = get_tariff_zone(dt)
+        rce = rce_hourly.get(dt.strftime('%Y-%m-%d %H'))
+        hours.append({
+            'hour': dt.strftime('%Y-%m-%d %H:00'),
+            'dt': dt,
+            'tariff': tariff,
+            'rce': rce,
+            'cost': round(TARIFF_PRICES[tariff] + (rce if rce is not None else rce_default), 4),
+            'consumption': round(predicted_consumption(profile, dt), 2),
+        })
+    return hours
+
+
+def pick_cwu_hours(hours):
+    """Najtańsza godzina w każdym oknie CWU."""
+    picked = set()
+    for first_hour, length in CWU_WINDOWS:
+        candidates = [
+            h for h in hours
+            if (h['dt'].hour - first_hour) % 24 < length
+        ]
+        if candidates:
+            best = min(candidates, key=lambda h: (h['cost'], h['dt']))
+            picked.add(best['hour'])
+    return picked
+
+
+def setback_hour_count(temp_outdoor):
+    """Im zimniej, tym krócej można obniżać (budynek szybciej stygnie)."""
+    if temp_outdoor >= 5:
+        return 4
+    if temp_outdoor >= 0:
+        return 3
+    if temp_outdoor >= -10:
+        return 2
+    return 0
+
+
+def plan_heating(hours, temp_outdoor, heating):
+    """
+    Obniżenie w drogich godzinach L1 o największym zużyciu (mniej cykli baterii),
+    podgrzanie w najtańszych godzinach tuż przed nimi. Zwraca {hour: offset}.
+    """
+    offsets = {}
+    if not heating:
+        return offsets
+
+    expensive = sorted(
+        [h for h in hours if h['tariff'] == 'L1'],
+        key=lambda h: (-h['consumption'], -h['cost'], h['dt'])
+    )
+    setback = expensive[:setback_hour_count(temp_outdoor)]
+    for h in setback:
+        offsets[h['hour']] = -SETBACK_OFFSET
+
+    index = {h['hour']: i for i, h in enumerate(hours)}
+    for h in setback:
+        i = index[h['hour']]
+        before = [
+            hours[j] for j in range(max(0, i - PREHEAT_LOOKBACK), i)
+            if hours[j]['hour'] not in offsets
+        ]
+        if before:
+            best = min(before, key=lambda c: (c['cost'], -index[c['hour']]))
+            if best['cost'] < h['cost']:
+                offsets[best['hour']] = PREHEAT_OFFSET
+    return offsets
+
+
+def make_plan(start, base_setpoint, temp_outdoor, heating, rce_hourly, profile, min_temp=None, max_temp=None):
+    """Plan 24h od 'start'. Nastawy ograniczone do zakresu strefy."""
+    hours = build_hours(start, rce_hourly, profile)
+    cwu_hours = pick_cwu_hours(hours)
+    offsets = plan_heating(hours, temp_outdoor, heating)
+
+    plan = []
+    for h in hours:
+        offset = offsets.get(h['hour'], 0)
+        setpoint = None
+        if heating and base_setpoint is not None:
+            setpoint = base_setpoint + offset
+            if min_temp is not None:
+                setpoint = max(min_temp, setpoint)
+            if max_temp is not None:
+                setpoint = min(max_temp, setpoint)
+        if offset > 0:
+            reason = 'podgrzanie przed drogą godziną'
+        elif offset < 0:
+            reason = 'obniżenie w drogiej godzinie L1'
+        else:
+            reason = ''
+        plan.append({
+            'hour': h['hour'],
+            'tariff': h['tariff'],
+            'rce': h['rce'],
+            'cost': h['cost'],
+            'offset': offset,
+            'setpoint': setpoint,
+            'cwu': h['hour'] in cwu_hours,
+            'reason': reason,
+        })
+    return plan
+
+
+def replan(previous_plan, now_hour, new_plan):
+    """Zachowaj wykonane godziny starego planu, resztę zastąp nowym."""
+    current_key = now_hour.strftime('%Y-%m-%d %H:00')
+    kept = [p for p in previous_plan if p['hour'] < current_key]
+    return kept + [p for p in new_plan if p['hour'] >= current_key]
+
+
+def prices_checksum(rce_hourly):
+    """Suma kontrolna godzin i cen - stała między restartami (hash() str nie jest)."""
+    checksum = 0
+    for key in sorted(rce_hourly):
+        for char in key:
+            checksum = (checksum * 31 + ord(char)) % 1000000007
+        checksum = (checksum * 31 + int(round(rce_hourly[key] * 10000))) % 1000000007
+    return checksum
+
+
+def inputs_signature(rce_hourly, temp_outdoor, heating):
+    """Zmiana sygnatury = przeliczenie planu (inne ceny, skok temperatury > 3°C)."""
+    return f"{prices_checksum(rce_hourly)}|{int(temp_outdoor // 3)}|{'H' if heating else '-'}"
+
+
+def rebase_setpoint(base_setpoint, zone_setpoint, applied_setpoint):
+    """
+    Nastawa bazowa na plan dobowy.
+    Strefa trzyma nastawę wpisaną przez harmonogram (z offsetem) -> baza bez zmian,
+    inna nastawa = zmiana ręczna -> nowa baza. Bez tego o 21:10 bazą zostawało
+    obniżenie z 21:00 i baza spadała co dobę.
+    """
+    if zone_setpoint is None:
+        return base_setpoint
+    if base_setpoint is not None and applied_setpoint is not None and float(zone_setpoint) == float(applied_setpoint):
+        return base_setpoint
+    return float(zone_setpoint)
+
+
+# ============================================
+# WYKONANIE
+# ============================================
+
+def apply_current_hour(plan, now_hour):
+    key = now_hour.strftime('%Y-%m-%d %H:00')
+    entry = next((p for p in plan if p['hour'] == key), None)
+    if entry is None:
+        return None
+
+    zone = hass.states.get(ZONE_ENTITY)
+    if entry['setpoint'] is not None and zone and zone.state not in ('unavailable', 'unknown', 'off'):
+        current = zone.attributes.get('temperature')
+        if current is None or float(current) != float(entry['setpoint']):
+            hass.services.call('climate', 'set_temperature', {
+                'entity_id': ZONE_ENTITY,
+                'temperature': entry['setpoint'],
+            })
+
+    if entry['cwu']:
+        tank = hass.states.get(TANK_ENTITY)
+        if tank and tank.state not in ('unavailable', 'heating'):
+            current = tank.attributes.get('current_temperature')
+            target = tank.attributes.get('temperature')
+            if current is not None and target is not None and float(current) < float(target):
+                # Wyłączenie po osiągnięciu temp. celu robi automatyzacja cwu_manual_force_auto_off
+                hass.services.call('switch', 'turn_on', {'entity_id': CWU_FORCE_SWITCH})
+    return entry
+
+
+def run_scheduler(mode='auto', previous=None, profile_path=None):
+    """
+    mode='plan'  - pełny plan na 24h od bieżącej godziny
+    mode='auto'  - przeliczenie przyrostowe jeśli wejścia się zmieniły + wykonanie
+
+    previous: wynik poprzedniego przebiegu (plan i nastawy), None po starcie bez historii.
+    Zwraca nowy wynik; koordynator trzyma go i pokazuje w sensorze.
+    """
+    now = datetime.now()
+    now_hour = now.replace(minute=0, second=0, microsecond=0)
+
+    temp_outdoor = get_float_state('sensor.temperatura_zewnetrzna', 10.0)
+    heating_state = hass.states.get('binary_sensor.sezon_grzewczy')
+    heating = bool(heating_state and heating_state.state == 'on') and temp_outdoor < TEMP_HEATING_THRESHOLD
+    rce_hourly = get_rce_hourly()
+    signature = inputs_signature(rce_hourly, temp_outdoor, heating)
+
+    previous_attrs = previous or {}
+    previous_plan = previous_attrs.get('plan') or []
+    base_setpoint = previous_attrs.get('base_setpoint')
+    applied_setpoint = previous_attrs.get('applied_setpoint')
+
+    zone = hass.states.get(ZONE_ENTITY)
+    min_temp = zone.attributes.get('min_temp') if zone else None
+    max_temp = zone.attributes.get('max_temp') if zone else None
+
+    plan_end = previous_plan[-1]['hour'] if previous_plan else ''
+    needs_full_plan = mode == 'plan' or not previous_plan or plan_end < now_hour.strftime('%Y-%m-%d %H:00')
+
+    if needs_full_plan:
+        zone_setpoint = zone.attributes.get('temperature') if zone else None
+        base_setpoint = rebase_setpoint(base_setpoint, zone_setpoint, applied_setpoint)
+        plan = make_plan(now_hour, base_setpoint, temp_outdoor, heating, rce_hourly,
+                         load_ml_profile(profile_path), min_temp, max_temp)
+        planned_at = now.isoformat()
+    elif previous_attrs.get('signature') != signature:
+        new_plan = make_plan(now_hour, base_setpoint, temp_outdoor, heating, rce_hourly,
+                             load_ml_profile(profile_path), min_temp, max_temp)
+        plan = replan(previous_plan, now_hour, new_plan)
+        planned_at = now.isoformat()
+    else:
+        plan = previous_plan
+        planned_at = previous_attrs.get('planned_at')
+
+    enabled_state = hass.states.get(ENABLE_ENTITY)
+    current = None
+    if enabled_state and enabled_state.state == 'on':
+        current = apply_current_hour(plan, now_hour)
+    if current and current['setpoint'] is not None:
+        applied_setpoint = current['setpoint']
+
+    cwu_hours = [p['hour'][11:16] for p in plan if p['cwu'] and p['hour'] >= now_hour.strftime('%Y-%m-%d %H:00')]
+    preheat_hours = [p['hour'][11:16] for p in plan if p['offset'] > 0]
+    setback_hours = [p['hour'][11:16] for p in plan if p['offset'] < 0]
+
+    return {
+        'plan': plan,
+        'cwu_hours': cwu_hours,
+        'preheat_hours': preheat_hours,
+        'setback_hours': setback_hours,
+        'base_setpoint': base_setpoint,
+        'applied_setpoint': applied_setpoint,
+        'temp_outdoor': temp_outdoor,
+        'heating': heating,
+        'signature': signature,
+        'planned_at': planned_at,
+        'applied_hour': current['hour'] if current else None,
+    }
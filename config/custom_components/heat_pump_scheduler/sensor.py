@@ -0,0 +1,64 @@
+"""Heat pump plan sensor: hot water hours today, the full 24 h plan in attributes."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from .const import DOMAIN, SIGNAL_PLAN_UPDATED
+from .coordinator import HeatPumpSchedulerCoordinator
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the plan sensor."""
+    if discovery_info is None:
+        return
+    async_add_entities([HeatPumpPlanSensor(hass.data[DOMAIN])])
+
+
+class HeatPumpPlanSensor(RestoreEntity, SensorEntity):
+    """Upcoming hot water hours; the plan, setpoints and inputs as attributes.
+
+    The last plan is restored at startup, so the base setpoint survives a
+    restart instead of being taken from a zone that may be in a setback hour.
+    """
+
+    _attr_name = "Plan pompy ciepła"
+    _attr_unique_id = f"{DOMAIN}_plan"
+    _attr_icon = "mdi:heat-pump"
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"plan"})
+
+    def __init__(self, coordinator: HeatPumpSchedulerCoordinator):
+        self._coordinator = coordinator
+
+    async def async_added_to_hass(self) -> None:
+        if self._coordinator.result is None and (last := await self.async_get_last_state()) is not None:
+            if last.attributes.get("plan"):
+                self._coordinator.result = {
+                    key: value for key, value in last.attributes.items() if key not in ("friendly_name", "icon")
+                }
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_PLAN_UPDATED, self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> str | None:
+        result = self._coordinator.result
+        if result is None:
+            return None
+        return f"CWU {', '.join(result.get('cwu_hours', [])) or '-'}"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return dict(self._coordinator.result or {})
@@ -30,9 +30,10 @@ from .const import (
     STARTUP,
     DATA_COORDINATORS,
     ENERGY_COORDINATORS,
-    AQUAREA_COORDINATORS)
+    AQUAREA_COORDINATORS,
+    DEVICE_SETUP_CONCURRENCY)
 
-from .coordinator import PanasonicDeviceCoordinator, PanasonicDeviceEnergyCoordinator, AquareaDeviceCoordinator
+from .coordinator import PanasonicDeviceCoordinator, PanasonicDeviceEnergyCoordinator, AquareaDeviceCoordinator, PanasonicDevicePoller
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -103,22 +104,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         return False
 
     _LOGGER.info("Got %s devices", len(devices))
-    data_coordinators: list[PanasonicDeviceCoordinator] = []
-    energy_coordinators: list[PanasonicDeviceEnergyCoordinator] = []
-    aquarea_coordinators: list[AquareaDeviceCoordinator] = []
-
-
-    for device in devices:
-        try:
-            device_coordinator = PanasonicDeviceCoordinator(hass, conf, api, device)
-            await device_coordinator.async_config_entry_first_refresh()
-            data_coordinators.append(device_coordinator)
-            if enable_daily_energy_sensor:
-                energy_coordinators.append(PanasonicDeviceEnergyCoordinator(hass, conf, api, device))
-        except Exception as e:
-            _LOGGER.warning(f"Failed to setup device: {device.name} ({e})", exc_info=e)
-
-    if api.has_unknown_devices or AQUAREA_DEMO:
+    # First refreshes are cloud round-trips, run them concurrently but bounded
+    semaphore = asyncio.Semaphore(DEVICE_SETUP_CONCURRENCY)
+
+    async def setup_device(device) -> PanasonicDeviceCoordinator | None:
+        async with semaphore:
+            try:
+                device_coordinator = PanasonicDeviceCoordinator(hass, conf, api, device)
+                await device_coordinator.async_config_entry_first_refresh()
+                return device_coordinator
+            except Exception as e:
+                _LOGGER.warning(f"Failed to setup device: {device.name} ({e})", exc_info=e)
+                return None
+
+    async def setup_aquarea_device(aquarea_api_client, aquarea_device) -> AquareaDeviceCoordinator | None:
+        async with semaphore:
+            try:
+                aquarea_device_coordinator = AquareaDeviceCoordinator(hass, conf, aquarea_api_client, aquarea_device)
+                await aquarea_device_coordinator.async_config_entry_first_refresh()
+                return aquarea_device_coordinator
+            except Exception as e:
+                _LOGGER.warning(f"Failed to setup Aquarea device: {aquarea_device.name} ({e})", exc_info=e)
+                return None
+
+    async def setup_aquarea() -> list[AquareaDeviceCoordinator]:
+        if not (api.has_unknown_devices or AQUAREA_DEMO):
+            return []
         try:
             
             if not AQUAREA_DEMO:
@@ -129,27 +140,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
                 aquarea_api_client._access_token = 'dummy'
                 aquarea_api_client._token_expiration = None
             aquarea_devices = await aquarea_api_client.get_devices(include_long_id=True)
-            for aquarea_device in aquarea_devices:
-                try:
-                    aquarea_device_coordinator = AquareaDeviceCoordinator(hass, conf, aquarea_api_client, aquarea_device)
-                    await aquarea_device_coordinator.async_config_entry_first_refresh()
-                    aquarea_coordinators.append(aquarea_device_coordinator)
-                except Exception as e:
-                    _LOGGER.warning(f"Failed to setup Aquarea device: {aquarea_device.name} ({e})", exc_info=e)
+            results = await asyncio.gather(
+                *(setup_aquarea_device(aquarea_api_client, aquarea_device) for aquarea_device in aquarea_devices)
+            )
+            return [coordinator for coordinator in results if coordinator is not None]
         except Exception as e:
             _LOGGER.warning(f"Failed to setup Aquarea: {e}", exc_info=e)
+            return []
+
+    # Comfort Cloud devices and Aquarea login/discovery run side by side
+    device_results, aquarea_coordinators = await asyncio.gather(
+        asyncio.gather(*(setup_device(device) for device in devices)),
+        setup_aquarea(),
+    )
+
+    data_coordinators: list[PanasonicDeviceCoordinator] = []
+    energy_coordinators: list[PanasonicDeviceEnergyCoordinator] = []
+    # One poller per ApiClient refreshes all devices together
+    poller = PanasonicDevicePoller(hass, conf, api)
+    for device, device_coordinator in zip(devices, device_results):
+        if device_coordinator is None:
+            continue
+        data_coordinators.append(device_coordinator)
+        poller.register(device_coordinator)
+        if enable_daily_energy_sensor:
+            energy_coordinators.append(PanasonicDeviceEnergyCoordinator(hass, conf, api, device))
 
 
     hass.data[DOMAIN][DATA_COORDINATORS] = data_coordinators
     hass.data[DOMAIN][ENERGY_COORDINATORS] = energy_coordinators
     hass.data[DOMAIN][AQUAREA_COORDINATORS] = aquarea_coordinators
-    await asyncio.gather(
+    results = await asyncio.gather(
         *(
             data.async_config_entry_first_refresh()
             for data in energy_coordinators
         ),
         return_exceptions=True
     )
+    for energy_coordinator, result in zip(energy_coordinators, results):
+        if isinstance(result, Exception):
+            _LOGGER.warning("First energy refresh of %s failed: %s", energy_coordinator.device_name, result)
+
+    entry.async_on_unload(poller.start())
 
     await hass.config_entries.async_forward_entry_setups(entry, COMPONENT_TYPES)
     return True
@@ -339,7 +339,6 @@ class PanasonicClimateEntity(PanasonicDataEntity, ClimateEntity):
         builder = self.coordinator.get_change_request_builder()
         builder.set_power_mode(constants.Power.On)
         await self.coordinator.async_apply_changes(builder)
-        await self.coordinator.async_request_refresh()
         self.async_write_ha_state()
 
     async def async_turn_off(self) -> None:
@@ -393,7 +392,6 @@ class PanasonicClimateEntity(PanasonicDataEntity, ClimateEntity):
             await self._async_enter_summer_house_mode(builder)
         await self.coordinator.async_apply_changes(builder)
         self._update_attributes(builder)
-        await self.coordinator.async_request_refresh()
         
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new target fan mode."""
@@ -120,4 +120,8 @@ CONF_UPDATE_INTERVAL_VERSION = "update_interval_version"
 DEFAULT_DEVICE_FETCH_INTERVAL = 120
 DEFAULT_ENERGY_FETCH_INTERVAL = 300
 CONF_FORCE_ENABLE_NANOE = "force_enable_nanoe"
-DEFAULT_FORCE_ENABLE_NANOE = False
\ No newline at end of file
+DEFAULT_FORCE_ENABLE_NANOE = False
+DEVICE_SETUP_CONCURRENCY = 4
+DEVICE_POLL_CONCURRENCY = 3
+CHANGE_REQUEST_DEBOUNCE = 0.3  # seconds
+ENERGY_HISTORY_SAVE_DELAY = 60  # seconds
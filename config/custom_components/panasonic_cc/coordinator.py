@@ -1,7 +1,9 @@
+import asyncio
 import logging
 
 from datetime import timedelta
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.storage import Store
@@ -11,7 +13,8 @@ from aio_panasonic_comfort_cloud import ApiClient, PanasonicDevice, PanasonicDev
 from aioaquarea import Client as AquareaApiClient, Device as AquareaDevice, AquareaEnvironment
 from aioaquarea.data import DeviceInfo as AquareaDeviceInfo
 
-from .const import DOMAIN,MANUFACTURER, DEFAULT_DEVICE_FETCH_INTERVAL, CONF_DEVICE_FETCH_INTERVAL, CONF_ENERGY_FETCH_INTERVAL, DEFAULT_ENERGY_FETCH_INTERVAL
+from .const import DOMAIN,MANUFACTURER, DEFAULT_DEVICE_FETCH_INTERVAL, CONF_DEVICE_FETCH_INTERVAL, CONF_ENERGY_FETCH_INTERVAL, DEFAULT_ENERGY_FETCH_INTERVAL, DEVICE_POLL_CONCURRENCY, CHANGE_REQUEST_DEBOUNCE, ENERGY_HISTORY_SAVE_DELAY
+from .energy_history import HourlyEnergyHistory, ENERGY_FIELDS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +35,9 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
         self._device:PanasonicDevice | None = None
         self._store = Store(hass, version=1, key=f"panasonic_cc_{device_info.id}")
         self._update_id = 0
+        # Write buffer: changes arriving within CHANGE_REQUEST_DEBOUNCE share one set_device_raw call
+        self._pending_changes: dict = {}
+        self._pending_write: asyncio.Future | None = None
         
         
     @property
@@ -48,6 +54,10 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
     def device_id(self) -> str:
         return self._panasonic_device_info.id
 
+    @property
+    def device_name(self) -> str:
+        return self._panasonic_device_info.name
+
     
     @property
     def device_info(self)->DeviceInfo:
@@ -63,7 +73,33 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
         return ChangeRequestBuilder(self.device)
     
     async def async_apply_changes(self, request_builder: ChangeRequestBuilder):
-        await self._api_client.set_device_raw(self.device, request_builder.build())
+        """Queue the changes and wait until the merged write has been sent.
+
+        Later changes to the same parameter win. One refresh follows the write.
+        """
+        self._pending_changes.update(request_builder.build())
+        if self._pending_write is None:
+            self._pending_write = self._hass.loop.create_future()
+            self._hass.loop.call_later(CHANGE_REQUEST_DEBOUNCE, self._schedule_write)
+        # Shield so a cancelled service call does not drop the other queued changes
+        await asyncio.shield(self._pending_write)
+
+    def _schedule_write(self):
+        self._hass.async_create_task(self._async_write_changes())
+
+    async def _async_write_changes(self):
+        changes, pending_write = self._pending_changes, self._pending_write
+        self._pending_changes = {}
+        self._pending_write = None
+        try:
+            _LOGGER.debug("%s: sending %d merged parameter changes", self._panasonic_device_info.name, len(changes))
+            await self._api_client.set_device_raw(self.device, changes)
+        except Exception as e:
+            _LOGGER.error("Error sending changes to %s: %s", self._panasonic_device_info.name, e)
+            pending_write.set_exception(e)
+            return
+        pending_write.set_result(None)
+        await self.async_request_refresh()
 
     async def async_get_stored_data(self):
         data = await self._store.async_load()
@@ -95,6 +131,74 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
             raise UpdateFailed(f"Invalid response from API: {e}") from e
         return self._update_id
 
+    async def async_poll_update(self):
+        """Update the device as part of a PanasonicDevicePoller burst."""
+        try:
+            update_id = await self._fetch_device_data()
+        except UpdateFailed as e:
+            self.async_set_update_error(e)
+            return
+        self.async_set_updated_data(update_id)
+
+
+class PanasonicDevicePoller:
+    """Polls every device of one ApiClient in a single aligned burst.
+
+    The coordinators lose their own timers, so N devices are polled together
+    once per interval instead of on N timers spread across it. The library has
+    no bulk status call, so the burst is a bounded set of concurrent
+    try_update_device calls.
+    """
+
+    def __init__(self, hass: HomeAssistant, config: dict, api_client: ApiClient):
+        self._hass = hass
+        self._api_client = api_client
+        self._interval = timedelta(seconds=config.get(CONF_DEVICE_FETCH_INTERVAL, DEFAULT_DEVICE_FETCH_INTERVAL))
+        self._coordinators: list[PanasonicDeviceCoordinator] = []
+        self._semaphore = asyncio.Semaphore(DEVICE_POLL_CONCURRENCY)
+        self._polling = False
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @property
+    def api_client(self) -> ApiClient:
+        return self._api_client
+
+    def register(self, coordinator: PanasonicDeviceCoordinator):
+        """Take over polling of a coordinator."""
+        coordinator.update_interval = None
+        self._coordinators.append(coordinator)
+
+    def start(self) -> CALLBACK_TYPE:
+        """Start the poll timer, returns the stop callback."""
+        self.stop()
+        self._unsub = async_track_time_interval(self._hass, self._async_poll, self._interval)
+        return self.stop
+
+    def stop(self):
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    async def _async_poll_device(self, coordinator: PanasonicDeviceCoordinator):
+        async with self._semaphore:
+            await coordinator.async_poll_update()
+
+    async def _async_poll(self, _now=None):
+        if self._polling:
+            _LOGGER.debug("Previous device poll still running, skipping")
+            return
+        self._polling = True
+        try:
+            results = await asyncio.gather(
+                *(self._async_poll_device(coordinator) for coordinator in self._coordinators),
+                return_exceptions=True
+            )
+            for coordinator, result in zip(self._coordinators, results):
+                if isinstance(result, Exception):
+                    _LOGGER.error("Error polling %s: %s", coordinator.device_name, result, exc_info=result)
+        finally:
+            self._polling = False
+
 class PanasonicDeviceEnergyCoordinator(DataUpdateCoordinator[int]):
 
     def __init__(self, hass: HomeAssistant, config: dict, api_client: ApiClient, device_info: PanasonicDeviceInfo):
@@ -111,6 +215,8 @@ class PanasonicDeviceEnergyCoordinator(DataUpdateCoordinator[int]):
         self._panasonic_device_info = device_info
         self._energy: PanasonicDeviceEnergy | None = None
         self._update_id = 0
+        self._store = Store(hass, version=1, key=f"panasonic_cc_energy_{device_info.id}")
+        self._history: HourlyEnergyHistory | None = None
 
     @property
     def api_client(self) -> ApiClient:
@@ -119,10 +225,18 @@ class PanasonicDeviceEnergyCoordinator(DataUpdateCoordinator[int]):
     @property
     def device_id(self) -> str:
         return self._panasonic_device_info.id
+
+    @property
+    def device_name(self) -> str:
+        return self._panasonic_device_info.name
     
     @property
     def energy(self) -> PanasonicDeviceEnergy | None:
         return self._energy
+
+    @property
+    def history(self) -> HourlyEnergyHistory | None:
+        return self._history
     
     @property
     def device_info(self)->DeviceInfo:
@@ -135,19 +249,32 @@ class PanasonicDeviceEnergyCoordinator(DataUpdateCoordinator[int]):
         )
 
     async def _fetch_device_data(self)->int:
+        if self._history is None:
+            self._history = HourlyEnergyHistory.from_dict(await self._store.async_load())
         try:
             if self._energy is None:
                 self._energy = await self._api_client.async_get_energy(self._panasonic_device_info)
+                self._record_history()
                 self._update_id = 1
                 return self._update_id
             if await self._api_client.async_try_update_energy(self._energy):
+               self._record_history()
                self._update_id = self._update_id + 1
                return self._update_id
         except BaseException as e:
             _LOGGER.error("Error fetching energy data from API: %s", e, exc_info=e)
             raise UpdateFailed(f"Invalid response from API: {e}") from e
         return self._update_id
-    
+
+    def _record_history(self):
+        """Merge the latest daily totals into the hourly history and schedule a save."""
+        if self._energy is None or self._history is None:
+            return
+        totals = {field: getattr(self._energy, field, None) for field in ENERGY_FIELDS}
+        self._history.add_reading(dt_util.now(), totals)
+        # The last reading is saved too, so a restart does not count the day again
+        self._store.async_delay_save(self._history.as_dict, ENERGY_HISTORY_SAVE_DELAY)
+
 
 class AquareaDeviceCoordinator(DataUpdateCoordinator):
 
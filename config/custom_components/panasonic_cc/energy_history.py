@@ -0,0 +1,140 @@
+"""Per-hour energy history of a Comfort Cloud device, built from daily totals."""
+from datetime import date, datetime, timedelta
+from typing import Any
+
+HOURS_PER_DAY = 24
+# Daily cumulative fields of PanasonicDeviceEnergy tracked per hour
+ENERGY_FIELDS = ("consumption", "heating_consumption", "cooling_consumption")
+DEFAULT_RETENTION_DAYS = 35
+
+
+def _empty_day() -> dict[str, list[float]]:
+    return {field: [0.0] * HOURS_PER_DAY for field in ENERGY_FIELDS}
+
+
+def _hour_weights(start: datetime, end: datetime) -> list[tuple[int, float]]:
+    """Share of the ``start``..``end`` interval falling into each hour of the day."""
+    total = (end - start).total_seconds()
+    if total <= 0:
+        return [(end.hour, 1.0)]
+    weights = []
+    for hour in range(start.hour, end.hour + 1):
+        hour_start = max(start, start.replace(hour=hour, minute=0, second=0, microsecond=0))
+        hour_end = min(end, hour_start.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1))
+        seconds = (hour_end - hour_start).total_seconds()
+        if seconds > 0:
+            weights.append((hour, seconds / total))
+    return weights
+
+
+class HourlyEnergyHistory:
+    """Hourly kWh arrays per day, merged incrementally from daily totals.
+
+    Comfort Cloud reports energy as a total for the current day. Each reading is
+    turned into a delta against the previous reading of the same day and split
+    over the hours since that reading by time. The last reading is kept with the
+    arrays, so a restart continues from where it stopped instead of counting the
+    day again.
+
+    Stored as plain dicts and lists so it can go straight into a Store.
+    """
+
+    def __init__(self, retention_days: int = DEFAULT_RETENTION_DAYS):
+        self._retention_days = retention_days
+        self._days: dict[str, dict[str, list[float]]] = {}
+        self._last: dict[str, Any] | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict | None, retention_days: int = DEFAULT_RETENTION_DAYS) -> "HourlyEnergyHistory":
+        """Restore history saved with as_dict(); invalid days are dropped."""
+        history = cls(retention_days)
+        if not data:
+            return history
+        for day, values in (data.get("days") or {}).items():
+            if not isinstance(values, dict):
+                continue
+            arrays = _empty_day()
+            for field in ENERGY_FIELDS:
+                stored = values.get(field)
+                if isinstance(stored, list) and len(stored) == HOURS_PER_DAY:
+                    arrays[field] = [float(v or 0) for v in stored]
+            history._days[day] = arrays
+        last = data.get("last")
+        if isinstance(last, dict) and last.get("time"):
+            history._last = dict(last)
+        return history
+
+    def as_dict(self) -> dict:
+        """Data to persist."""
+        return {"days": self._days, "last": self._last}
+
+    def add_reading(self, when: datetime, totals: dict[str, float | None]) -> bool:
+        """Merge daily totals read at ``when``; return True if any hour changed."""
+        day = when.date().isoformat()
+
+        if self._last is None:
+            # First reading ever: only a baseline, the day so far has no known hours
+            self._last = {"time": when.isoformat(), **{field: totals.get(field) for field in ENERGY_FIELDS}}
+            return False
+
+        last_time = datetime.fromisoformat(self._last["time"])
+        if last_time.date() == when.date():
+            previous = self._last
+            start = last_time
+        else:
+            # Totals restart at midnight, so the first reading of a day counts from zero
+            previous = {}
+            start = when.replace(hour=0, minute=0, second=0, microsecond=0)
+        weights = _hour_weights(start, when)
+        arrays = self._days.get(day)
+        changed = False
+
+        for field in ENERGY_FIELDS:
+            value = totals.get(field)
+            if value is None:
+                continue
+            delta = value - (previous.get(field) or 0.0)
+            if delta <= 0:
+                # Unchanged, or the cloud corrected the total down: new baseline
+                continue
+            if arrays is None:
+                arrays = self._days[day] = _empty_day()
+            for hour, weight in weights:
+                arrays[field][hour] = round(arrays[field][hour] + delta * weight, 4)
+            changed = True
+
+        self._last = {
+            "time": when.isoformat(),
+            **{
+                field: totals[field] if totals.get(field) is not None else previous.get(field)
+                for field in ENERGY_FIELDS
+            },
+        }
+        if changed:
+            self._prune(when.date())
+        return changed
+
+    def day(self, day: date, field: str = "consumption") -> list[float] | None:
+        """Return a copy of the 24 hourly values of ``field`` for ``day``."""
+        arrays = self._days.get(day.isoformat())
+        return list(arrays[field]) if arrays is not None else None
+
+    def hourly(self, start: date, end: date, field: str = "consumption") -> list[tuple[str, float]]:
+        """Return (``"YYYY-MM-DD HH"``, kWh) pairs from ``start`` to ``end`` inclusive.
+
+        Days without data are skipped rather than reported as zero.
+        """
+        result: list[tuple[str, float]] = []
+        current = start
+        while current <= end:
+            key = current.isoformat()
+            arrays = self._days.get(key)
+            if arrays is not None:
+                result.extend((f"{key} {hour:02d}", value) for hour, value in enumerate(arrays[field]))
+            current += timedelta(days=1)
+        return result
+
+    def _prune(self, today: date):
+        cutoff = (today - timedelta(days=self._retention_days)).isoformat()
+        for key in [key for key in self._days if key < cutoff]:
+            del self._days[key]
@@ -2,7 +2,10 @@ from typing import Callable, Any
 from dataclasses import dataclass
 import logging
 
+from datetime import timedelta
+
 from homeassistant.const import UnitOfTemperature, EntityCategory
+from homeassistant.util import dt as dt_util
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
@@ -34,6 +37,7 @@ class PanasonicSensorEntityDescription(SensorEntityDescription):
 class PanasonicEnergySensorEntityDescription(SensorEntityDescription):
     """Describes Panasonic sensor entity."""
     get_state: Callable[[PanasonicDeviceEnergy], Any]| None = None
+    history_field: str | None = None
 
 @dataclass(frozen=True, kw_only=True)
 class AquareaSensorEntityDescription(SensorEntityDescription):
@@ -110,7 +114,8 @@ DAILY_ENERGY_DESCRIPTION = PanasonicEnergySensorEntityDescription(
     device_class=SensorDeviceClass.ENERGY,
     state_class=SensorStateClass.TOTAL_INCREASING,
     native_unit_of_measurement="kWh",
-    get_state=lambda energy: energy.consumption
+    get_state=lambda energy: energy.consumption,
+    history_field="consumption",
 )
 DAILY_HEATING_ENERGY_DESCRIPTION = PanasonicEnergySensorEntityDescription(
     key="daily_heating_energy",
@@ -120,7 +125,8 @@ DAILY_HEATING_ENERGY_DESCRIPTION = PanasonicEnergySensorEntityDescription(
     device_class=SensorDeviceClass.ENERGY,
     state_class=SensorStateClass.TOTAL_INCREASING,
     native_unit_of_measurement="kWh",
-    get_state=lambda energy: energy.heating_consumption
+    get_state=lambda energy: energy.heating_consumption,
+    history_field="heating_consumption",
 )
 DAILY_COOLING_ENERGY_DESCRIPTION = PanasonicEnergySensorEntityDescription(
     key="daily_cooling_energy",
@@ -130,7 +136,8 @@ DAILY_COOLING_ENERGY_DESCRIPTION = PanasonicEnergySensorEntityDescription(
     device_class=SensorDeviceClass.ENERGY,
     state_class=SensorStateClass.TOTAL_INCREASING,
     native_unit_of_measurement="kWh",
-    get_state=lambda energy: energy.cooling_consumption
+    get_state=lambda energy: energy.cooling_consumption,
+    history_field="cooling_consumption",
 )
 POWER_DESCRIPTION = PanasonicEnergySensorEntityDescription(
     key="current_power",
@@ -248,6 +255,8 @@ class PanasonicSensorEntity(PanasonicDataEntity, PanasonicSensorEntityBase):
 class PanasonicEnergySensorEntity(PanasonicEnergyEntity, SensorEntity):
     
     entity_description: PanasonicEnergySensorEntityDescription # type: ignore[override]
+    # Hourly arrays are for consumers reading the current state, not for the recorder
+    _unrecorded_attributes = frozenset({"hourly_today", "hourly_yesterday"})
 
     def __init__(self, coordinator: PanasonicDeviceEnergyCoordinator, description: PanasonicEnergySensorEntityDescription):
         self.entity_description = description
@@ -263,6 +272,14 @@ class PanasonicEnergySensorEntity(PanasonicEnergyEntity, SensorEntity):
         value = self.entity_description.get_state(self.coordinator.energy)
         self._attr_available = value is not None
         self._attr_native_value = value
+        field = self.entity_description.history_field
+        history = self.coordinator.history
+        if field is not None and history is not None:
+            today = dt_util.now().date()
+            self._attr_extra_state_attributes = {
+                "hourly_today": history.day(today, field),
+                "hourly_yesterday": history.day(today - timedelta(days=1), field),
+            }
 
 class AquareaSensorEntity(AquareaDataEntity, SensorEntity):
     
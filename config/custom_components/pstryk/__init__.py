@@ -7,6 +7,7 @@ from homeassistant.core import HomeAssistant
 from .mqtt_publisher import PstrykMqttPublisher
 from .mqtt_common import setup_periodic_mqtt_publish
 from .services import async_setup_services, async_unload_services
+from .translation_cache import async_clear_translations_registry
 from .const import (
     DOMAIN,
     CONF_MQTT_ENABLED,
@@ -195,6 +196,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entries = hass.config_entries.async_entries(DOMAIN)
         if len(entries) <= 1:  # This is the last or only entry
             await async_unload_services(hass)
+            async_clear_translations_registry(hass)
                 
     return unload_ok
 
@@ -1,7 +1,9 @@
 """Shared API client for Pstryk Energy integration with caching and rate limiting."""
 import logging
 import asyncio
+import copy
 import random
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 from email.utils import parsedate_to_datetime
@@ -10,12 +12,22 @@ import aiohttp
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import UpdateFailed
-from homeassistant.helpers.translation import async_get_translations
 
-from .const import API_URL, API_TIMEOUT, DOMAIN
+from .const import (
+    API_URL,
+    API_TIMEOUT,
+    API_RESPONSE_CACHE_SIZE,
+    API_RESPONSE_CACHE_TTL,
+    API_RATE_LIMIT_MAX_WAIT,
+    DOMAIN,
+)
+from .translation_cache import EMPTY_TRANSLATIONS, PstrykTranslations, async_get_translations_registry
 
 _LOGGER = logging.getLogger(__name__)
 
+# hass.data[DOMAIN] key holding rate limits shared by every client and coordinator
+DATA_RATE_LIMITS = "rate_limits"
+
 
 class PstrykAPIClient:
     """Shared API client with caching, rate limiting, and proper error handling."""
@@ -25,19 +37,24 @@ class PstrykAPIClient:
         self.hass = hass
         self.api_key = api_key
         self._session: Optional[aiohttp.ClientSession] = None
-        self._translations: Dict[str, str] = {}
-        self._translations_loaded = False
-
-        # Rate limiting: {endpoint_key: {"retry_after": datetime, "backoff": float}}
-        self._rate_limits: Dict[str, Dict[str, Any]] = {}
-        self._rate_limit_lock = asyncio.Lock()
+        self._translations: PstrykTranslations = EMPTY_TRANSLATIONS
+
+        # Rate limiting: {endpoint_key: {"retry_after": datetime, "backoff": float}},
+        # kept in hass.data per API key so it survives reloads and is seen by all clients
+        self._rate_limits: Dict[str, Dict[str, Any]] = (
+            hass.data.setdefault(DOMAIN, {})
+            .setdefault(DATA_RATE_LIMITS, {})
+            .setdefault(api_key, {})
+        )
 
         # Request throttling - limit concurrent requests
         self._request_semaphore = asyncio.Semaphore(3)  # Max 3 concurrent requests
 
-        # Deduplication - track in-flight requests
+        # Deduplication - callers asking for the same URL share one task
         self._in_flight: Dict[str, asyncio.Task] = {}
-        self._in_flight_lock = asyncio.Lock()
+
+        # Short-lived response cache: {url: (monotonic timestamp, data)}, oldest first
+        self._response_cache: Dict[str, tuple] = {}
 
     @property
     def session(self) -> aiohttp.ClientSession:
@@ -47,57 +64,13 @@ class PstrykAPIClient:
         return self._session
 
     async def _load_translations(self):
-        """Load translations for error messages."""
-        if not self._translations_loaded:
-            try:
-                self._translations = await async_get_translations(
-                    self.hass, self.hass.config.language, DOMAIN, ["debug"]
-                )
-                self._translations_loaded = True
-                # Debug: log sample keys to understand the format
-                if self._translations:
-                    sample_keys = list(self._translations.keys())[:3]
-                    _LOGGER.debug("Loaded %d translation keys, samples: %s",
-                                len(self._translations), sample_keys)
-            except Exception as ex:
-                _LOGGER.warning("Failed to load translations for API client: %s", ex)
-                self._translations = {}
-                self._translations_loaded = True
+        """Get the shared translation registry for error messages."""
+        # Dict lookup unless the language changed since the last load
+        self._translations = await async_get_translations_registry(self.hass)
 
     def _t(self, key: str, **kwargs) -> str:
-        """Get translated string with fallback."""
-        # Try different key formats as async_get_translations may return different formats
-        possible_keys = [
-            f"component.{DOMAIN}.debug.{key}",  # Full format: component.pstryk.debug.key
-            f"{DOMAIN}.debug.{key}",            # Domain format: pstryk.debug.key
-            f"debug.{key}",                      # Short format: debug.key
-            key                                  # Just the key
-        ]
-
-        template = None
-        for possible_key in possible_keys:
-            template = self._translations.get(possible_key)
-            if template:
-                break
-
-        # If translation not found, create a fallback message
-        if not template:
-            # Fallback patterns for common error types
-            if key == "api_error_html":
-                template = "API error {status} for {endpoint} (HTML error page received)"
-            elif key == "rate_limited":
-                template = "Endpoint '{endpoint}' is rate limited. Will retry after {seconds} seconds"
-            elif key == "waiting_rate_limit":
-                template = "Waiting {seconds} seconds for rate limit to clear"
-            else:
-                _LOGGER.debug("Translation key not found: %s (tried formats: %s)", key, possible_keys)
-                template = key
-
-        try:
-            return template.format(**kwargs)
-        except (KeyError, ValueError) as e:
-            _LOGGER.warning("Failed to format translation template '%s': %s", template, e)
-            return template
+        """Get translated debug string with fallback."""
+        return self._translations.format(f"debug.{key}", **kwargs)
 
     def _get_endpoint_key(self, url: str) -> str:
         """Extract endpoint key from URL for rate limiting."""
@@ -114,17 +87,16 @@ class PstrykAPIClient:
 
     async def _check_rate_limit(self, endpoint_key: str) -> Optional[float]:
         """Check if we're rate limited and return wait time if needed."""
-        async with self._rate_limit_lock:
-            if endpoint_key in self._rate_limits:
-                limit_info = self._rate_limits[endpoint_key]
-                retry_after = limit_info.get("retry_after")
-
-                if retry_after and datetime.now() < retry_after:
-                    wait_time = (retry_after - datetime.now()).total_seconds()
-                    return wait_time
-                elif retry_after and datetime.now() >= retry_after:
-                    # Rate limit expired, clear it
-                    del self._rate_limits[endpoint_key]
+        if endpoint_key in self._rate_limits:
+            limit_info = self._rate_limits[endpoint_key]
+            retry_after = limit_info.get("retry_after")
+
+            if retry_after and datetime.now() < retry_after:
+                wait_time = (retry_after - datetime.now()).total_seconds()
+                return wait_time
+            elif retry_after and datetime.now() >= retry_after:
+                # Rate limit expired, clear it
+                del self._rate_limits[endpoint_key]
 
         return None
 
@@ -152,7 +124,7 @@ class PstrykAPIClient:
                 # Try parsing as HTTP date
                 try:
                     retry_date = parsedate_to_datetime(retry_after_header)
-                    wait_time = (retry_date - datetime.now()).total_seconds()
+                    wait_time = (retry_date - datetime.now(retry_date.tzinfo)).total_seconds()
                 except Exception:
                     pass
 
@@ -162,11 +134,10 @@ class PstrykAPIClient:
 
         retry_after_dt = datetime.now() + timedelta(seconds=wait_time)
 
-        async with self._rate_limit_lock:
-            self._rate_limits[endpoint_key] = {
-                "retry_after": retry_after_dt,
-                "backoff": wait_time
-            }
+        self._rate_limits[endpoint_key] = {
+            "retry_after": retry_after_dt,
+            "backoff": wait_time
+        }
 
         _LOGGER.warning(
             self._t("rate_limited", endpoint=endpoint_key, seconds=int(wait_time))
@@ -185,20 +156,6 @@ class PstrykAPIClient:
 
         endpoint_key = self._get_endpoint_key(url)
 
-        # Check if we're rate limited
-        wait_time = await self._check_rate_limit(endpoint_key)
-        if wait_time and wait_time > 0:
-            # If wait time is reasonable, wait
-            if wait_time <= 60:
-                _LOGGER.info(
-                    self._t("waiting_rate_limit", seconds=int(wait_time))
-                )
-                await asyncio.sleep(wait_time)
-            else:
-                raise UpdateFailed(
-                    f"API rate limited for {endpoint_key}. Please try again in {int(wait_time/60)} minutes."
-                )
-
         headers = {
             "Authorization": self.api_key,
             "Accept": "application/json"
@@ -207,6 +164,9 @@ class PstrykAPIClient:
         last_exception = None
 
         for attempt in range(max_retries):
+            # Honour the shared rate limit before every attempt, including retries
+            await self._wait_for_rate_limit(endpoint_key)
+
             try:
                 # Use semaphore to limit concurrent requests
                 async with self._request_semaphore:
@@ -221,14 +181,13 @@ class PstrykAPIClient:
                                 # Handle rate limiting
                                 await self._handle_rate_limit(response, endpoint_key)
 
-                                # Retry with exponential backoff
+                                # The next attempt waits for Retry-After (or fails fast
+                                # if it is too long), so no extra backoff sleep here
                                 if attempt < max_retries - 1:
-                                    backoff = self._calculate_backoff(attempt, base_delay)
                                     _LOGGER.debug(
-                                        "Rate limited, retrying in %.1f seconds (attempt %d/%d)",
-                                        backoff, attempt + 1, max_retries
+                                        "Rate limited, retrying after rate limit clears (attempt %d/%d)",
+                                        attempt + 1, max_retries
                                     )
-                                    await asyncio.sleep(backoff)
                                     continue
                                 else:
                                     raise UpdateFailed(
@@ -321,6 +280,9 @@ class PstrykAPIClient:
                     await asyncio.sleep(backoff)
                     continue
 
+            except UpdateFailed:
+                raise
+
             except Exception as err:
                 last_exception = err
                 _LOGGER.exception(
@@ -337,34 +299,86 @@ class PstrykAPIClient:
 
         raise UpdateFailed(f"Failed to fetch data from {endpoint_key}")
 
+    async def _wait_for_rate_limit(self, endpoint_key: str):
+        """Sleep through a short rate limit, fail fast on a long one."""
+        wait_time = await self._check_rate_limit(endpoint_key)
+        if not wait_time or wait_time <= 0:
+            return
+
+        if wait_time > API_RATE_LIMIT_MAX_WAIT:
+            raise UpdateFailed(
+                f"API rate limited for {endpoint_key}. Please try again in {max(1, int(wait_time/60))} minutes."
+            )
+
+        _LOGGER.info(
+            self._t("waiting_rate_limit", seconds=int(wait_time))
+        )
+        await asyncio.sleep(wait_time)
+
+    async def _fetch_and_cache(
+        self,
+        url: str,
+        max_retries: int,
+        base_delay: float
+    ) -> Dict[str, Any]:
+        """Run the request and keep the response for the cache TTL."""
+        data = await self._make_request(url, max_retries, base_delay)
+        now = time.monotonic()
+        # URLs carry their time window, so old entries are never asked for again
+        for cached_url, (timestamp, _) in list(self._response_cache.items()):
+            if now - timestamp > API_RESPONSE_CACHE_TTL:
+                del self._response_cache[cached_url]
+        self._response_cache.pop(url, None)
+        self._response_cache[url] = (now, data)
+        while len(self._response_cache) > API_RESPONSE_CACHE_SIZE:
+            del self._response_cache[next(iter(self._response_cache))]
+        return data
+
+    def _on_request_done(self, url: str, task: asyncio.Task):
+        """Forget a finished in-flight request."""
+        if self._in_flight.get(url) is task:
+            del self._in_flight[url]
+        # Mark the exception as retrieved if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def _get_cached(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return a cached response younger than the TTL."""
+        cached = self._response_cache.get(url)
+        if cached is None:
+            return None
+        timestamp, data = cached
+        if time.monotonic() - timestamp > API_RESPONSE_CACHE_TTL:
+            del self._response_cache[url]
+            return None
+        return data
+
     async def fetch(
         self,
         url: str,
         max_retries: int = 3,
         base_delay: float = 20.0
     ) -> Dict[str, Any]:
-        """Fetch data with deduplication of concurrent requests."""
-        # Check if there's already an in-flight request for this URL
-        async with self._in_flight_lock:
-            if url in self._in_flight:
-                _LOGGER.debug("Deduplicating request for %s", url)
-                # Wait for the existing request to complete
-                try:
-                    return await self._in_flight[url]
-                except Exception:
-                    # If the in-flight request failed, create a new one
-                    pass
-
-            # Create new request task
+        """Fetch data, sharing one request between concurrent callers.
+
+        Identical URLs requested while a request is in flight await the same
+        task, and a successful response is reused for API_RESPONSE_CACHE_TTL
+        seconds. Every caller gets its own copy of the data.
+        """
+        cached = self._get_cached(url)
+        if cached is not None:
+            _LOGGER.debug("Using cached response for %s", url)
+            return copy.deepcopy(cached)
+
+        task = self._in_flight.get(url)
+        if task is None:
             task = asyncio.create_task(
-                self._make_request(url, max_retries, base_delay)
+                self._fetch_and_cache(url, max_retries, base_delay)
             )
             self._in_flight[url] = task
+            task.add_done_callback(lambda t: self._on_request_done(url, t))
+        else:
+            _LOGGER.debug("Deduplicating request for %s", url)
 
-        try:
-            result = await task
-            return result
-        finally:
-            # Remove from in-flight requests
-            async with self._in_flight_lock:
-                self._in_flight.pop(url, None)
+        # Shield so one cancelled caller does not cancel the shared request
+        return copy.deepcopy(await asyncio.shield(task))
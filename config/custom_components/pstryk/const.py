@@ -3,6 +3,9 @@
 DOMAIN = "pstryk"
 API_URL = "https://api.pstryk.pl/integrations/"
 API_TIMEOUT = 60
+API_RESPONSE_CACHE_TTL = 30  # seconds, absorbs bursts of identical requests during setup
+API_RESPONSE_CACHE_SIZE = 16  # responses kept at most, oldest dropped first
+API_RATE_LIMIT_MAX_WAIT = 60  # seconds, longer rate limits fail fast instead of sleeping
 
 BUY_ENDPOINT = "pricing/?resolution=hour&window_start={start}&window_end={end}"
 SELL_ENDPOINT = "prosumer-pricing/?resolution=hour&window_start={start}&window_end={end}"
@@ -0,0 +1,123 @@
+"""Incremental month and year totals for Pstryk energy cost and usage frames."""
+import logging
+from typing import Any, Dict, Optional, Set
+
+_LOGGER = logging.getLogger(__name__)
+
+# (result key, frame key) pairs read from energy-cost frames
+COST_FIELDS = (
+    ("total_balance", "energy_balance_value"),
+    ("total_sold", "energy_sold_value"),
+    ("total_cost", "fae_cost"),
+)
+# (result key, frame key) pairs read from energy-usage frames
+USAGE_FIELDS = (
+    ("fae_usage", "fae_usage"),
+    ("rae_usage", "rae"),
+)
+TOTAL_KEYS = tuple(key for key, _ in COST_FIELDS + USAGE_FIELDS)
+
+
+def _empty_totals() -> Dict[str, Any]:
+    """Totals in the shape the cost sensors expect."""
+    result: Dict[str, Any] = {"frame": {}}
+    result.update({key: 0 for key in TOTAL_KEYS})
+    return result
+
+
+def month_key(start: str) -> str:
+    """Month key ("YYYY-MM") of a frame start such as "2025-03-01T00:00:00+01:00"."""
+    return start[:7]
+
+
+class CostAggregator:
+    """Month totals built from month-resolution frames, folded in as they change.
+
+    Frames identical to the cached ones are skipped, and the year total is
+    rebuilt from the cached months only when one of them changed.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._months: Dict[str, Dict[str, Any]] = {}
+        self._usage_frames: Dict[str, Dict[str, Any]] = {}
+        self._years: Dict[str, Dict[str, Any]] = {}
+        self._loaded_years: Set[str] = set()
+
+    def fold(self, cost_data: Optional[Dict], usage_data: Optional[Dict]) -> Set[str]:
+        """Fold month frames into the cache and return the months that changed."""
+        changed = set()
+
+        for frame in (cost_data or {}).get("frames") or []:
+            start = frame.get("start")
+            if not start:
+                continue
+            key = month_key(start)
+            month = self._months.setdefault(key, _empty_totals())
+            if month["frame"] == frame:
+                continue
+            month["frame"] = frame
+            month["total_balance"] = frame.get("energy_balance_value", 0)
+            month["total_sold"] = frame.get("energy_sold_value", 0)
+            month["total_cost"] = abs(frame.get("fae_cost", 0))
+            changed.add(key)
+
+        for frame in (usage_data or {}).get("frames") or []:
+            start = frame.get("start")
+            if not start:
+                continue
+            key = month_key(start)
+            if self._usage_frames.get(key) == frame:
+                continue
+            self._usage_frames[key] = frame
+            month = self._months.setdefault(key, _empty_totals())
+            month["fae_usage"] = frame.get("fae_usage", 0)
+            month["rae_usage"] = frame.get("rae", 0)
+            changed.add(key)
+
+        for key in changed:
+            self._years.pop(key[:4], None)
+
+        if changed:
+            _LOGGER.debug("Folded cost frames for months: %s", sorted(changed))
+        return changed
+
+    def mark_year_loaded(self, year: int):
+        """Remember that every past month of ``year`` has been fetched."""
+        self._loaded_years.add(str(year))
+
+    def is_year_loaded(self, year: int) -> bool:
+        """Return True if the past months of ``year`` are in the cache."""
+        return str(year) in self._loaded_years
+
+    def has_month(self, key: str) -> bool:
+        """Return True if the month ("YYYY-MM") is cached."""
+        return key in self._months
+
+    def month(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached month totals."""
+        month = self._months.get(key)
+        return dict(month) if month is not None else None
+
+    def year(self, year: int) -> Dict[str, Any]:
+        """Return the year total, rebuilt from cached months if any changed."""
+        prefix = str(year)
+        totals = self._years.get(prefix)
+        if totals is None:
+            totals = _empty_totals()
+            for key, month in self._months.items():
+                if key[:4] == prefix:
+                    for total_key in TOTAL_KEYS:
+                        totals[total_key] += month[total_key]
+            self._years[prefix] = totals
+        return dict(totals)
+
+    def prune(self, year: int):
+        """Drop months of years before ``year``."""
+        prefix = str(year)
+        for key in [key for key in self._months if key[:4] < prefix]:
+            self._months.pop(key, None)
+            self._usage_frames.pop(key, None)
+        for cached in [cached for cached in self._years if cached < prefix]:
+            self._years.pop(cached, None)
+        self._loaded_years = {loaded for loaded in self._loaded_years if loaded >= prefix}
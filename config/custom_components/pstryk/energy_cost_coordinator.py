@@ -12,6 +12,7 @@ from .const import (
     ENERGY_USAGE_ENDPOINT
 )
 from .api_client import PstrykAPIClient
+from .cost_aggregator import CostAggregator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,12 +25,17 @@ class PstrykCostDataUpdateCoordinator(DataUpdateCoordinator):
         self.api_client = api_client
         self._unsub_hourly = None
         self._unsub_midnight = None
+        # Month totals cached between fetches; the year total is rebuilt from them
+        self._aggregator = CostAggregator()
+        self._last_month_key = None
 
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_cost",
-            update_interval=timedelta(hours=1),
+            # Refreshed by schedule_hourly_update (daily data only) and
+            # schedule_midnight_update (all resolutions), not by an interval
+            update_interval=None,
         )
 
     async def _async_update_data(self, fetch_all: bool = True):
@@ -90,58 +96,19 @@ class PstrykCostDataUpdateCoordinator(DataUpdateCoordinator):
             except UpdateFailed as e:
                 _LOGGER.warning(f"Failed to fetch daily data: {e}. Continuing with other resolutions.")
 
-            # Fetch monthly and yearly data only when fetch_all=True (midnight update)
+            # Refresh month totals only when fetch_all=True (midnight update)
+            month_key = month_start.strftime("%Y-%m")
             if fetch_all:
-                # Fetch monthly data
-                # IMPORTANT: For monthly data at month boundary, only request current month
-                # to avoid API 500 errors when crossing month boundaries
-                monthly_cost_url = f"{API_URL}{ENERGY_COST_ENDPOINT.format(
-                    resolution='month',
-                    start=format_time(month_start),
-                    end=format_time(next_month_start)
-                )}"
-                monthly_usage_url = f"{API_URL}{ENERGY_USAGE_ENDPOINT.format(
-                    resolution='month',
-                    start=format_time(month_start),
-                    end=format_time(next_month_start)
-                )}"
-
-                _LOGGER.debug(f"Fetching monthly data for {month_start.strftime('%B %Y')}")
-
-                try:
-                    monthly_cost_data = await self.api_client.fetch(monthly_cost_url)
-                    monthly_usage_data = await self.api_client.fetch(monthly_usage_url)
-
-                    if monthly_cost_data and monthly_usage_data:
-                        data["monthly"] = self._process_monthly_data_simple(monthly_cost_data, monthly_usage_data)
-                except UpdateFailed as e:
-                    _LOGGER.warning(f"Failed to fetch monthly data: {e}. Continuing with other resolutions.")
-
-                # Fetch yearly data using month resolution
-                yearly_cost_url = f"{API_URL}{ENERGY_COST_ENDPOINT.format(
-                    resolution='month',
-                    start=format_time(year_start),
-                    end=format_time(next_year_start)
-                )}"
-                yearly_usage_url = f"{API_URL}{ENERGY_USAGE_ENDPOINT.format(
-                    resolution='month',
-                    start=format_time(year_start),
-                    end=format_time(next_year_start)
-                )}"
-
-                _LOGGER.debug(f"Fetching yearly data for {year_start.year}")
-
-                try:
-                    yearly_cost_data = await self.api_client.fetch(yearly_cost_url)
-                    yearly_usage_data = await self.api_client.fetch(yearly_usage_url)
-
-                    if yearly_cost_data and yearly_usage_data:
-                        data["yearly"] = self._process_yearly_data_simple(yearly_cost_data, yearly_usage_data)
-                except UpdateFailed as e:
-                    _LOGGER.warning(f"Failed to fetch yearly data: {e}.")
+                await self._refresh_month_totals(month_start, next_month_start, year_start, next_year_start)
             else:
                 _LOGGER.debug("Skipping monthly and yearly data fetch (hourly update - using cached data)")
 
+            # Monthly and yearly totals come from the cache, so hourly updates keep them too
+            if self._aggregator.has_month(month_key):
+                data["monthly"] = self._aggregator.month(month_key)
+            if self._aggregator.is_year_loaded(year_start.year):
+                data["yearly"] = self._aggregator.year(year_start.year)
+
             # If we have at least one resolution, consider it a success
             if data:
                 _LOGGER.debug(f"Successfully fetched energy cost and usage data for resolutions: {list(data.keys())}")
@@ -153,35 +120,62 @@ class PstrykCostDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error fetching energy cost data: %s", err, exc_info=True)
             raise UpdateFailed(f"Error fetching energy cost data: {err}")
 
-    def _process_monthly_data_simple(self, cost_data, usage_data):
-        """Simple monthly data processor - just take the first frame since we requested current month only."""
-        _LOGGER.info("Processing monthly data - simple version")
+    async def _fetch_month_frames(self, start, end):
+        """Fetch cost and usage frames at month resolution for [start, end)."""
+        format_time = lambda dt: dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+        window = {"resolution": "month", "start": format_time(start), "end": format_time(end)}
 
-        result = {
-            "frame": {},
-            "total_balance": 0,
-            "total_sold": 0,
-            "total_cost": 0,
-            "fae_usage": 0,
-            "rae_usage": 0
-        }
+        cost_data = await self.api_client.fetch(f"{API_URL}{ENERGY_COST_ENDPOINT.format(**window)}")
+        usage_data = await self.api_client.fetch(f"{API_URL}{ENERGY_USAGE_ENDPOINT.format(**window)}")
+        return cost_data, usage_data
 
-        if cost_data and cost_data.get("frames") and cost_data["frames"]:
-            frame = cost_data["frames"][0]
-            result["frame"] = frame
-            result["total_balance"] = frame.get("energy_balance_value", 0)
-            result["total_sold"] = frame.get("energy_sold_value", 0)
-            result["total_cost"] = abs(frame.get("fae_cost", 0))
-            _LOGGER.info(f"Monthly cost data: balance={result['total_balance']}, "
-                        f"sold={result['total_sold']}, cost={result['total_cost']}")
-
-        if usage_data and usage_data.get("frames") and usage_data["frames"]:
-            frame = usage_data["frames"][0]
-            result["fae_usage"] = frame.get("fae_usage", 0)
-            result["rae_usage"] = frame.get("rae", 0)
-            _LOGGER.info(f"Monthly usage data: fae={result['fae_usage']}, rae={result['rae_usage']}")
+    async def _refresh_month_totals(self, month_start, next_month_start, year_start, next_year_start):
+        """Fold changed month frames into the cached totals.
 
-        return result
+        The whole year is requested once (first load or new year). After that
+        only the current month is requested, plus one final refresh of the
+        previous month when the month rolls over.
+        """
+        self._aggregator.prune(year_start.year)
+        month_key = month_start.strftime("%Y-%m")
+
+        if not self._aggregator.is_year_loaded(year_start.year):
+            _LOGGER.debug(f"Fetching yearly data for {year_start.year}")
+            try:
+                cost_data, usage_data = await self._fetch_month_frames(year_start, next_year_start)
+                if cost_data and usage_data:
+                    self._aggregator.fold(cost_data, usage_data)
+                    self._aggregator.mark_year_loaded(year_start.year)
+                    self._last_month_key = month_key
+            except UpdateFailed as e:
+                _LOGGER.warning(f"Failed to fetch yearly data: {e}.")
+            return
+
+        if self._last_month_key and self._last_month_key != month_key and month_start > year_start:
+            # Month rolled over - pick up the last day of the previous month
+            if month_start.month == 1:
+                prev_month_start = month_start.replace(year=month_start.year - 1, month=12)
+            else:
+                prev_month_start = month_start.replace(month=month_start.month - 1)
+
+            _LOGGER.debug(f"Refreshing closed month {prev_month_start.strftime('%B %Y')}")
+            try:
+                cost_data, usage_data = await self._fetch_month_frames(prev_month_start, month_start)
+                if cost_data and usage_data:
+                    self._aggregator.fold(cost_data, usage_data)
+            except UpdateFailed as e:
+                _LOGGER.warning(f"Failed to refresh previous month data: {e}.")
+
+        # IMPORTANT: For monthly data at month boundary, only request current month
+        # to avoid API 500 errors when crossing month boundaries
+        _LOGGER.debug(f"Fetching monthly data for {month_start.strftime('%B %Y')}")
+        try:
+            cost_data, usage_data = await self._fetch_month_frames(month_start, next_month_start)
+            if cost_data and usage_data:
+                self._aggregator.fold(cost_data, usage_data)
+                self._last_month_key = month_key
+        except UpdateFailed as e:
+            _LOGGER.warning(f"Failed to fetch monthly data: {e}. Continuing with other resolutions.")
 
     def _process_daily_data_simple(self, cost_data, usage_data):
         """Simple daily data processor - directly use API values without complex logic."""
@@ -251,39 +245,6 @@ class PstrykCostDataUpdateCoordinator(DataUpdateCoordinator):
                     f"sold={result['total_sold']} ===")
         return result
 
-    def _process_yearly_data_simple(self, cost_data, usage_data):
-        """Simple yearly data processor - sum all months for the year."""
-        _LOGGER.info("Processing yearly data - simple version")
-
-        total_balance = 0
-        total_sold = 0
-        total_cost = 0
-        fae_usage = 0
-        rae_usage = 0
-
-        if cost_data and cost_data.get("frames"):
-            for frame in cost_data["frames"]:
-                total_balance += frame.get("energy_balance_value", 0)
-                total_sold += frame.get("energy_sold_value", 0)
-                total_cost += abs(frame.get("fae_cost", 0))
-            _LOGGER.info(f"Yearly cost totals: balance={total_balance}, "
-                        f"sold={total_sold}, cost={total_cost}")
-
-        if usage_data and usage_data.get("frames"):
-            for frame in usage_data["frames"]:
-                fae_usage += frame.get("fae_usage", 0)
-                rae_usage += frame.get("rae", 0)
-            _LOGGER.info(f"Yearly usage totals: fae={fae_usage}, rae={rae_usage}")
-
-        return {
-            "frame": {},
-            "total_balance": total_balance,
-            "total_sold": total_sold,
-            "total_cost": total_cost,
-            "fae_usage": fae_usage,
-            "rae_usage": rae_usage
-        }
-
     def schedule_midnight_update(self):
         """Schedule midnight updates for daily reset."""
         if hasattr(self, '_unsub_midnight'):
@@ -307,7 +268,10 @@ class PstrykCostDataUpdateCoordinator(DataUpdateCoordinator):
         """Handle midnight update - fetch all data (daily, monthly, yearly)."""
         _LOGGER.debug("Running scheduled midnight cost update (all resolutions)")
         # Fetch all resolutions at midnight
-        await self._async_update_data(fetch_all=True)
+        try:
+            self.async_set_updated_data(await self._async_update_data(fetch_all=True))
+        except UpdateFailed as err:
+            _LOGGER.warning("Midnight cost update failed: %s", err)
         self.schedule_midnight_update()
 
     def schedule_hourly_update(self):
@@ -329,6 +293,9 @@ class PstrykCostDataUpdateCoordinator(DataUpdateCoordinator):
     async def _handle_hourly_update(self, now):
         """Handle the hourly update - fetch only daily data."""
         _LOGGER.debug("Triggering hourly cost update (daily data only)")
-        # Fetch only daily data during hourly updates
-        await self._async_update_data(fetch_all=False)
+        # Fetch only daily data during hourly updates; monthly and yearly come from the cache
+        try:
+            self.async_set_updated_data(await self._async_update_data(fetch_all=False))
+        except UpdateFailed as err:
+            _LOGGER.warning("Hourly cost update failed: %s", err)
         self.schedule_hourly_update()
@@ -6,7 +6,6 @@ import asyncio
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 from homeassistant.components import mqtt
-from homeassistant.helpers.translation import async_get_translations
 from homeassistant.helpers.event import async_track_time_interval
 
 from .const import (
@@ -14,6 +13,7 @@ from .const import (
     DEFAULT_MQTT_TOPIC_BUY,
     DEFAULT_MQTT_TOPIC_SELL
 )
+from .translation_cache import EMPTY_TRANSLATIONS, async_get_translations_registry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,7 +34,7 @@ class PstrykMqttPublisher:
         self.mqtt_topic_sell = mqtt_topic_sell
         self._publish_task = None
         self._initialized = False
-        self._translations = {}
+        self._translations = EMPTY_TRANSLATIONS
         self._unsub_timer = None
         self._last_published = None
 
@@ -43,13 +43,8 @@ class PstrykMqttPublisher:
         if self._initialized:
             return True
             
-        # Load translations
-        try:
-            self._translations = await async_get_translations(
-                self.hass, self.hass.config.language, DOMAIN, ["mqtt"]
-            )
-        except Exception as ex:
-            _LOGGER.warning("Failed to load translations for MQTT publisher: %s", ex)
+        # Shared translation registry
+        self._translations = await async_get_translations_registry(self.hass)
             
         self._initialized = True
         return True
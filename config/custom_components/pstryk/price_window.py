@@ -0,0 +1,177 @@
+"""Cheapest contiguous price window search for Pstryk and RCE price lists."""
+import logging
+from datetime import datetime, timedelta, tzinfo
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+MODE_BUY = "buy"
+MODE_SELL = "sell"
+
+# RCE PSE publishes 15-minute periods, "dtime" is the END of the period
+RCE_SLOT_LENGTH = timedelta(minutes=15)
+# Price keys of RCE entries and the factor to PLN/kWh: "rce_pln" is always PLN/MWh
+RCE_PRICE_KEYS = {"rce_pln": 1 / 1000, "price": 1.0}
+
+Slot = Tuple[datetime, float]
+
+
+def pstryk_prices_to_slots(prices: Sequence[Dict[str, Any]], tz: Optional[tzinfo] = None) -> List[Slot]:
+    """Convert coordinator "prices" entries ({"start", "price"}) to sorted slots."""
+    slots = []
+    for entry in prices:
+        start = entry.get("start")
+        price = entry.get("price")
+        if not start or price is None:
+            continue
+        try:
+            start_dt = datetime.fromisoformat(start)
+        except ValueError:
+            continue
+        if tz is not None and start_dt.tzinfo is None:
+            start_dt = start_dt.replace(tzinfo=tz)
+        slots.append((start_dt, float(price)))
+    slots.sort(key=lambda s: s[0])
+    return slots
+
+
+def rce_prices_to_slots(prices: Sequence[Dict[str, Any]], tz: Optional[tzinfo] = None) -> List[Slot]:
+    """Convert RCE PSE "prices" attribute entries ({"dtime", "rce_pln"}) to sorted slots.
+
+    The unit follows from the price key of the list, not from the values:
+    "rce_pln" is PLN/MWh (also when small or negative) and is converted to
+    PLN/kWh, lists without it carry PLN/kWh in "price".
+    """
+    key = "rce_pln" if any("rce_pln" in entry for entry in prices) else "price"
+    factor = RCE_PRICE_KEYS[key]
+    slots = []
+    for entry in prices:
+        dtime = entry.get("dtime")
+        price = entry.get(key)
+        if not dtime or price is None:
+            continue
+        try:
+            end_dt = datetime.fromisoformat(str(dtime).replace(" ", "T"))
+            price = float(price) * factor
+        except (TypeError, ValueError):
+            continue
+        if tz is not None and end_dt.tzinfo is None:
+            end_dt = end_dt.replace(tzinfo=tz)
+        slots.append((end_dt - RCE_SLOT_LENGTH, price))
+    slots.sort(key=lambda s: s[0])
+    return slots
+
+
+def _detect_slot_length(slots: Sequence[Slot]) -> timedelta:
+    """Return the smallest positive spacing between slots (1h if unknown)."""
+    slot_length = None
+    for i in range(1, len(slots)):
+        step = slots[i][0] - slots[i - 1][0]
+        if step > timedelta(0) and (slot_length is None or step < slot_length):
+            slot_length = step
+    return slot_length or timedelta(hours=1)
+
+
+def _slot_weights(k: int, slot_hours: float, energy_profile: Optional[Sequence[float]]) -> List[float]:
+    """Energy (kWh) drawn or exported in each slot of the window."""
+    if not energy_profile:
+        # No profile: 1 kW flat, so the cost equals the average price × duration
+        return [slot_hours] * k
+    if len(energy_profile) == k:
+        return [float(e) for e in energy_profile]
+
+    # Profile given per hour - spread each hour evenly over its slots
+    slots_per_hour = max(1, round(1 / slot_hours))
+    if len(energy_profile) * slots_per_hour != k:
+        raise ValueError(
+            f"energy_profile has {len(energy_profile)} entries, expected {k} slots "
+            f"or {k // slots_per_hour} hours"
+        )
+    return [float(energy_profile[i // slots_per_hour]) / slots_per_hour for i in range(k)]
+
+
+def find_cheapest_window(
+    slots: Sequence[Slot],
+    duration: timedelta,
+    not_before: Optional[datetime] = None,
+    deadline: Optional[datetime] = None,
+    energy_profile: Optional[Sequence[float]] = None,
+    mode: str = MODE_BUY,
+    slot_length: Optional[timedelta] = None,
+) -> Optional[Dict[str, Any]]:
+    """Find the cheapest (buy) or best paid (sell) contiguous window.
+
+    ``slots`` are (start, price per kWh) pairs sorted by start. The slot in
+    progress at ``not_before`` counts as available and the window has to end
+    at or before ``deadline``. Gaps in the price list break contiguity.
+
+    A flat profile uses a running sum, so the search is O(n). A non-flat
+    ``energy_profile`` (kWh per slot or per hour) costs O(n·k), where k is
+    the number of slots in the window.
+
+    Returns None when no window fits.
+    """
+    if not slots:
+        return None
+    if mode not in (MODE_BUY, MODE_SELL):
+        raise ValueError(f"Unknown mode: {mode}")
+
+    slot_length = slot_length or _detect_slot_length(slots)
+    slot_hours = slot_length.total_seconds() / 3600
+    k = max(1, round(duration / slot_length))
+    weights = _slot_weights(k, slot_hours, energy_profile)
+    flat = all(w == weights[0] for w in weights)
+
+    # Only slots that are not over yet and end before the deadline
+    usable = [
+        s for s in slots
+        if (not_before is None or s[0] + slot_length > not_before)
+        and (deadline is None or s[0] + slot_length <= deadline)
+    ]
+    if len(usable) < k:
+        return None
+
+    prices = [s[1] for s in usable]
+    # Buy minimises the cost, sell maximises the revenue
+    sign = 1.0 if mode == MODE_BUY else -1.0
+
+    best_index = None
+    best_score = None
+    run_start = 0
+    running_sum = 0.0
+
+    for i in range(len(usable)):
+        if i > 0 and usable[i][0] - usable[i - 1][0] != slot_length:
+            run_start = i
+            running_sum = 0.0
+
+        running_sum += prices[i]
+        if i - run_start + 1 > k:
+            running_sum -= prices[i - k]
+        if i - run_start + 1 < k:
+            continue
+
+        first = i - k + 1
+        if flat:
+            score = running_sum * weights[0]
+        else:
+            score = sum(prices[first + j] * weights[j] for j in range(k))
+
+        if best_score is None or sign * score < sign * best_score:
+            best_score = score
+            best_index = first
+
+    if best_index is None:
+        return None
+
+    energy = sum(weights)
+    start = usable[best_index][0]
+    return {
+        "start": start,
+        "end": start + slot_length * k,
+        "expected_cost": round(best_score, 4),
+        "average_price": round(best_score / energy, 4) if energy else None,
+        "energy": round(energy, 3),
+        "slots": k,
+        "mode": mode,
+    }
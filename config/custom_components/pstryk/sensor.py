@@ -19,13 +19,14 @@ from .const import (
     DEFAULT_RETRY_ATTEMPTS,
     DEFAULT_RETRY_DELAY
 )
-from homeassistant.helpers.translation import async_get_translations
+from .translation_cache import (
+    PstrykTranslations,
+    async_get_translations_registry,
+    get_translations_registry,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-# Store translations globally to avoid reloading for each sensor
-_TRANSLATIONS_CACHE = {}
-
 # Cache for manifest version
 _VERSION_CACHE = None
 
@@ -67,16 +68,8 @@ async def async_setup_entry(
     _LOGGER.debug("Setting up Pstryk sensors with buy_top=%d, sell_top=%d, buy_worst=%d, sell_worst=%d, mqtt_48h_mode=%s, retry_attempts=%d, retry_delay=%ds", 
                  buy_top, sell_top, buy_worst, sell_worst, mqtt_48h_mode, retry_attempts, retry_delay)
 
-    # Load translations once for all sensors
-    global _TRANSLATIONS_CACHE
-    if not _TRANSLATIONS_CACHE:
-        try:
-            _TRANSLATIONS_CACHE = await async_get_translations(
-                hass, hass.config.language, DOMAIN, ["entity", "debug"]
-            )
-        except Exception as ex:
-            _LOGGER.warning("Failed to load translations: %s", ex)
-            _TRANSLATIONS_CACHE = {}
+    # Load translations once for all sensors and coordinators
+    await async_get_translations_registry(hass)
 
     # Cleanup old coordinators if they exist
     for price_type in ("buy", "sell"):
@@ -274,6 +267,11 @@ class PstrykPriceSensor(CoordinatorEntity, SensorEntity):
         """When entity is added to Home Assistant."""
         await super().async_added_to_hass()
 
+    @property
+    def _translations(self) -> PstrykTranslations:
+        """Shared translation registry."""
+        return get_translations_registry(self.hass)
+
     @property
     def name(self) -> str:
         return f"Pstryk Current {self.price_type.title()} Price"
@@ -346,11 +344,12 @@ class PstrykPriceSensor(CoordinatorEntity, SensorEntity):
         next_hour = (now + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
         
         # Use translations for debug messages
-        debug_msg = _TRANSLATIONS_CACHE.get(
-            "debug.looking_for_next_hour", 
-            "Looking for price for next hour: {next_hour}"
-        ).format(next_hour=next_hour.strftime("%Y-%m-%d %H:%M:%S"))
-        _LOGGER.debug(debug_msg)
+        translations = self._translations
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(translations.format(
+                "debug.looking_for_next_hour",
+                next_hour=next_hour.strftime("%Y-%m-%d %H:%M:%S")
+            ))
         
         # Check if we're looking for the next day's hour (midnight)
         is_looking_for_next_day = next_hour.day != now.day
@@ -374,10 +373,9 @@ class PstrykPriceSensor(CoordinatorEntity, SensorEntity):
                         _LOGGER.debug("Found price for %s in today's list: %s", next_hour.strftime("%Y-%m-%d %H:%M:%S"), price_found)
                         return price_found
                 except Exception as e:
-                    error_msg = _TRANSLATIONS_CACHE.get(
-                        "debug.error_processing_date", 
-                        "Error processing date: {error}"
-                    ).format(error=str(e))
+                    error_msg = translations.format(
+                        "debug.error_processing_date", error=str(e)
+                    )
                     _LOGGER.error(error_msg)
         
         # Always check the full list as a fallback, regardless of day
@@ -401,24 +399,20 @@ class PstrykPriceSensor(CoordinatorEntity, SensorEntity):
                         _LOGGER.debug("Found price for %s in full 48h list: %s", next_hour.strftime("%Y-%m-%d %H:%M:%S"), price_found)
                         return price_found
                 except Exception as e:
-                    full_list_error_msg = _TRANSLATIONS_CACHE.get(
-                        "debug.error_processing_full_list", 
-                        "Error processing date for full list: {error}"
-                    ).format(error=str(e))
+                    full_list_error_msg = translations.format(
+                        "debug.error_processing_full_list", error=str(e)
+                    )
                     _LOGGER.error(full_list_error_msg)
         
         # If no price found for next hour
         if is_looking_for_next_day:
-            midnight_msg = _TRANSLATIONS_CACHE.get(
-                "debug.no_price_midnight", 
-                "No price found for next day midnight. Data probably not loaded yet."
-            )
+            midnight_msg = translations.format("debug.no_price_midnight")
             _LOGGER.info(midnight_msg)
         else:
-            no_price_msg = _TRANSLATIONS_CACHE.get(
-                "debug.no_price_next_hour", 
-                "No price found for next hour: {next_hour}"
-            ).format(next_hour=next_hour.strftime("%Y-%m-%d %H:%M:%S"))
+            no_price_msg = translations.format(
+                "debug.no_price_next_hour",
+                next_hour=next_hour.strftime("%Y-%m-%d %H:%M:%S")
+            )
             _LOGGER.warning(no_price_msg)
                 
         return None
@@ -627,82 +621,21 @@ class PstrykPriceSensor(CoordinatorEntity, SensorEntity):
         """Include the price table attributes in the current price sensor."""
         now = dt_util.as_local(dt_util.utcnow())
         
-        # Get translated attribute names from cache
-        next_hour_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.next_hour", 
-            "Next hour"
-        )
-        
-        using_cached_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.using_cached_data", 
-            "Using cached data"
-        )
-        
-        all_prices_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.all_prices", 
-            "All prices"
-        )
-        
-        best_prices_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.best_prices", 
-            "Best prices"
-        )
-        
-        worst_prices_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.worst_prices", 
-            "Worst prices"
-        )
-        
-        best_count_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.best_count", 
-            "Best count"
-        )
-        
-        worst_count_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.worst_count", 
-            "Worst count"
-        )
-        
-        price_count_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.price_count", 
-            "Price count"
-        )
-        
-        last_updated_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.last_updated", 
-            "Last updated"
-        )
-        
-        avg_price_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.avg_price", 
-            "Average price today"
-        )
-        
-        avg_price_remaining_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.avg_price_remaining",
-            "Average price remaining"
-        )
-        
-        avg_price_full_day_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.avg_price_full_day",
-            "Average price full day"
-        )
-        
-        tomorrow_available_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.tomorrow_available", 
-            "Tomorrow prices available"
-        )
-        
-        mqtt_price_count_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.mqtt_price_count", 
-            "MQTT price count"
-        )
-        
-        # Add sunrise/sunset average key
-        avg_price_sunrise_sunset_key = _TRANSLATIONS_CACHE.get(
-            "entity.sensor.avg_price_sunrise_sunset",
-            "Average price today s/s"
-        )
+        # Attribute names are resolved once per language by the registry
+        names = self._translations.price_attribute_names
+        next_hour_key = names["next_hour"]
+        using_cached_key = names["using_cached_data"]
+        all_prices_key = names["all_prices"]
+        best_prices_key = names["best_prices"]
+        worst_prices_key = names["worst_prices"]
+        best_count_key = names["best_count"]
+        worst_count_key = names["worst_count"]
+        price_count_key = names["price_count"]
+        last_updated_key = names["last_updated"]
+        avg_price_key = names["avg_price"]
+        tomorrow_available_key = names["tomorrow_available"]
+        mqtt_price_count_key = names["mqtt_price_count"]
+        avg_price_sunrise_sunset_key = names["avg_price_sunrise_sunset"]
         
         if self.coordinator.data is None:
             return {
@@ -832,7 +765,12 @@ class PstrykAveragePriceSensor(RestoreEntity, SensorEntity):
         self._energy_sold = 0.0
         self._total_cost = 0.0
         self._total_revenue = 0.0
-        
+
+    @property
+    def _translations(self) -> PstrykTranslations:
+        """Shared translation registry."""
+        return get_translations_registry(self.hass)
+
     async def async_added_to_hass(self):
         """Restore state when entity is added."""
         await super().async_added_to_hass()
@@ -863,7 +801,7 @@ class PstrykAveragePriceSensor(RestoreEntity, SensorEntity):
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        period_name = _TRANSLATIONS_CACHE.get(
+        period_name = self._translations.get(
             f"entity.sensor.period_{self.period}",
             self.period.title()
         )
@@ -898,27 +836,27 @@ class PstrykAveragePriceSensor(RestoreEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict:
         """Return extra state attributes."""
-        period_key = _TRANSLATIONS_CACHE.get(
+        period_key = self._translations.get(
             "entity.sensor.period",
             "Period"
         )
-        calculation_method_key = _TRANSLATIONS_CACHE.get(
+        calculation_method_key = self._translations.get(
             "entity.sensor.calculation_method",
             "Calculation method"
         )
-        energy_bought_key = _TRANSLATIONS_CACHE.get(
+        energy_bought_key = self._translations.get(
             "entity.sensor.energy_bought",
             "Energy bought"
         )
-        energy_sold_key = _TRANSLATIONS_CACHE.get(
+        energy_sold_key = self._translations.get(
             "entity.sensor.energy_sold",
             "Energy sold"
         )
-        total_cost_key = _TRANSLATIONS_CACHE.get(
+        total_cost_key = self._translations.get(
             "entity.sensor.total_cost",
             "Total cost"
         )
-        total_revenue_key = _TRANSLATIONS_CACHE.get(
+        total_revenue_key = self._translations.get(
             "entity.sensor.total_revenue",
             "Total revenue"
         )
@@ -936,7 +874,7 @@ class PstrykAveragePriceSensor(RestoreEntity, SensorEntity):
             attrs[total_revenue_key] = round(self._total_revenue, 2)
             
         # Add last updated at the bottom
-        last_updated_key = _TRANSLATIONS_CACHE.get(
+        last_updated_key = self._translations.get(
             "entity.sensor.last_updated", 
             "Last updated"
         )
@@ -1001,15 +939,20 @@ class PstrykFinancialBalanceSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self.period = period  # 'daily', 'monthly', or 'yearly'
         self.entry_id = entry_id
+
+    @property
+    def _translations(self) -> PstrykTranslations:
+        """Shared translation registry."""
+        return get_translations_registry(self.hass)
         
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        period_name = _TRANSLATIONS_CACHE.get(
+        period_name = self._translations.get(
             f"entity.sensor.period_{self.period}",
             self.period.title()
         )
-        balance_text = _TRANSLATIONS_CACHE.get(
+        balance_text = self._translations.get(
             "entity.sensor.financial_balance",
             "Financial Balance"
         )
@@ -1074,47 +1017,47 @@ class PstrykFinancialBalanceSensor(CoordinatorEntity, SensorEntity):
         frame = period_data.get("frame", {})
         
         # Get translated attribute names
-        buy_cost_key = _TRANSLATIONS_CACHE.get(
+        buy_cost_key = self._translations.get(
             "entity.sensor.buy_cost",
             "Buy cost"
         )
-        sell_revenue_key = _TRANSLATIONS_CACHE.get(
+        sell_revenue_key = self._translations.get(
             "entity.sensor.sell_revenue",
             "Sell revenue"
         )
-        period_key = _TRANSLATIONS_CACHE.get(
+        period_key = self._translations.get(
             "entity.sensor.period",
             "Period"
         )
-        net_balance_key = _TRANSLATIONS_CACHE.get(
+        net_balance_key = self._translations.get(
             "entity.sensor.balance",
             "Balance"
         )
-        energy_cost_key = _TRANSLATIONS_CACHE.get(
+        energy_cost_key = self._translations.get(
             "entity.sensor.buy_cost",
             "Buy cost"
         )
-        distribution_cost_key = _TRANSLATIONS_CACHE.get(
+        distribution_cost_key = self._translations.get(
             "entity.sensor.distribution_cost",
             "Distribution cost"
         )
-        excise_key = _TRANSLATIONS_CACHE.get(
+        excise_key = self._translations.get(
             "entity.sensor.excise",
             "Excise"
         )
-        vat_key = _TRANSLATIONS_CACHE.get(
+        vat_key = self._translations.get(
             "entity.sensor.vat",
             "VAT"
         )
-        service_cost_key = _TRANSLATIONS_CACHE.get(
+        service_cost_key = self._translations.get(
             "entity.sensor.service_cost",
             "Service cost"
         )
-        energy_bought_key = _TRANSLATIONS_CACHE.get(
+        energy_bought_key = self._translations.get(
             "entity.sensor.energy_bought",
             "Energy bought"
         )
-        energy_sold_key = _TRANSLATIONS_CACHE.get(
+        energy_sold_key = self._translations.get(
             "entity.sensor.energy_sold", 
             "Energy sold"
         )
@@ -1147,7 +1090,7 @@ class PstrykFinancialBalanceSensor(CoordinatorEntity, SensorEntity):
             })
             
         # Add last updated at the bottom
-        last_updated_key = _TRANSLATIONS_CACHE.get(
+        last_updated_key = self._translations.get(
             "entity.sensor.last_updated", 
             "Last updated"
         )
@@ -1,16 +1,23 @@
 """Services for Pstryk Energy integration."""
 import logging
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.components import mqtt
-from homeassistant.helpers.translation import async_get_translations
 from homeassistant.helpers.event import async_track_point_in_time
 from datetime import timedelta
 from homeassistant.util import dt as dt_util
 
 from .mqtt_common import publish_mqtt_prices, setup_periodic_mqtt_publish
+from .translation_cache import async_get_translations_registry
+from .price_window import (
+    MODE_BUY,
+    MODE_SELL,
+    find_cheapest_window,
+    pstryk_prices_to_slots,
+    rce_prices_to_slots,
+)
 from .const import (
     DOMAIN, 
     DEFAULT_MQTT_TOPIC_BUY, 
@@ -23,6 +30,7 @@ _LOGGER = logging.getLogger(__name__)
 
 SERVICE_PUBLISH_MQTT = "publish_to_evcc"
 SERVICE_FORCE_RETAIN = "force_retain"
+SERVICE_FIND_CHEAPEST_WINDOW = "find_cheapest_window"
 
 PUBLISH_MQTT_SCHEMA = vol.Schema({
     vol.Optional("entry_id"): cv.string,
@@ -37,6 +45,15 @@ FORCE_RETAIN_SCHEMA = vol.Schema({
     vol.Optional("retain_hours", default=168): vol.All(vol.Coerce(int), vol.Range(min=1, max=720)),
 })
 
+FIND_CHEAPEST_WINDOW_SCHEMA = vol.Schema({
+    vol.Required("duration"): vol.All(vol.Coerce(float), vol.Range(min=0.25, max=48)),
+    vol.Optional("deadline"): cv.datetime,
+    vol.Optional("energy_profile"): vol.All(cv.ensure_list, [vol.Coerce(float)]),
+    vol.Optional("mode", default=MODE_BUY): vol.In([MODE_BUY, MODE_SELL]),
+    vol.Optional("entry_id"): cv.string,
+    vol.Optional("entity_id"): cv.entity_ids,
+})
+
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Pstryk integration."""
     
@@ -46,22 +63,10 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         topic_buy_override = service_call.data.get("topic_buy")
         topic_sell_override = service_call.data.get("topic_sell")
         
-        # Get translations for logs
-        try:
-            translations = await async_get_translations(
-                hass, hass.config.language, DOMAIN, ["mqtt"]
-            )
-        except Exception as e:
-            _LOGGER.warning("Failed to load translations for services: %s", e)
-            translations = {}
-            
         # Check if MQTT is available
         if not hass.services.has_service("mqtt", "publish"):
-            mqtt_disabled_msg = translations.get(
-                "mqtt.mqtt_disabled", 
-                "MQTT integration is not enabled"
-            )
-            _LOGGER.error(mqtt_disabled_msg)
+            translations = await async_get_translations_registry(hass)
+            _LOGGER.error(translations.format("mqtt.mqtt_disabled"))
             return
             
         # Find config entries for Pstryk
@@ -181,6 +186,72 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 retain_hours
             )
     
+    async def async_find_cheapest_window_service(service_call: ServiceCall) -> ServiceResponse:
+        """Return the cheapest contiguous window from cached Pstryk or RCE prices."""
+        entry_id = service_call.data.get("entry_id")
+        entity_ids = service_call.data.get("entity_id")
+        mode = service_call.data["mode"]
+        duration = timedelta(hours=service_call.data["duration"])
+        energy_profile = service_call.data.get("energy_profile")
+        deadline = service_call.data.get("deadline")
+        if deadline is not None:
+            deadline = dt_util.as_local(deadline)
+
+        tz = dt_util.get_default_time_zone()
+
+        if entity_ids:
+            # RCE PSE sensors (e.g. sensor.rce_pse_cena + sensor.rce_pse_cena_jutro)
+            prices = []
+            for entity_id in entity_ids:
+                state = hass.states.get(entity_id)
+                if state is None:
+                    _LOGGER.warning("Entity %s not found for cheapest window search", entity_id)
+                    continue
+                prices.extend(state.attributes.get("prices") or [])
+            slots = rce_prices_to_slots(prices, tz)
+            source = ", ".join(entity_ids)
+        else:
+            config_entries = hass.config_entries.async_entries(DOMAIN)
+            if entry_id:
+                config_entries = [entry for entry in config_entries if entry.entry_id == entry_id]
+            coordinator = None
+            for entry in config_entries:
+                coordinator = hass.data[DOMAIN].get(f"{entry.entry_id}_{mode}")
+                if coordinator:
+                    break
+            if not coordinator or not coordinator.data:
+                _LOGGER.error("No cached %s prices available for cheapest window search", mode)
+                return {"found": False, "reason": f"No cached {mode} prices"}
+            slots = pstryk_prices_to_slots(coordinator.data.get("prices", []), tz)
+            source = coordinator.name
+
+        try:
+            window = find_cheapest_window(
+                slots,
+                duration,
+                not_before=dt_util.now(),
+                deadline=deadline,
+                energy_profile=energy_profile,
+                mode=mode,
+            )
+        except ValueError as err:
+            _LOGGER.error("Invalid cheapest window request: %s", err)
+            return {"found": False, "reason": str(err)}
+
+        if window is None:
+            return {"found": False, "reason": "No window fits before the deadline", "source": source}
+
+        return {
+            "found": True,
+            "source": source,
+            "mode": window["mode"],
+            "start": window["start"].isoformat(),
+            "end": window["end"].isoformat(),
+            "expected_cost": window["expected_cost"],
+            "average_price": window["average_price"],
+            "energy": window["energy"],
+        }
+
     # Register the services
     hass.services.async_register(
         DOMAIN, 
@@ -196,6 +267,14 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         schema=FORCE_RETAIN_SCHEMA
     )
 
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FIND_CHEAPEST_WINDOW,
+        async_find_cheapest_window_service,
+        schema=FIND_CHEAPEST_WINDOW_SCHEMA,
+        supports_response=SupportsResponse.ONLY
+    )
+
 async def async_unload_services(hass: HomeAssistant) -> None:
     """Unload Pstryk services."""
     if hass.services.has_service(DOMAIN, SERVICE_PUBLISH_MQTT):
@@ -203,3 +282,6 @@ async def async_unload_services(hass: HomeAssistant) -> None:
         
     if hass.services.has_service(DOMAIN, SERVICE_FORCE_RETAIN):
         hass.services.async_remove(DOMAIN, SERVICE_FORCE_RETAIN)
+
+    if hass.services.has_service(DOMAIN, SERVICE_FIND_CHEAPEST_WINDOW):
+        hass.services.async_remove(DOMAIN, SERVICE_FIND_CHEAPEST_WINDOW)
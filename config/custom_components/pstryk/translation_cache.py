@@ -0,0 +1,134 @@
+"""Shared translation registry for Pstryk Energy integration."""
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.translation import async_get_translations
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TRANSLATIONS = "translations"
+DATA_TRANSLATIONS_LOCK = "translations_lock"
+
+TRANSLATION_CATEGORIES = ["entity", "debug", "mqtt"]
+
+# Message templates used on the hourly refresh and API retry paths
+HOT_TEMPLATES = {
+    "debug.looking_for_next_hour": "Looking for price for next hour: {next_hour}",
+    "debug.error_processing_date": "Error processing date: {error}",
+    "debug.error_processing_full_list": "Error processing date for full list: {error}",
+    "debug.no_price_midnight": "No price found for next day midnight. Data probably not loaded yet.",
+    "debug.no_price_next_hour": "No price found for next hour: {next_hour}",
+    "debug.unexpected_error": "Unexpected error fetching {price_type} data: {error}",
+    "debug.unexpected_error_user": "Error: {error}",
+    "debug.api_error_html": "API error {status} for {endpoint} (HTML error page received)",
+    "debug.rate_limited": "Endpoint '{endpoint}' is rate limited. Will retry after {seconds} seconds",
+    "debug.waiting_rate_limit": "Waiting {seconds} seconds for rate limit to clear",
+    "mqtt.mqtt_disabled": "MQTT integration is not enabled",
+}
+
+# Attribute names of the current price sensor, resolved once per language
+PRICE_SENSOR_ATTRIBUTES = {
+    "next_hour": "Next hour",
+    "using_cached_data": "Using cached data",
+    "all_prices": "All prices",
+    "best_prices": "Best prices",
+    "worst_prices": "Worst prices",
+    "best_count": "Best count",
+    "worst_count": "Worst count",
+    "price_count": "Price count",
+    "last_updated": "Last updated",
+    "avg_price": "Average price today",
+    "tomorrow_available": "Tomorrow prices available",
+    "mqtt_price_count": "MQTT price count",
+    "avg_price_sunrise_sunset": "Average price today s/s",
+}
+
+
+def _short_key(key: str) -> str:
+    """Strip the component prefix async_get_translations may add."""
+    for prefix in (f"component.{DOMAIN}.", f"{DOMAIN}."):
+        if key.startswith(prefix):
+            return key[len(prefix):]
+    return key
+
+
+class PstrykTranslations:
+    """Translations for one language, shared by all Pstryk components."""
+
+    def __init__(self, language: Optional[str], strings: Dict[str, str]):
+        """Normalize keys and resolve the hot templates once."""
+        self.language = language
+        self._strings = {_short_key(key): value for key, value in strings.items()}
+        self._templates = {
+            key: self._strings.get(key) or default
+            for key, default in HOT_TEMPLATES.items()
+        }
+        self.price_attribute_names = {
+            name: self._strings.get(f"entity.sensor.{name}") or default
+            for name, default in PRICE_SENSOR_ATTRIBUTES.items()
+        }
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get a translated string by short key (e.g. "entity.sensor.period")."""
+        return self._strings.get(key, default)
+
+    def format(self, key: str, default: Optional[str] = None, **kwargs) -> str:
+        """Get a translated template and fill in its placeholders."""
+        template = self._templates.get(key) or self._strings.get(key) or default or key
+        try:
+            return template.format(**kwargs)
+        except (KeyError, IndexError, ValueError) as err:
+            _LOGGER.warning("Failed to format translation template '%s': %s", template, err)
+            return template
+
+
+EMPTY_TRANSLATIONS = PstrykTranslations(None, {})
+
+
+async def async_get_translations_registry(hass: HomeAssistant) -> PstrykTranslations:
+    """Return the registry for the current language, loading it on first use.
+
+    The registry is reloaded only when the configured language changes.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    registry = domain_data.get(DATA_TRANSLATIONS)
+    language = hass.config.language
+    if registry is not None and registry.language == language:
+        return registry
+
+    lock = domain_data.setdefault(DATA_TRANSLATIONS_LOCK, asyncio.Lock())
+    async with lock:
+        registry = domain_data.get(DATA_TRANSLATIONS)
+        if registry is not None and registry.language == language:
+            return registry
+
+        try:
+            strings = await async_get_translations(
+                hass, language, DOMAIN, TRANSLATION_CATEGORIES
+            )
+        except Exception as ex:
+            _LOGGER.warning("Failed to load translations: %s", ex)
+            strings = {}
+
+        registry = PstrykTranslations(language, strings)
+        domain_data[DATA_TRANSLATIONS] = registry
+        _LOGGER.debug("Loaded %d translation keys for language %s", len(strings), language)
+        return registry
+
+
+def get_translations_registry(hass: HomeAssistant) -> PstrykTranslations:
+    """Return the loaded registry without awaiting (fallback strings if not loaded yet)."""
+    if hass is None:
+        return EMPTY_TRANSLATIONS
+    return hass.data.get(DOMAIN, {}).get(DATA_TRANSLATIONS) or EMPTY_TRANSLATIONS
+
+
+def async_clear_translations_registry(hass: HomeAssistant) -> None:
+    """Drop the cached registry (last config entry unloaded)."""
+    domain_data = hass.data.get(DOMAIN, {})
+    domain_data.pop(DATA_TRANSLATIONS, None)
+    domain_data.pop(DATA_TRANSLATIONS_LOCK, None)
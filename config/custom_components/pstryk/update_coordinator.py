@@ -5,7 +5,6 @@ import asyncio
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.util import dt as dt_util
-from homeassistant.helpers.translation import async_get_translations
 from .const import (
     API_URL,
     BUY_ENDPOINT,
@@ -15,6 +14,7 @@ from .const import (
     DEFAULT_RETRY_DELAY
 )
 from .api_client import PstrykAPIClient
+from .translation_cache import EMPTY_TRANSLATIONS, async_get_translations_registry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,7 +40,7 @@ class PstrykDataUpdateCoordinator(DataUpdateCoordinator):
         self._unsub_hourly = None
         self._unsub_midnight = None
         self._unsub_afternoon = None
-        self._translations = {}
+        self._translations = EMPTY_TRANSLATIONS
         self._had_tomorrow_prices = False
 
         # Get retry configuration
@@ -168,13 +168,8 @@ class PstrykDataUpdateCoordinator(DataUpdateCoordinator):
         now_utc = dt_util.utcnow()
 
         try:
-            # Load translations
-            try:
-                self._translations = await async_get_translations(
-                    self.hass, self.hass.config.language, DOMAIN, ["debug"]
-                )
-            except Exception as ex:
-                _LOGGER.warning("Failed to load translations for coordinator: %s", ex)
+            # Shared registry - only reloaded when the language changes
+            self._translations = await async_get_translations_registry(self.hass)
 
             # Use shared API client
             data = await self.api_client.fetch(
@@ -234,20 +229,18 @@ class PstrykDataUpdateCoordinator(DataUpdateCoordinator):
             raise
 
         except Exception as err:
-            error_msg = self._translations.get(
-                "debug.unexpected_error",
-                "Unexpected error fetching {price_type} data: {error}"
-            ).format(price_type=self.price_type, error=str(err))
+            error_msg = self._translations.format(
+                "debug.unexpected_error", price_type=self.price_type, error=str(err)
+            )
             _LOGGER.exception(error_msg)
 
             if previous_data:
                 _LOGGER.warning("Using cached data from previous update due to API failure")
                 return previous_data
 
-            raise UpdateFailed(self._translations.get(
-                "debug.unexpected_error_user",
-                "Error: {error}"
-            ).format(error=err))
+            raise UpdateFailed(self._translations.format(
+                "debug.unexpected_error_user", error=err
+            ))
 
     def schedule_hourly_update(self):
         """Schedule next refresh 1 min after each full hour."""
@@ -0,0 +1,27 @@
+"""Calibrated hourly PV forecast from the Forecast.Solar planes."""
+from __future__ import annotations
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+
+from .calibration import PvCalibration
+from .calibrator import PvForecastCalibrator
+from .const import DOMAIN, STORAGE_KEY, STORAGE_VERSION
+
+CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Load the learned calibration and start the calibrator."""
+    store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    calibration = PvCalibration.from_dict(await store.async_load())
+    calibrator = PvForecastCalibrator(hass, calibration, store)
+    hass.data[DOMAIN] = calibrator
+
+    calibrator.async_start()
+    hass.async_create_task(async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config))
+    return True
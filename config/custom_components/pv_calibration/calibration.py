@@ -0,0 +1,174 @@
+"""Forecast.Solar calibration per plane, month and hour."""
+from datetime import date, datetime, timedelta
+from typing import Sequence
+
+HOURS_PER_DAY = 24
+PLANES = ("east", "south", "west")
+
+# Starting factors, the seasonal defaults of the old Jinja calibration
+DEFAULT_MONTHLY_FACTORS = {
+    1: 0.50, 2: 0.60, 3: 0.75, 4: 0.85, 5: 0.90, 6: 0.90,
+    7: 0.90, 8: 0.90, 9: 0.85, 10: 0.75, 11: 0.60, 12: 0.50,
+}
+
+# Recursive least squares forgetting factor, ~200 hourly samples of memory
+FORGETTING = 0.995
+INITIAL_COVARIANCE = 0.5
+MAX_COVARIANCE = 10.0
+FACTOR_LIMITS = (0.2, 1.3)
+
+HOUR_RATIO_ALPHA = 0.1
+HOUR_RATIO_LIMITS = (0.5, 1.5)
+
+# Hours with less forecast than this (dawn, dusk) say nothing about the factors
+MIN_FORECAST_KWH = 0.05
+
+WATTS_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _clip(value: float, limits: tuple[float, float]) -> float:
+    return min(max(value, limits[0]), limits[1])
+
+
+def hourly_energy(watts: dict, day: date) -> list[float]:
+    """kWh per hour of ``day`` from a Forecast.Solar ``watts`` attribute.
+
+    ``watts`` maps ``"YYYY-MM-DD HH:MM:SS"`` to the forecast power at that
+    moment. Power is taken as linear between points (zero at the first and
+    last point of the day) and integrated per hour.
+    """
+    points = []
+    for key, value in (watts or {}).items():
+        try:
+            when = datetime.strptime(key, WATTS_TIME_FORMAT)
+            points.append((when, float(value)))
+        except (TypeError, ValueError):
+            continue
+    points = sorted(point for point in points if point[0].date() == day)
+
+    result = [0.0] * HOURS_PER_DAY
+    for (start, start_power), (end, end_power) in zip(points, points[1:]):
+        seconds = (end - start).total_seconds()
+        if seconds <= 0:
+            continue
+        cursor = start
+        while cursor < end:
+            hour_end = min(end, cursor.replace(minute=0, second=0) + timedelta(hours=1))
+            p0 = start_power + (end_power - start_power) * (cursor - start).total_seconds() / seconds
+            p1 = start_power + (end_power - start_power) * (hour_end - start).total_seconds() / seconds
+            result[cursor.hour] += (p0 + p1) / 2 * (hour_end - cursor).total_seconds() / 3600 / 1000
+            cursor = hour_end
+    return [round(value, 4) for value in result]
+
+
+class PvCalibration:
+    """Correction of the plane forecasts, learned from actual production.
+
+    Each month has a factor per plane, fitted by recursive least squares on
+    hourly samples (actual = sum of factor x plane forecast). The planes peak
+    at different hours, which is what lets the fit tell them apart. On top of
+    that each month keeps an EMA of the remaining actual/forecast ratio per
+    hour of day, for effects like shading at a given sun position.
+
+    Stored as plain dicts and lists so it can go straight into a Store.
+    """
+
+    def __init__(self, initial_factors: dict[int, float] | None = None):
+        self._initial = {**DEFAULT_MONTHLY_FACTORS, **(initial_factors or {})}
+        self._months: dict[int, dict] = {}
+
+    @classmethod
+    def from_dict(cls, data: dict | None, initial_factors: dict[int, float] | None = None) -> "PvCalibration":
+        """Restore a calibration saved with as_dict(); invalid months are dropped."""
+        calibration = cls(initial_factors)
+        for month, values in ((data or {}).get("months") or {}).items():
+            try:
+                month = int(month)
+                state = {
+                    "factors": [float(value) for value in values["factors"]],
+                    "covariance": [[float(value) for value in row] for row in values["covariance"]],
+                    "hour_ratio": [float(value) for value in values["hour_ratio"]],
+                    "samples": int(values.get("samples", 0)),
+                }
+            except (KeyError, TypeError, ValueError):
+                continue
+            if (
+                len(state["factors"]) == len(PLANES)
+                and len(state["covariance"]) == len(PLANES)
+                and len(state["hour_ratio"]) == HOURS_PER_DAY
+            ):
+                calibration._months[month] = state
+        return calibration
+
+    def as_dict(self) -> dict:
+        """Data to persist."""
+        return {"months": {str(month): state for month, state in self._months.items()}}
+
+    def _month(self, month: int) -> dict:
+        state = self._months.get(month)
+        if state is None:
+            factor = self._initial.get(month, 0.75)
+            state = self._months[month] = {
+                "factors": [factor] * len(PLANES),
+                "covariance": [
+                    [INITIAL_COVARIANCE if row == column else 0.0 for column in range(len(PLANES))]
+                    for row in range(len(PLANES))
+                ],
+                "hour_ratio": [1.0] * HOURS_PER_DAY,
+                "samples": 0,
+            }
+        return state
+
+    def add_hour(self, month: int, hour: int, forecasts: Sequence[float], actual: float) -> bool:
+        """Learn from one hour: plane forecasts (kWh, PLANES order) vs actual kWh."""
+        if sum(forecasts) < MIN_FORECAST_KWH or actual < 0:
+            return False
+        state = self._month(month)
+        factors, covariance = state["factors"], state["covariance"]
+        size = len(PLANES)
+
+        # RLS: gain = P x / (lambda + x' P x), factors += gain * error, P = (P - gain x' P) / lambda
+        px = [sum(covariance[row][column] * forecasts[column] for column in range(size)) for row in range(size)]
+        denominator = FORGETTING + sum(forecasts[row] * px[row] for row in range(size))
+        gain = [value / denominator for value in px]
+        error = actual - sum(factors[plane] * forecasts[plane] for plane in range(size))
+        for plane in range(size):
+            factors[plane] = round(_clip(factors[plane] + gain[plane] * error, FACTOR_LIMITS), 4)
+        for row in range(size):
+            for column in range(size):
+                covariance[row][column] = (covariance[row][column] - gain[row] * px[column]) / FORGETTING
+        # Forgetting inflates P for planes that get no sun this month (no excitation), keep it bounded
+        largest = max(covariance[plane][plane] for plane in range(size))
+        if largest > MAX_COVARIANCE:
+            for row in covariance:
+                row[:] = [value * MAX_COVARIANCE / largest for value in row]
+
+        base = sum(factors[plane] * forecasts[plane] for plane in range(size))
+        if base >= MIN_FORECAST_KWH:
+            ratio = _clip(actual / base, HOUR_RATIO_LIMITS)
+            hour_ratio = state["hour_ratio"]
+            hour_ratio[hour] = round((1 - HOUR_RATIO_ALPHA) * hour_ratio[hour] + HOUR_RATIO_ALPHA * ratio, 4)
+        state["samples"] += 1
+        return True
+
+    def factors(self, month: int) -> dict[str, float]:
+        """Plane factors of a month."""
+        factors = self._months[month]["factors"] if month in self._months else [self._initial.get(month, 0.75)] * len(PLANES)
+        return dict(zip(PLANES, factors))
+
+    def samples(self, month: int) -> int:
+        """Hourly samples learned in a month."""
+        return self._months[month]["samples"] if month in self._months else 0
+
+    def correct_hour(self, month: int, hour: int, forecasts: Sequence[float]) -> float:
+        """Corrected kWh for one hour from plane forecasts (PLANES order)."""
+        factors = self.factors(month)
+        hour_ratio = self._months[month]["hour_ratio"][hour] if month in self._months else 1.0
+        return max(0.0, sum(factors[plane] * forecast for plane, forecast in zip(PLANES, forecasts)) * hour_ratio)
+
+    def correct_day(self, month: int, planes: dict[str, Sequence[float]]) -> list[float]:
+        """Corrected kWh per hour of a day from the hourly forecast of each plane."""
+        return [
+            round(self.correct_hour(month, hour, [planes.get(plane, [0.0] * HOURS_PER_DAY)[hour] for plane in PLANES]), 3)
+            for hour in range(HOURS_PER_DAY)
+        ]
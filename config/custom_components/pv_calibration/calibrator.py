@@ -0,0 +1,106 @@
+"""Keeps the calibration fed with actual production and the corrected forecast current."""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+import logging
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_state_change_event, async_track_time_change
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .calibration import HOURS_PER_DAY, PLANES, PvCalibration, hourly_energy
+from .const import (
+    PLANE_SENSORS,
+    SAMPLE_MINUTE,
+    SAMPLE_SECOND,
+    SAVE_DELAY,
+    SENSOR_PV_HOURLY,
+    SIGNAL_FORECAST_UPDATED,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PvForecastCalibrator:
+    """Learns from every hour of production and publishes the corrected forecast.
+
+    Just before the hourly PV meter resets, its value is compared with the
+    forecast of each plane for that hour. The corrected hourly forecast for
+    today and tomorrow is rebuilt when a plane forecast changes, after each
+    sample and at midnight.
+    """
+
+    def __init__(self, hass: HomeAssistant, calibration: PvCalibration, store: Store):
+        self.hass = hass
+        self.calibration = calibration
+        self._store = store
+        self.days: dict[str, dict] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Start listening."""
+        async_track_state_change_event(self.hass, list(PLANE_SENSORS.values()), self._async_forecast_changed)
+        async_track_time_change(self.hass, self._async_sample, minute=SAMPLE_MINUTE, second=SAMPLE_SECOND)
+        async_track_time_change(self.hass, self._async_new_day, hour=0, minute=0, second=5)
+        if self.hass.state is CoreState.running:
+            self.async_update_forecast()
+        else:
+            self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, self._async_forecast_changed)
+
+    def _plane_forecasts(self, day: date) -> dict[str, list[float]]:
+        """Raw kWh per hour of each plane for a day."""
+        planes = {}
+        for plane, entity_id in PLANE_SENSORS.items():
+            state = self.hass.states.get(entity_id)
+            watts = state.attributes.get("watts") if state is not None else None
+            planes[plane] = hourly_energy(watts, day) if watts else [0.0] * HOURS_PER_DAY
+        return planes
+
+    @callback
+    def async_update_forecast(self) -> None:
+        """Rebuild the corrected forecast of today and tomorrow."""
+        today = dt_util.now().date()
+        days = {}
+        for key, day in (("today", today), ("tomorrow", today + timedelta(days=1))):
+            planes = self._plane_forecasts(day)
+            raw = [round(sum(planes[plane][hour] for plane in PLANES), 3) for hour in range(HOURS_PER_DAY)]
+            days[key] = {
+                "date": day.isoformat(),
+                "hourly": self.calibration.correct_day(day.month, planes),
+                "raw": raw,
+            }
+        self.days = days
+        async_dispatcher_send(self.hass, SIGNAL_FORECAST_UPDATED)
+
+    @callback
+    def _async_forecast_changed(self, _event: Event) -> None:
+        self.async_update_forecast()
+
+    @callback
+    def _async_new_day(self, _now: datetime) -> None:
+        self.async_update_forecast()
+
+    @callback
+    def _async_sample(self, now: datetime) -> None:
+        now = dt_util.as_local(now)
+        state = self.hass.states.get(SENSOR_PV_HOURLY)
+        if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            return
+        try:
+            actual = float(state.state)
+        except ValueError:
+            return
+
+        planes = self._plane_forecasts(now.date())
+        forecasts = [planes[plane][now.hour] for plane in PLANES]
+        if not self.calibration.add_hour(now.month, now.hour, forecasts, actual):
+            return
+        _LOGGER.debug(
+            "Hour %s: forecast %s kWh, actual %.3f kWh, factors %s",
+            now.hour, forecasts, actual, self.calibration.factors(now.month),
+        )
+        self._store.async_delay_save(self.calibration.as_dict, SAVE_DELAY)
+        self.async_update_forecast()
@@ -0,0 +1,20 @@
+"""Constants for the PV Forecast Calibration integration."""
+
+DOMAIN = "pv_calibration"
+
+STORAGE_KEY = DOMAIN
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+# Forecast.Solar REST sensors; their "watts" attribute covers today and tomorrow
+PLANE_SENSORS = {
+    "east": "sensor.pv_wschod_prognoza_dzis",
+    "south": "sensor.pv_poludnie_prognoza_dzis",
+    "west": "sensor.pv_zachod_prognoza_dzis",
+}
+# Hourly utility meter of PV production, read just before it resets
+SENSOR_PV_HOURLY = "sensor.produkcja_pv_godzinowa_dc"
+SAMPLE_MINUTE = 59
+SAMPLE_SECOND = 40
+
+SIGNAL_FORECAST_UPDATED = f"{DOMAIN}_forecast_updated"
@@ -0,0 +1,73 @@
+"""Sensor with the calibrated hourly PV forecast."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util import dt as dt_util
+
+from .calibrator import PvForecastCalibrator
+from .const import DOMAIN, SIGNAL_FORECAST_UPDATED
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the calibrated forecast sensor."""
+    if discovery_info is None:
+        return
+    async_add_entities([PvCalibratedForecastSensor(hass.data[DOMAIN])])
+
+
+class PvCalibratedForecastSensor(SensorEntity):
+    """Calibrated PV production today, with hourly arrays for today and tomorrow."""
+
+    _attr_name = "PV Prognoza skorygowana"
+    _attr_unique_id = f"{DOMAIN}_forecast"
+    _attr_icon = "mdi:solar-power-variant"
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"today", "tomorrow", "raw_today", "raw_tomorrow", "factors"})
+
+    def __init__(self, calibrator: PvForecastCalibrator):
+        self._calibrator = calibrator
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_FORECAST_UPDATED, self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        if "today" not in self._calibrator.days:
+            return None
+        return round(sum(self._calibrator.days["today"]["hourly"]), 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        days = self._calibrator.days
+        if not days:
+            return {}
+        month = dt_util.now().month
+        attributes: dict[str, Any] = {
+            "factors": self._calibrator.calibration.factors(month),
+            "samples": self._calibrator.calibration.samples(month),
+        }
+        for key, day in days.items():
+            corrected, raw = sum(day["hourly"]), sum(day["raw"])
+            attributes[f"{key}_date"] = day["date"]
+            attributes[key] = day["hourly"]
+            attributes[f"raw_{key}"] = day["raw"]
+            attributes[f"{key}_kwh"] = round(corrected, 1)
+            attributes[f"raw_{key}_kwh"] = round(raw, 1)
+            attributes[f"correction_{key}"] = round(corrected / raw, 3) if raw > 0 else None
+        return attributes
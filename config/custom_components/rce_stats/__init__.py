@@ -0,0 +1,29 @@
+"""RCE price thresholds and daily statistics, computed in one pass."""
+from __future__ import annotations
+
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.typing import ConfigType
+
+from .const import DOMAIN, LEGACY_TEMPLATE_UNIQUE_IDS
+from .tracker import RcePriceStats
+
+CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Start the statistics and create the sensors."""
+    # The template sensors this replaces still hold their entity ids in the registry
+    registry = er.async_get(hass)
+    for unique_id in LEGACY_TEMPLATE_UNIQUE_IDS:
+        if entity_id := registry.async_get_entity_id(SENSOR_DOMAIN, "template", unique_id):
+            registry.async_remove(entity_id)
+
+    stats = RcePriceStats(hass)
+    hass.data[DOMAIN] = stats
+    stats.async_start()
+    hass.async_create_task(async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config))
+    return True
@@ -0,0 +1,25 @@
+"""Constants for the RCE Price Statistics integration."""
+
+DOMAIN = "rce_stats"
+
+# RCE PSE sensors; "prices" holds 15-minute entries {"dtime", "rce_pln"} in PLN/MWh
+SENSOR_PRICES_TODAY = "sensor.rce_pse_cena"
+SENSOR_PRICES_TOMORROW = "sensor.rce_pse_cena_jutro"
+# Sunset for the evening average
+SENSOR_EPHEMERIS = "sensor.efemeryda_slonca"
+SENSOR_SUN = "sun.sun"
+
+# Today's thresholds come from the 6:00-21:00 prices, tomorrow's from the whole day
+TODAY_HOURS = (6, 21)
+TOMORROW_HOURS = (0, 23)
+EVENING_END_HOUR = 22
+DEFAULT_PRICE_MWH = 650
+
+# unique_id of the template sensors replaced by this integration
+LEGACY_TEMPLATE_UNIQUE_IDS = (
+    "rce_price_thresholds",
+    "rce_price_thresholds_tomorrow",
+    "rce_evening_average",
+)
+
+SIGNAL_STATS_UPDATED = f"{DOMAIN}_stats_updated"
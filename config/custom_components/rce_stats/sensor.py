@@ -0,0 +1,113 @@
+"""RCE threshold and evening average sensors."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from .const import DOMAIN, SIGNAL_STATS_UPDATED
+from .tracker import RcePriceStats
+
+UNIT_PLN_KWH = "PLN/kWh"
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the RCE statistics sensors."""
+    if discovery_info is None:
+        return
+    stats = hass.data[DOMAIN]
+    async_add_entities(
+        [
+            RceThresholdsSensor(stats, "today"),
+            RceThresholdsSensor(stats, "tomorrow"),
+            RceEveningAverageSensor(stats),
+        ]
+    )
+
+
+class RceStatsEntity(SensorEntity):
+    """Sensor updated by RcePriceStats."""
+
+    _attr_should_poll = False
+
+    def __init__(self, stats: RcePriceStats):
+        self._stats = stats
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_STATS_UPDATED, self.async_write_ha_state)
+        )
+
+
+class RceThresholdsSensor(RceStatsEntity):
+    """p33-p66 colour thresholds of a day, with the day's statistics."""
+
+    _attr_icon = "mdi:palette"
+    _unrecorded_attributes = frozenset({"hourly", "legend"})
+
+    def __init__(self, stats: RcePriceStats, day: str):
+        super().__init__(stats)
+        self._day = day
+        if day == "today":
+            self._attr_name = "RCE progi cenowe"
+            self._attr_unique_id = f"{DOMAIN}_thresholds"
+        else:
+            self._attr_name = "RCE progi cenowe jutro"
+            self._attr_unique_id = f"{DOMAIN}_thresholds_tomorrow"
+
+    @property
+    def _summary(self) -> dict | None:
+        return getattr(self._stats, self._day)
+
+    @property
+    def native_value(self) -> str | None:
+        summary = self._summary
+        if summary is None:
+            return None
+        return f"{summary['p33']}-{summary['p66']}"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        summary = self._summary
+        if summary is None:
+            return {}
+        p33, p66 = summary["p33"], summary["p66"]
+        return {
+            "p33": p33,
+            "p66": p66,
+            "min_price": summary["min_price"],
+            "max_price": summary["max_price"],
+            "average": summary["average"],
+            "count": summary["count"],
+            "hourly": summary["hourly"],
+            "legend": f"🟢 < {p33}  🟡 {p33}–{p66}  🔴 > {p66} PLN/kWh",
+        }
+
+
+class RceEveningAverageSensor(RceStatsEntity):
+    """Average RCE price from the hour after sunset until 22:00."""
+
+    _attr_name = "RCE średnia wieczorna"
+    _attr_unique_id = f"{DOMAIN}_evening_average"
+    _attr_icon = "mdi:chart-line"
+    _attr_native_unit_of_measurement = UNIT_PLN_KWH
+
+    @property
+    def native_value(self) -> float | None:
+        return self._stats.evening["value"] if self._stats.evening else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        evening = self._stats.evening
+        if evening is None:
+            return {}
+        return {key: value for key, value in evening.items() if key != "value"}
@@ -0,0 +1,58 @@
+"""Daily RCE price statistics from the 15-minute price entries."""
+from typing import Sequence
+
+HOURS_PER_DAY = 24
+
+# Percentiles of the sorted prices, indexed like the old templates: sorted[int(n * q)]
+PERCENTILES = {"p33": 0.33, "p66": 0.66}
+
+# Values reported when there are no prices for the day
+DEFAULT_THRESHOLDS = {"p33": 0.40, "p66": 0.60, "min_price": 0.30, "max_price": 0.80}
+
+
+def summarize_day(prices: Sequence[dict] | None, day: str, hours: tuple[int, int] = (0, 23)) -> dict:
+    """Statistics of one day in a single pass over the ``prices`` attribute.
+
+    ``day`` is "YYYY-MM-DD"; entries of other days are skipped. The hour of an
+    entry is the hour of its ``dtime`` (end of the 15-minute period). Thresholds,
+    minimum, maximum and average use only hours ``hours[0]..hours[1]``
+    (inclusive); ``hourly`` has the PLN/kWh average of every hour, None where
+    there is no price.
+    """
+    sums = [0.0] * HOURS_PER_DAY
+    counts = [0] * HOURS_PER_DAY
+    window = []
+    for entry in prices or ():
+        try:
+            date_part, time_part = str(entry["dtime"]).replace("T", " ").split(" ", 1)
+            hour = int(time_part[:2])
+            price = float(entry["rce_pln"]) / 1000
+        except (KeyError, TypeError, ValueError):
+            continue
+        if date_part != day or not 0 <= hour < HOURS_PER_DAY:
+            continue
+        sums[hour] += price
+        counts[hour] += 1
+        if hours[0] <= hour <= hours[1]:
+            window.append(price)
+
+    hourly = [round(sums[hour] / counts[hour], 4) if counts[hour] else None for hour in range(HOURS_PER_DAY)]
+    if not window:
+        return {**DEFAULT_THRESHOLDS, "average": None, "count": 0, "hourly": hourly}
+
+    window.sort()
+    result = {name: round(window[int(len(window) * q)], 2) for name, q in PERCENTILES.items()}
+    result.update(
+        min_price=round(window[0], 2),
+        max_price=round(window[-1], 2),
+        average=round(sum(window) / len(window), 4),
+        count=len(window),
+        hourly=hourly,
+    )
+    return result
+
+
+def average_between(hourly: Sequence[float | None], start: int, end: int) -> float | None:
+    """Average of the hourly prices from ``start`` to ``end`` (exclusive), None without prices."""
+    values = [price for price in hourly[max(start, 0):end] if price is not None]
+    return sum(values) / len(values) if values else None
@@ -0,0 +1,109 @@
+"""Recomputes the RCE statistics when the prices change."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_state_change_event, async_track_time_change
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DEFAULT_PRICE_MWH,
+    EVENING_END_HOUR,
+    SENSOR_EPHEMERIS,
+    SENSOR_PRICES_TODAY,
+    SENSOR_PRICES_TOMORROW,
+    SENSOR_SUN,
+    SIGNAL_STATS_UPDATED,
+    TODAY_HOURS,
+    TOMORROW_HOURS,
+)
+from .stats import average_between, summarize_day
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RcePriceStats:
+    """Thresholds and statistics of today's and tomorrow's RCE prices.
+
+    Everything is computed together whenever a price sensor or the sunset
+    changes, and at midnight when tomorrow's prices become today's.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self.today: dict | None = None
+        self.tomorrow: dict | None = None
+        self.evening: dict | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start listening."""
+        async_track_state_change_event(
+            self.hass, [SENSOR_PRICES_TODAY, SENSOR_PRICES_TOMORROW, SENSOR_EPHEMERIS], self._async_changed
+        )
+        async_track_time_change(self.hass, self._async_new_day, hour=0, minute=0, second=10)
+        if self.hass.state is CoreState.running:
+            self.async_update()
+        else:
+            self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, self._async_changed)
+
+    def _prices(self, entity_id: str) -> list | None:
+        state = self.hass.states.get(entity_id)
+        return state.attributes.get("prices") if state is not None else None
+
+    def _sunset(self) -> datetime | None:
+        """Today's local sunset, from the ephemeris or else sun.sun."""
+        now = dt_util.now()
+        state = self.hass.states.get(SENSOR_EPHEMERIS)
+        sunset = state.attributes.get("today_sunset") if state is not None else None
+        if sunset:
+            hour, minute = sunset.split(":")
+            return now.replace(hour=int(hour), minute=int(minute), second=0, microsecond=0)
+        state = self.hass.states.get(SENSOR_SUN)
+        setting = dt_util.parse_datetime(state.attributes.get("next_setting") or "") if state is not None else None
+        return dt_util.as_local(setting) if setting else None
+
+    def _current_price(self) -> float:
+        state = self.hass.states.get(SENSOR_PRICES_TODAY)
+        try:
+            return float(state.state) / 1000
+        except (AttributeError, ValueError):
+            return DEFAULT_PRICE_MWH / 1000
+
+    @callback
+    def async_update(self) -> None:
+        """Recompute all statistics."""
+        today = dt_util.now().date()
+        self.today = summarize_day(self._prices(SENSOR_PRICES_TODAY), today.isoformat(), TODAY_HOURS)
+        self.tomorrow = summarize_day(
+            self._prices(SENSOR_PRICES_TOMORROW), (today + timedelta(days=1)).isoformat(), TOMORROW_HOURS
+        )
+
+        sunset = self._sunset()
+        start_hour = sunset.hour + 1 if sunset else EVENING_END_HOUR
+        average = average_between(self.today["hourly"], start_hour, EVENING_END_HOUR)
+        self.evening = {
+            "value": round(average if average is not None else self._current_price(), 2),
+            "sunset_hour": sunset.strftime("%H:%M") if sunset else None,
+            "start_hour": f"{start_hour}:00",
+            "end_hour": f"{EVENING_END_HOUR}:00",
+        }
+        _LOGGER.debug("RCE today %s-%s, tomorrow %s-%s, evening %s",
+                      self.today["p33"], self.today["p66"], self.tomorrow["p33"], self.tomorrow["p66"],
+                      self.evening["value"])
+        async_dispatcher_send(self.hass, SIGNAL_STATS_UPDATED)
+
+    @callback
+    def _async_changed(self, event: Event) -> None:
+        new_state = event.data.get("new_state")
+        if new_state is not None and new_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            return
+        self.async_update()
+
+    @callback
+    def _async_new_day(self, _now: datetime) -> None:
+        self.async_update()
@@ -0,0 +1,35 @@
+"""Sunrise, sunset and clear-sky baseline for the configured location."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SIGNAL_DAY_CHANGED, TABLE_DAYS
+from .ephemeris import SolarEphemeris
+
+CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Precompute a year of days and publish today and tomorrow."""
+    ephemeris = SolarEphemeris(hass.config.latitude, hass.config.longitude, hass.config.time_zone)
+    await hass.async_add_executor_job(ephemeris.build, dt_util.now().date(), TABLE_DAYS)
+    hass.data[DOMAIN] = ephemeris
+
+    async def _async_new_day(now: datetime) -> None:
+        today = dt_util.as_local(now).date()
+        if today + timedelta(days=1) not in ephemeris:
+            await hass.async_add_executor_job(ephemeris.build, today, TABLE_DAYS)
+        async_dispatcher_send(hass, SIGNAL_DAY_CHANGED)
+
+    async_track_time_change(hass, _async_new_day, hour=0, minute=0, second=1)
+    hass.async_create_task(async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config))
+    return True
@@ -0,0 +1,8 @@
+"""Constants for the Solar Ephemeris integration."""
+
+DOMAIN = "solar_ephemeris"
+
+# Days precomputed at startup, from today
+TABLE_DAYS = 366
+
+SIGNAL_DAY_CHANGED = f"{DOMAIN}_day_changed"
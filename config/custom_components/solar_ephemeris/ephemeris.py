@@ -0,0 +1,119 @@
+"""Sunrise, sunset and clear-sky irradiance per day, precomputed for a location."""
+from datetime import date, datetime, timedelta, timezone
+import math
+from zoneinfo import ZoneInfo
+
+HOURS_PER_DAY = 24
+
+# Sun centre 0.833 deg below the horizon at sunrise/sunset (refraction + solar radius)
+SUNRISE_ZENITH = 90.833
+SOLAR_CONSTANT_GHI = 1098.0  # W/m2, Haurwitz clear-sky model
+INTEGRATION_STEPS = 12  # per hour, 5 minutes
+
+# Hours with less clear-sky energy than this (sun just above the horizon) are not sun hours for PV
+SUN_HOUR_MIN_KWH_M2 = 0.05
+
+
+def _sun(moment: datetime) -> tuple[float, float]:
+    """Equation of time (minutes) and declination (rad) at a UTC moment (NOAA)."""
+    day_of_year = moment.timetuple().tm_yday
+    days_in_year = 366 if moment.year % 4 == 0 and (moment.year % 100 != 0 or moment.year % 400 == 0) else 365
+    gamma = 2 * math.pi / days_in_year * (day_of_year - 1 + (moment.hour + moment.minute / 60 - 12) / 24)
+    eqtime = 229.18 * (
+        0.000075 + 0.001868 * math.cos(gamma) - 0.032077 * math.sin(gamma)
+        - 0.014615 * math.cos(2 * gamma) - 0.040849 * math.sin(2 * gamma)
+    )
+    declination = (
+        0.006918 - 0.399912 * math.cos(gamma) + 0.070257 * math.sin(gamma)
+        - 0.006758 * math.cos(2 * gamma) + 0.000907 * math.sin(2 * gamma)
+        - 0.002697 * math.cos(3 * gamma) + 0.00148 * math.sin(3 * gamma)
+    )
+    return eqtime, declination
+
+
+def clear_sky_irradiance(moment: datetime, latitude: float, longitude: float) -> float:
+    """Clear-sky global horizontal irradiance (W/m2) at a UTC moment."""
+    eqtime, declination = _sun(moment)
+    true_solar_minutes = moment.hour * 60 + moment.minute + moment.second / 60 + eqtime + 4 * longitude
+    hour_angle = math.radians(true_solar_minutes / 4 - 180)
+    lat = math.radians(latitude)
+    cos_zenith = math.sin(lat) * math.sin(declination) + math.cos(lat) * math.cos(declination) * math.cos(hour_angle)
+    if cos_zenith <= 0:
+        return 0.0
+    return SOLAR_CONSTANT_GHI * cos_zenith * math.exp(-0.057 / cos_zenith)
+
+
+class SolarEphemeris:
+    """Year-long lookup of sunrise, sunset and clear-sky energy per local day.
+
+    Built once with build(); day() indexes the table and only computes days
+    outside of it. Times are local to ``time_zone``, clear-sky energy is
+    kWh/m2 per local hour on a horizontal surface.
+    """
+
+    def __init__(self, latitude: float, longitude: float, time_zone: str):
+        self.latitude = latitude
+        self.longitude = longitude
+        self._tz = ZoneInfo(time_zone)
+        self._days: dict[date, dict] = {}
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def __contains__(self, day: date) -> bool:
+        return day in self._days
+
+    def build(self, start: date, days: int) -> None:
+        """Precompute ``days`` days from ``start``, replacing the table."""
+        self._days = {start + timedelta(days=offset): self._compute(start + timedelta(days=offset)) for offset in range(days)}
+
+    def day(self, day: date) -> dict:
+        """Sunrise, sunset, sun-hour window and clear-sky energy of a local day."""
+        entry = self._days.get(day)
+        if entry is None:
+            entry = self._compute(day)
+        return entry
+
+    def _event(self, day: date, rising: bool) -> datetime | None:
+        """Local sunrise or sunset, None when the sun does not cross the horizon."""
+        noon = datetime(day.year, day.month, day.day, 12, tzinfo=timezone.utc)
+        eqtime, declination = _sun(noon)
+        lat = math.radians(self.latitude)
+        cos_hour_angle = (
+            math.cos(math.radians(SUNRISE_ZENITH)) / (math.cos(lat) * math.cos(declination))
+            - math.tan(lat) * math.tan(declination)
+        )
+        if not -1 <= cos_hour_angle <= 1:
+            return None
+        hour_angle = math.degrees(math.acos(cos_hour_angle))
+        minutes = 720 - 4 * (self.longitude + (hour_angle if rising else -hour_angle)) - eqtime
+        midnight = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+        return (midnight + timedelta(minutes=minutes)).astimezone(self._tz)
+
+    def _compute(self, day: date) -> dict:
+        sunrise = self._event(day, True)
+        sunset = self._event(day, False)
+        clear_sky = []
+        for hour in range(HOURS_PER_DAY):
+            start = datetime(day.year, day.month, day.day, hour, tzinfo=self._tz).astimezone(timezone.utc)
+            energy = sum(
+                clear_sky_irradiance(start + timedelta(hours=(step + 0.5) / INTEGRATION_STEPS), self.latitude, self.longitude)
+                for step in range(INTEGRATION_STEPS)
+            ) / INTEGRATION_STEPS / 1000
+            clear_sky.append(round(energy, 4))
+
+        sunny = [hour for hour in range(HOURS_PER_DAY) if clear_sky[hour] >= SUN_HOUR_MIN_KWH_M2]
+        if sunrise is not None and sunset is not None:
+            daylight = round((sunset - sunrise).total_seconds() / 3600, 2)
+        else:
+            daylight = float(len([hour for hour in range(HOURS_PER_DAY) if clear_sky[hour] > 0]))
+        return {
+            "date": day.isoformat(),
+            "sunrise": sunrise.strftime("%H:%M") if sunrise else None,
+            "sunset": sunset.strftime("%H:%M") if sunset else None,
+            # Sun hours for PV planning, [first, last + 1) local hours
+            "window": [sunny[0], sunny[-1] + 1] if sunny else None,
+            "daylight": daylight,
+            "clear_sky": clear_sky,
+            "clear_sky_kwh_m2": round(sum(clear_sky), 2),
+        }
@@ -0,0 +1,61 @@
+"""Sensor with today's and tomorrow's sun times and clear-sky baseline."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SIGNAL_DAY_CHANGED
+from .ephemeris import SolarEphemeris
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the ephemeris sensor."""
+    if discovery_info is None:
+        return
+    async_add_entities([SolarEphemerisSensor(hass.data[DOMAIN])])
+
+
+class SolarEphemerisSensor(SensorEntity):
+    """Daylight hours today, with sun times and clear-sky energy of today and tomorrow."""
+
+    _attr_name = "Efemeryda słońca"
+    _attr_unique_id = f"{DOMAIN}_sun"
+    _attr_icon = "mdi:weather-sunset"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"today_clear_sky", "tomorrow_clear_sky"})
+
+    def __init__(self, ephemeris: SolarEphemeris):
+        self._ephemeris = ephemeris
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_DAY_CHANGED, self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> float:
+        return self._ephemeris.day(dt_util.now().date())["daylight"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        today = dt_util.now().date()
+        attributes: dict[str, Any] = {}
+        for key, day in (("today", today), ("tomorrow", today + timedelta(days=1))):
+            for name, value in self._ephemeris.day(day).items():
+                attributes[f"{key}_{name}"] = value
+        return attributes
@@ -0,0 +1,47 @@
+"""Startup profiling of the custom integrations."""
+from __future__ import annotations
+
+import os
+
+import voluptuous as vol
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.typing import ConfigType
+
+from .const import CONF_INTEGRATIONS, DOMAIN, REPORT_FILE
+from .profiler import StartupProfiler
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Maybe(
+            vol.Schema({vol.Optional(CONF_INTEGRATIONS): vol.All(cv.ensure_list, [cv.string])})
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+def _custom_integrations(path: str) -> list[str]:
+    """Domains of the integrations in custom_components, except this one."""
+    return sorted(
+        name for name in os.listdir(path)
+        if name != DOMAIN and os.path.isfile(os.path.join(path, name, "manifest.json"))
+    )
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Start profiling and set up the report sensor."""
+    conf = config.get(DOMAIN) or {}
+    domains = conf.get(CONF_INTEGRATIONS) or await hass.async_add_executor_job(
+        _custom_integrations, hass.config.path("custom_components")
+    )
+
+    profiler = StartupProfiler(hass, domains, hass.config.path(REPORT_FILE))
+    hass.data[DOMAIN] = profiler
+    await profiler.async_start()
+
+    hass.async_create_task(async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config))
+    return True
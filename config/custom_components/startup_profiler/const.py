@@ -0,0 +1,11 @@
+"""Constants for the Startup Profiler integration."""
+
+DOMAIN = "startup_profiler"
+
+CONF_INTEGRATIONS = "integrations"
+
+REPORT_FILE = "startup_profile.json"
+# Entities of slow cloud integrations get their first state after HA reports started
+PROFILE_SETTLE_SECONDS = 120
+
+SIGNAL_PROFILE_UPDATED = f"{DOMAIN}_updated"
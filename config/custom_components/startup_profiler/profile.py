@@ -0,0 +1,118 @@
+"""Startup timings of custom integrations, collected into one report."""
+from typing import Any
+
+
+def _empty_integration() -> dict[str, Any]:
+    return {
+        "import_seconds": None,
+        "entries": [],
+        "homeassistant_setup_seconds": None,
+        "coordinators": {},
+        "first_state_seconds": None,
+        "first_state_entity": None,
+        "entities": 0,
+    }
+
+
+def _round(seconds: float | None) -> float | None:
+    return round(seconds, 3) if seconds is not None else None
+
+
+class StartupProfile:
+    """Timings per integration domain.
+
+    Durations are in seconds. Points in time (first refresh is a duration,
+    first entity state is a point) are seconds since the profile clock origin,
+    which the caller picks (process start when it is known).
+
+    Only the first occurrence of each event is kept, so a coordinator refreshing
+    or an entity changing state later on does not overwrite the startup value.
+    """
+
+    def __init__(self, domains: list[str]):
+        self._integrations: dict[str, dict[str, Any]] = {domain: _empty_integration() for domain in domains}
+        self._started: float | None = None
+
+    def _integration(self, domain: str) -> dict[str, Any]:
+        return self._integrations.setdefault(domain, _empty_integration())
+
+    def record_import(self, domain: str, seconds: float):
+        """Time taken to import the integration package."""
+        self._integration(domain)["import_seconds"] = _round(seconds)
+
+    def record_setup(self, domain: str, entry_id: str, title: str, seconds: float, success: bool):
+        """Time taken by async_setup_entry for one config entry."""
+        entries = self._integration(domain)["entries"]
+        if any(entry["entry_id"] == entry_id for entry in entries):
+            return
+        entries.append({"entry_id": entry_id, "title": title, "seconds": _round(seconds), "success": success})
+
+    def record_homeassistant_setup(self, domain: str, seconds: float):
+        """Setup time as measured by Home Assistant itself (whole component)."""
+        self._integration(domain)["homeassistant_setup_seconds"] = _round(seconds)
+
+    def record_first_refresh(self, domain: str, name: str, seconds: float, success: bool):
+        """Latency of the first refresh of a coordinator."""
+        coordinators = self._integration(domain)["coordinators"]
+        if name in coordinators:
+            # Several coordinators may share a name (one per device), keep them apart
+            index = 2
+            while f"{name} #{index}" in coordinators:
+                index += 1
+            name = f"{name} #{index}"
+        coordinators[name] = {"seconds": _round(seconds), "success": success}
+
+    def record_first_state(self, domain: str, entity_id: str, at: float):
+        """An entity of the integration got its first state."""
+        integration = self._integration(domain)
+        integration["entities"] += 1
+        if integration["first_state_seconds"] is None:
+            integration["first_state_seconds"] = _round(at)
+            integration["first_state_entity"] = entity_id
+
+    def record_started(self, at: float):
+        """Home Assistant fired its started event."""
+        self._started = _round(at)
+
+    @property
+    def started_seconds(self) -> float | None:
+        """Seconds from the clock origin to Home Assistant started."""
+        return self._started
+
+    def as_dict(self) -> dict[str, Any]:
+        """The full report."""
+        integrations = {}
+        for domain, data in self._integrations.items():
+            setup = [entry["seconds"] for entry in data["entries"]]
+            integrations[domain] = {
+                **data,
+                "setup_seconds": _round(sum(setup)) if setup else None,
+                "slowest_first_refresh_seconds": max(
+                    (coordinator["seconds"] for coordinator in data["coordinators"].values()), default=None
+                ),
+            }
+        return {
+            "started_seconds": self._started,
+            "slowest_setup": self._slowest(integrations),
+            "integrations": integrations,
+        }
+
+    def summary(self) -> dict[str, dict[str, float | None]]:
+        """Short per-integration timings, for a sensor attribute."""
+        return {
+            domain: {
+                key: data[key]
+                for key in ("import_seconds", "setup_seconds", "slowest_first_refresh_seconds", "first_state_seconds")
+            }
+            for domain, data in self.as_dict()["integrations"].items()
+        }
+
+    @staticmethod
+    def _slowest(integrations: dict[str, dict[str, Any]]) -> str | None:
+        def setup_time(domain: str) -> float:
+            data = integrations[domain]
+            value = data["setup_seconds"]
+            return value if value is not None else data["homeassistant_setup_seconds"] or 0.0
+
+        timed = [domain for domain in integrations if setup_time(domain) > 0]
+        return max(timed, key=setup_time) if timed else None
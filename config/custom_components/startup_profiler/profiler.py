@@ -0,0 +1,203 @@
+"""Hooks that time the setup of custom integrations."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+import functools
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_STATE_CHANGED
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.util import dt as dt_util
+
+from .const import PROFILE_SETTLE_SECONDS, SIGNAL_PROFILE_UPDATED
+from .profile import StartupProfile
+
+try:
+    from homeassistant.setup import async_get_setup_timings
+except ImportError:  # Home Assistant before 2024.4
+    async_get_setup_timings = None
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _process_uptime() -> float | None:
+    """Seconds since this process started, None where /proc is not available."""
+    try:
+        with open("/proc/uptime", encoding="utf-8") as file:
+            system_uptime = float(file.read().split()[0])
+        with open("/proc/self/stat", encoding="utf-8") as file:
+            # Field 22 (starttime), counted after the parenthesised command name
+            start_ticks = int(file.read().rsplit(")", 1)[1].split()[19])
+        return system_uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _write_report(path: str, report: dict[str, Any]):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+
+class StartupProfiler:
+    """Times the startup of a set of integrations.
+
+    On setup the integrations are imported (timing the import) and their
+    async_setup_entry is wrapped. DataUpdateCoordinator is patched to time the
+    first refresh of each coordinator, and first states of their entities are
+    taken from the event bus. Some time after Home Assistant has started, the
+    hooks are removed and the report is written.
+
+    The profiler only sees config entries set up after it, entries that were
+    already loaded still get Home Assistant's own setup timing.
+    """
+
+    def __init__(self, hass: HomeAssistant, domains: list[str], report_path: str):
+        self.hass = hass
+        self.domains = domains
+        self.report_path = report_path
+        self.profile = StartupProfile(domains)
+        self.report: dict[str, Any] | None = None
+        self._origin = time.monotonic()
+        self._clock = "profiler"
+        self._restore: list[Callable[[], None]] = []
+        self._refreshed: set[int] = set()
+        self._unsub_state: Callable[[], None] | None = None
+        self._registry = er.async_get(hass)
+
+    def _elapsed(self) -> float:
+        return time.monotonic() - self._origin
+
+    async def async_start(self):
+        """Install the hooks."""
+        if (uptime := await self.hass.async_add_executor_job(_process_uptime)) is not None:
+            self._origin -= uptime
+            self._clock = "process"
+
+        self._patch_coordinators()
+        for domain in self.domains:
+            await self._async_wrap_integration(domain)
+
+        self._unsub_state = self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+        if self.hass.state is CoreState.running:
+            self._async_started()
+        else:
+            self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, self._async_started)
+
+    async def _async_wrap_integration(self, domain: str):
+        try:
+            integration = await async_get_integration(self.hass, domain)
+        except IntegrationNotFound:
+            _LOGGER.warning("Integration %s not found, it is not profiled", domain)
+            return
+
+        imported = integration.pkg_path in sys.modules
+        start = time.monotonic()
+        component = await integration.async_get_component()
+        if not imported:
+            self.profile.record_import(domain, time.monotonic() - start)
+
+        setup_entry = getattr(component, "async_setup_entry", None)
+        if setup_entry is None:
+            return
+        profile = self.profile
+
+        @functools.wraps(setup_entry)
+        async def _async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+            start = time.monotonic()
+            success = False
+            try:
+                success = await setup_entry(hass, entry)
+                return success
+            finally:
+                profile.record_setup(domain, entry.entry_id, entry.title, time.monotonic() - start, bool(success))
+
+        component.async_setup_entry = _async_setup_entry
+        self._restore.append(functools.partial(setattr, component, "async_setup_entry", setup_entry))
+
+    def _patch_coordinators(self):
+        original = DataUpdateCoordinator._async_refresh
+        profiler = self
+
+        @functools.wraps(original)
+        async def _async_refresh(coordinator: DataUpdateCoordinator, *args, **kwargs):
+            if id(coordinator) in profiler._refreshed:
+                return await original(coordinator, *args, **kwargs)
+            profiler._refreshed.add(id(coordinator))
+            start = time.monotonic()
+            try:
+                return await original(coordinator, *args, **kwargs)
+            finally:
+                profiler._record_refresh(coordinator, time.monotonic() - start)
+
+        DataUpdateCoordinator._async_refresh = _async_refresh
+        self._restore.append(functools.partial(setattr, DataUpdateCoordinator, "_async_refresh", original))
+
+    def _record_refresh(self, coordinator: DataUpdateCoordinator, seconds: float):
+        module = type(coordinator).__module__.split(".")
+        if len(module) > 1 and module[0] == "custom_components":
+            domain = module[1]
+        elif (entry := getattr(coordinator, "config_entry", None)) is not None:
+            domain = entry.domain
+        else:
+            return
+        if domain in self.domains:
+            self.profile.record_first_refresh(domain, coordinator.name, seconds, coordinator.last_update_success)
+
+    @callback
+    def _async_state_changed(self, event: Event):
+        if event.data.get("old_state") is not None:
+            return
+        entity_id = event.data["entity_id"]
+        if (entry := self._registry.async_get(entity_id)) is None or entry.platform not in self.domains:
+            return
+        self.profile.record_first_state(entry.platform, entity_id, self._elapsed())
+
+    @callback
+    def _async_started(self, _event: Event | None = None):
+        self.profile.record_started(self._elapsed())
+        async_call_later(self.hass, PROFILE_SETTLE_SECONDS, self._async_finish)
+
+    @callback
+    def _async_remove_hooks(self):
+        while self._restore:
+            self._restore.pop()()
+        if self._unsub_state is not None:
+            self._unsub_state()
+            self._unsub_state = None
+
+    async def _async_finish(self, _now: datetime):
+        self._async_remove_hooks()
+        if async_get_setup_timings is not None:
+            timings = async_get_setup_timings(self.hass)
+            for domain in self.domains:
+                if (seconds := timings.get(domain)) is not None:
+                    self.profile.record_homeassistant_setup(domain, seconds)
+
+        self.report = {
+            "generated": dt_util.now().isoformat(),
+            "clock": self._clock,
+            **self.profile.as_dict(),
+        }
+        try:
+            await self.hass.async_add_executor_job(_write_report, self.report_path, self.report)
+        except OSError as err:
+            _LOGGER.error("Could not write startup profile to %s: %s", self.report_path, err)
+        else:
+            _LOGGER.info(
+                "Startup profile written to %s (started after %ss, slowest setup: %s)",
+                self.report_path, self.report["started_seconds"], self.report["slowest_setup"],
+            )
+        async_dispatcher_send(self.hass, SIGNAL_PROFILE_UPDATED)
@@ -0,0 +1,66 @@
+"""Sensor with the startup profile."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from .const import DOMAIN, SIGNAL_PROFILE_UPDATED
+from .profiler import StartupProfiler
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the startup profile sensor."""
+    if discovery_info is None:
+        return
+    async_add_entities([StartupProfileSensor(hass.data[DOMAIN])])
+
+
+class StartupProfileSensor(SensorEntity):
+    """Seconds until Home Assistant started, with timings per integration."""
+
+    _attr_name = "Startup profile"
+    _attr_unique_id = f"{DOMAIN}_startup"
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"integrations"})
+
+    def __init__(self, profiler: StartupProfiler):
+        self._profiler = profiler
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_PROFILE_UPDATED, self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        if self._profiler.report is None:
+            return None
+        return self._profiler.report["started_seconds"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        report = self._profiler.report
+        if report is None:
+            return {"report_path": self._profiler.report_path}
+        return {
+            "clock": report["clock"],
+            "slowest_setup": report["slowest_setup"],
+            "report_path": self._profiler.report_path,
+            "integrations": self._profiler.profile.summary(),
+        }
@@ -0,0 +1,121 @@
+"""Cost of the recorded hourly energy under several import tariffs."""
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
+
+from .comparator import TariffComparator
+from .const import (
+    ATTR_END,
+    ATTR_PER_DAY,
+    ATTR_START,
+    CONF_CURRENT,
+    CONF_MARGIN,
+    CONF_OFFPEAK,
+    CONF_PEAK,
+    CONF_RATE,
+    CONF_TARIFFS,
+    CONF_TYPE,
+    CONF_VAT,
+    CONF_WEEKEND_OFFPEAK,
+    DEFAULT_CURRENT,
+    DOMAIN,
+    SERVICE_COMPARE,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from .costs import TARIFFS
+
+_LOGGER = logging.getLogger(__name__)
+
+ENERGY_RECORDER_DOMAIN = "energy_recorder"
+
+PRICE = vol.All(vol.Coerce(float), vol.Range(min=0))
+
+TARIFF_SCHEMA = cv.key_value_schemas(
+    CONF_TYPE,
+    {
+        "flat": vol.Schema({vol.Required(CONF_TYPE): "flat", vol.Required(CONF_RATE): PRICE}),
+        "zones": vol.Schema(
+            {
+                vol.Required(CONF_TYPE): "zones",
+                vol.Required(CONF_PEAK): PRICE,
+                vol.Required(CONF_OFFPEAK): PRICE,
+                vol.Optional(CONF_WEEKEND_OFFPEAK, default=False): cv.boolean,
+            }
+        ),
+        "dynamic": vol.Schema(
+            {
+                vol.Required(CONF_TYPE): "dynamic",
+                vol.Required(CONF_MARGIN): vol.Coerce(float),
+                vol.Optional(CONF_VAT, default=1.23): PRICE,
+            }
+        ),
+    },
+)
+
+TARIFFS_SCHEMA = vol.Schema({cv.slug: TARIFF_SCHEMA})
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Maybe(
+            vol.Schema(
+                {
+                    vol.Optional(CONF_CURRENT, default=DEFAULT_CURRENT): cv.slug,
+                    vol.Optional(CONF_TARIFFS, default={}): TARIFFS_SCHEMA,
+                }
+            )
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+COMPARE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_START): cv.date,
+        vol.Optional(ATTR_END): cv.date,
+        vol.Optional(CONF_TARIFFS): vol.All(TARIFFS_SCHEMA, vol.Length(min=1)),
+        vol.Optional(ATTR_PER_DAY, default=False): cv.boolean,
+    }
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Start the comparison, its sensors and the compare service."""
+    conf = config.get(DOMAIN) or {}
+    tariffs = {**TARIFFS, **conf.get(CONF_TARIFFS, {})}
+    current = conf.get(CONF_CURRENT, DEFAULT_CURRENT)
+    if current not in tariffs:
+        _LOGGER.error("Current tariff %s is not one of %s", current, ", ".join(tariffs))
+        return False
+    if (energy_store := hass.data.get(ENERGY_RECORDER_DOMAIN)) is None:
+        _LOGGER.error("The hourly history of %s is not available", ENERGY_RECORDER_DOMAIN)
+        return False
+
+    comparator = TariffComparator(hass, energy_store, tariffs, current, Store(hass, STORAGE_VERSION, STORAGE_KEY))
+    await comparator.async_load()
+    hass.data[DOMAIN] = comparator
+    comparator.async_start()
+
+    async def _async_compare(call: ServiceCall) -> ServiceResponse:
+        start = call.data[ATTR_START]
+        end = call.data.get(ATTR_END) or dt_util.now().date()
+        if end < start:
+            raise ServiceValidationError(f"{ATTR_END} {end} is before {ATTR_START} {start}")
+        return await comparator.async_compare(start, end, call.data.get(CONF_TARIFFS), call.data[ATTR_PER_DAY])
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_COMPARE, _async_compare, schema=COMPARE_SCHEMA, supports_response=SupportsResponse.ONLY
+    )
+    hass.async_create_task(async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config))
+    return True
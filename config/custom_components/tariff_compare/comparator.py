@@ -0,0 +1,106 @@
+"""Keeps the per-day tariff costs of the recorded history up to date."""
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import REFRESH_MINUTE, REFRESH_SECOND, SAVE_DELAY, SIGNAL_COMPARISON_UPDATED
+from .costs import COLUMNS, COSTS_VERSION, daily_costs, summarize
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TariffComparator:
+    """Per-day costs under every tariff, from energy_recorder's hourly store.
+
+    Complete days are computed once and kept in a Store. Every hour only
+    the days since the last complete one are recomputed, so a missed hour
+    or a restart loses nothing: the history is the source, not a counter.
+    """
+
+    def __init__(self, hass: HomeAssistant, energy_store, tariffs: dict[str, dict], current: str, store: Store):
+        self.hass = hass
+        self.tariffs = tariffs
+        self.current = current
+        self.days: dict[str, dict[str, Any]] = {}
+        self.today: dict[str, Any] | None = None
+        self.month: dict[str, Any] | None = None
+        self._energy_store = energy_store
+        self._store = store
+
+    async def async_load(self) -> None:
+        """Load the cached days; they are dropped if the tariffs or the cost method have changed since."""
+        cached = await self._store.async_load() or {}
+        if cached.get("tariffs") == self.tariffs and cached.get("costs_version") == COSTS_VERSION:
+            self.days = cached.get("days") or {}
+        elif cached:
+            _LOGGER.info("Tariffs or cost method changed, recomputing the whole history")
+
+    @callback
+    def async_start(self) -> None:
+        async_track_time_change(self.hass, self._async_tick, minute=REFRESH_MINUTE, second=REFRESH_SECOND)
+        self.hass.async_create_task(self.async_refresh())
+
+    def _local(self, day: date) -> datetime:
+        return datetime.combine(day, time(), dt_util.get_default_time_zone())
+
+    def compute(self, start: date | None, end: date | None, tariffs: dict[str, dict]) -> dict[str, dict]:
+        """Per-day costs of [start, end) (executor thread)."""
+        data = self._energy_store.read(
+            self._local(start) if start else None,
+            self._local(end) if end else None,
+            list(COLUMNS),
+            self.hass.config.time_zone,
+        )
+        return daily_costs(data, tariffs, self.hass.config.time_zone)
+
+    async def async_refresh(self) -> None:
+        """Recompute the days after the last cached one, cache the complete ones."""
+        today = dt_util.now().date()
+        start = date.fromisoformat(max(self.days)) + timedelta(days=1) if self.days else None
+        days = await self.hass.async_add_executor_job(
+            self.compute, min(start, today) if start else None, None, self.tariffs
+        )
+        complete = {day: entry for day, entry in days.items() if day < today.isoformat()}
+        if complete:
+            self.days.update(complete)
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        today_entry = days.get(today.isoformat())
+        self.today = summarize({today.isoformat(): today_entry} if today_entry else {}, self.current)
+        month_start = today.replace(day=1).isoformat()
+        month_days = {day: entry for day, entry in self.days.items() if day >= month_start}
+        if today_entry:
+            month_days[today.isoformat()] = today_entry
+        self.month = summarize(month_days, self.current)
+        _LOGGER.debug("Tariffs today %s, month %s", self.today["costs"], self.month["costs"])
+        async_dispatcher_send(self.hass, SIGNAL_COMPARISON_UPDATED)
+
+    async def async_compare(self, start: date, end: date, tariffs: dict[str, dict] | None, per_day: bool) -> dict:
+        """What-if over [start, end]: cached days for the configured tariffs, else one pass over the store."""
+        first, last = start.isoformat(), end.isoformat()
+        if tariffs is None:
+            tariffs = self.tariffs
+            days = {day: entry for day, entry in self.days.items() if first <= day <= last}
+            today = dt_util.now().date()
+            if start <= today <= end:
+                days.update(await self.hass.async_add_executor_job(self.compute, today, None, tariffs))
+        else:
+            days = await self.hass.async_add_executor_job(self.compute, start, end + timedelta(days=1), tariffs)
+        days = {day: days[day] for day in sorted(days) if first <= day <= last}
+        result = {"start": first, "end": last, "tariffs": tariffs, **summarize(days, self.current)}
+        if per_day:
+            result["per_day"] = days
+        return result
+
+    def _data_to_save(self) -> dict:
+        return {"tariffs": self.tariffs, "costs_version": COSTS_VERSION, "days": self.days}
+
+    async def _async_tick(self, _now: datetime) -> None:
+        await self.async_refresh()
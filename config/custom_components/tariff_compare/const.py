@@ -0,0 +1,33 @@
+"""Constants for the Tariff Comparison integration."""
+
+DOMAIN = "tariff_compare"
+
+CONF_CURRENT = "current"
+CONF_TARIFFS = "tariffs"
+CONF_TYPE = "type"
+CONF_RATE = "rate"
+CONF_PEAK = "peak"
+CONF_OFFPEAK = "offpeak"
+CONF_WEEKEND_OFFPEAK = "weekend_offpeak"
+CONF_MARGIN = "margin"
+CONF_VAT = "vat"
+
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_PER_DAY = "per_day"
+
+SERVICE_COMPARE = "compare"
+
+# Tariff the bills are paid in, the savings of the others are relative to it
+DEFAULT_CURRENT = "g12w"
+
+# The recorder appends the last hour at :59:30, refresh once it is in
+REFRESH_MINUTE = 0
+REFRESH_SECOND = 15
+
+# Per-day results of complete days
+STORAGE_KEY = f"{DOMAIN}_days"
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+SIGNAL_COMPARISON_UPDATED = f"{DOMAIN}_updated"
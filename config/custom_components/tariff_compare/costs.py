@@ -0,0 +1,153 @@
+"""Import cost of the hourly energy history under several tariffs.
+
+The history comes as columns (energy_recorder's HourlyEnergyStore.read()).
+Each column is derived once, every tariff's prices are computed for all
+hours at once and the costs are summed per day in the same pass.
+
+No Home Assistant imports, so the tests and ML scripts can load it by path.
+"""
+from datetime import datetime
+from typing import Any
+from zoneinfo import ZoneInfo
+
+# Gross PLN/kWh. G12w rates are the ones on the bill, the dynamic tariff is
+# Pstryk: RCE + 0.08 margin + 0.07 distribution + 0.005 excise, plus VAT.
+# Other offers (G11, G12) are compared once their rates are configured.
+TARIFFS = {
+    "g12w": {"type": "zones", "peak": 1.16, "offpeak": 0.78, "weekend_offpeak": True},
+    "dynamic": {"type": "dynamic", "margin": 0.155, "vat": 1.23},
+}
+
+# Off-peak hours of G12/G12w on workdays: 22:00-06:00 and 13:00-15:00
+OFFPEAK_HOURS = frozenset({22, 23, 0, 1, 2, 3, 4, 5, 13, 14})
+
+# Net-billing: exported energy is credited at RCE x 1.23, whatever the import tariff
+EXPORT_FACTOR = 1.23
+# RCE used for hours recorded without a price, as the old automation did
+DEFAULT_RCE_MWH = 400.0
+
+# Bumped when the cost of recorded hours is computed differently, cached days are then recomputed
+COSTS_VERSION = 2
+
+COLUMNS = (
+    "grid_import_kwh",
+    "consumption_kwh",
+    "grid_export_kwh",
+    "battery_charge_kwh",
+    "battery_discharge_kwh",
+    "tariff_zone",
+    "rce_price_pln_mwh",
+)
+
+
+def _grid_import(recorded: float | None, used: float | None, charged: float | None, discharged: float | None):
+    """Recorded grid import, else the one recovered from an unclamped consumption."""
+    if recorded is not None:
+        return recorded
+    if not used:
+        return None
+    return used + (charged or 0.0) - (discharged or 0.0)
+
+
+def hourly_inputs(data: dict[str, list], tz: str) -> dict[str, list]:
+    """Per-hour columns the tariffs need, derived from recorded columns.
+
+    Grid import is recorded as grid_import_kwh. Hours recorded before that
+    column existed only have house consumption, stored as grid import -
+    battery charge + battery discharge clamped at 0; grid import is recovered
+    by reversing that where consumption is above 0. A clamped hour has lost
+    its import, so it counts as missing, like an hour without any value.
+    Missing hours import nothing.
+    """
+    zone = ZoneInfo(tz)
+    local = [datetime.fromtimestamp(timestamp, zone) for timestamp in data["timestamp"]]
+    grid_import = list(map(
+        _grid_import,
+        data["grid_import_kwh"], data["consumption_kwh"], data["battery_charge_kwh"], data["battery_discharge_kwh"],
+    ))
+    return {
+        "day": [moment.date().isoformat() for moment in local],
+        "hour": [moment.hour for moment in local],
+        "weekend": [moment.weekday() >= 5 for moment in local],
+        "zone": list(data["tariff_zone"]),
+        "missing": [value is None for value in grid_import],
+        "import_kwh": [0.0 if value is None else max(value, 0.0) for value in grid_import],
+        "export_kwh": [value or 0.0 for value in data["grid_export_kwh"]],
+        "rce_kwh": [
+            (DEFAULT_RCE_MWH if price is None else price) / 1000 for price in data["rce_price_pln_mwh"]
+        ],
+    }
+
+
+def _offpeak(inputs: dict[str, list], weekend_offpeak: bool) -> list[bool]:
+    """Off-peak flag per hour; with weekends off-peak the recorded G12w zone wins (it knows holidays)."""
+    if not weekend_offpeak:
+        return [hour in OFFPEAK_HOURS for hour in inputs["hour"]]
+    return [
+        zone == "L2" if zone in ("L1", "L2") else weekend or hour in OFFPEAK_HOURS
+        for zone, weekend, hour in zip(inputs["zone"], inputs["weekend"], inputs["hour"])
+    ]
+
+
+def hourly_prices(tariff: dict[str, Any], inputs: dict[str, list]) -> list[float]:
+    """Gross import price of every hour under one tariff."""
+    kind = tariff["type"]
+    if kind == "flat":
+        return [tariff["rate"]] * len(inputs["hour"])
+    if kind == "zones":
+        peak, offpeak = tariff["peak"], tariff["offpeak"]
+        return [offpeak if off else peak for off in _offpeak(inputs, tariff.get("weekend_offpeak", False))]
+    if kind == "dynamic":
+        margin, vat = tariff["margin"], tariff["vat"]
+        return [(rce + margin) * vat for rce in inputs["rce_kwh"]]
+    raise ValueError(f"Unknown tariff type {kind}")
+
+
+def daily_costs(data: dict[str, list], tariffs: dict[str, dict], tz: str) -> dict[str, dict[str, Any]]:
+    """Energy and cost under every tariff, per local day of the history."""
+    inputs = hourly_inputs(data, tz)
+    prices = {name: hourly_prices(tariff, inputs) for name, tariff in tariffs.items()}
+    days: dict[str, dict[str, Any]] = {}
+    for index, day in enumerate(inputs["day"]):
+        entry = days.get(day)
+        if entry is None:
+            entry = days[day] = {
+                "hours": 0, "missing": 0, "import_kwh": 0.0, "export_kwh": 0.0, "export_value": 0.0,
+                "costs": dict.fromkeys(tariffs, 0.0),
+            }
+        imported, exported = inputs["import_kwh"][index], inputs["export_kwh"][index]
+        entry["hours"] += 1
+        entry["missing"] += inputs["missing"][index]
+        entry["import_kwh"] += imported
+        entry["export_kwh"] += exported
+        entry["export_value"] += exported * inputs["rce_kwh"][index] * EXPORT_FACTOR
+        costs = entry["costs"]
+        for name, price in prices.items():
+            costs[name] += imported * price[index]
+    for entry in days.values():
+        for key in ("import_kwh", "export_kwh", "export_value"):
+            entry[key] = round(entry[key], 4)
+        entry["costs"] = {name: round(cost, 4) for name, cost in entry["costs"].items()}
+    return days
+
+
+def summarize(days: dict[str, dict[str, Any]], current: str) -> dict[str, Any]:
+    """Totals over some days, the cheapest tariff and its saving against the current one."""
+    costs: dict[str, float] = {}
+    totals = {"days": len(days), "hours": 0, "missing": 0, "import_kwh": 0.0, "export_kwh": 0.0, "export_value": 0.0}
+    for entry in days.values():
+        for key in ("hours", "missing", "import_kwh", "export_kwh", "export_value"):
+            totals[key] += entry[key]
+        for name, cost in entry["costs"].items():
+            costs[name] = costs.get(name, 0.0) + cost
+    for key in ("import_kwh", "export_kwh", "export_value"):
+        totals[key] = round(totals[key], 2)
+    costs = {name: round(cost, 2) for name, cost in costs.items()}
+    cheapest = min(costs, key=costs.get) if costs else None
+    return {
+        **totals,
+        "costs": costs,
+        "current": current,
+        "cheapest": cheapest,
+        "saving": round(costs[current] - costs[cheapest], 2) if current in costs and cheapest else None,
+    }
@@ -0,0 +1,71 @@
+"""Tariff comparison sensors for today and the current month."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from .comparator import TariffComparator
+from .const import DOMAIN, SIGNAL_COMPARISON_UPDATED
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the comparison sensors."""
+    if discovery_info is None:
+        return
+    comparator = hass.data[DOMAIN]
+    async_add_entities([TariffComparisonSensor(comparator, "today"), TariffComparisonSensor(comparator, "month")])
+
+
+class TariffComparisonSensor(SensorEntity):
+    """Import cost in the current tariff; ``costs`` holds the cost under every tariff.
+
+    The costs stay under one attribute so a tariff slug can never shadow
+    the summary attributes (days, current, cheapest, saving, ...).
+    """
+
+    _attr_icon = "mdi:scale-balance"
+    _attr_native_unit_of_measurement = "PLN"
+    _attr_should_poll = False
+
+    def __init__(self, comparator: TariffComparator, period: str):
+        self._comparator = comparator
+        self._period = period
+        if period == "today":
+            self._attr_name = "Porównanie taryf dziś"
+            self._attr_unique_id = f"{DOMAIN}_today"
+        else:
+            self._attr_name = "Porównanie taryf miesiąc"
+            self._attr_unique_id = f"{DOMAIN}_month"
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_COMPARISON_UPDATED, self.async_write_ha_state)
+        )
+
+    @property
+    def _summary(self) -> dict | None:
+        return getattr(self._comparator, self._period)
+
+    @property
+    def native_value(self) -> float | None:
+        summary = self._summary
+        if summary is None:
+            return None
+        return summary["costs"].get(summary["current"], 0.0)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        summary = self._summary
+        if summary is None:
+            return {}
+        return dict(summary)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Hourly energy rows for the ML scripts.
+
+Reads the energy_recorder store (config/custom_components/energy_recorder)
+through its own reader, so no CSV is parsed for recorded hours. Rows have the
+same keys as the old hourly CSV; missing values are None.
+
+The store directory is data/hourly_energy, a copy of /config/data/hourly_energy
+from Home Assistant, or HOURLY_STORE_PATH.
+"""
+
+import csv
+import importlib.util
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+STORE_PATH = os.environ.get('HOURLY_STORE_PATH', os.path.join(SCRIPT_DIR, '..', 'data', 'hourly_energy'))
+STORE_MODULE_PATH = os.path.join(
+    SCRIPT_DIR, '..', 'config', 'custom_components', 'energy_recorder', 'hourly_store.py'
+)
+
+
+def load_store_module():
+    """Load hourly_store.py without importing Home Assistant."""
+    spec = importlib.util.spec_from_file_location('energy_recorder_hourly_store', STORE_MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def recorder_rows(path: str = STORE_PATH) -> list:
+    """All rows recorded by energy_recorder, oldest first ([] without a store)."""
+    if not os.path.isdir(path):
+        return []
+    store = load_store_module().HourlyEnergyStore(path)
+    return store.rows()
+
+
+def history_rows(csv_path: str, store_path: str = STORE_PATH) -> list:
+    """Rows of a training CSV followed by recorded hours the CSV does not have."""
+    rows = []
+    if os.path.exists(csv_path):
+        with open(csv_path, 'r') as f:
+            rows = list(csv.DictReader(f))
+    known = {row.get('timestamp', '')[:13] for row in rows}
+    rows.extend(row for row in recorder_rows(store_path) if row['timestamp'][:13] not in known)
+    return rows
@@ -18,7 +18,8 @@ import pickle
 from datetime import datetime, timedelta
 from collections import defaultdict
 import urllib.request
-import csv
+
+from hourly_data import history_rows
 
 # Configuration
 HA_URL = os.environ.get('HA_URL', 'https://ha.bodino.us.kg')
@@ -49,27 +50,26 @@ class ConsumptionPredictor:
         self.global_hourly_avg = defaultdict(list)  # [hour] -> [values]
 
     def load_history(self, csv_path: str = HISTORY_PATH):
-        """Load historical data from CSV."""
-        if not os.path.exists(csv_path):
-            print(f"History file not found: {csv_path}")
-            return False
-
+        """Load historical data from CSV and the energy_recorder store."""
         try:
-            with open(csv_path, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    try:
-                        ts = datetime.strptime(row['timestamp'], '%Y-%m-%d %H:%M:%S')
-                        consumption = float(row['consumption_kwh'])
-
-                        if consumption > 0:  # Skip zero/invalid values
-                            hour = ts.hour
-                            weekday = ts.weekday()
-
-                            self.hourly_averages[weekday][hour].append(consumption)
-                            self.global_hourly_avg[hour].append(consumption)
-                    except (ValueError, KeyError):
-                        continue
+            rows = history_rows(csv_path)
+            if not rows:
+                print(f"No history in {csv_path} or the energy_recorder store")
+                return False
+
+            for row in rows:
+                try:
+                    ts = datetime.strptime(row['timestamp'], '%Y-%m-%d %H:%M:%S')
+                    consumption = float(row['consumption_kwh'])
+
+                    if consumption > 0:  # Skip zero/invalid values
+                        hour = ts.hour
+                        weekday = ts.weekday()
+
+                        self.hourly_averages[weekday][hour].append(consumption)
+                        self.global_hourly_avg[hour].append(consumption)
+                except (ValueError, KeyError, TypeError):
+                    continue
 
             print(f"Loaded {sum(len(v) for h in self.hourly_averages.values() for v in h.values())} records")
             return True
@@ -17,7 +17,6 @@ Autor: Claude Code
 Data: 2025-11-28
 """
 
-import csv
 import os
 import pickle
 import json
@@ -31,6 +30,8 @@ from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 import numpy as np
 
+from hourly_data import history_rows
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_PATH = os.path.join(SCRIPT_DIR, '..', 'data', 'ml_training_data.csv')
 MODEL_PATH = os.path.join(SCRIPT_DIR, '..', 'data', 'consumption_model.pkl')
@@ -93,31 +94,29 @@ def load_training_data():
     X = []
     y = []
 
-    with open(DATA_PATH, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                consumption = float(row['consumption_kwh'])
-                if consumption <= 0 or consumption > 10:  # Filter outliers
-                    continue
-
-                features = extract_features(row['timestamp'])
-                X.append([
-                    features['hour'],
-                    features['day_of_week'],
-                    features['is_weekend'],
-                    features['is_holiday'],
-                    features['month'],
-                    features['is_heating_season'],
-                    features['hour_sin'],
-                    features['hour_cos'],
-                    features['dow_sin'],
-                    features['dow_cos'],
-                ])
-                y.append(consumption)
-            except (ValueError, KeyError):
+    for row in history_rows(DATA_PATH):
+        try:
+            consumption = float(row['consumption_kwh'])
+            if consumption <= 0 or consumption > 10:  # Filter outliers
                 continue
 
+            features = extract_features(row['timestamp'])
+            X.append([
+                features['hour'],
+                features['day_of_week'],
+                features['is_weekend'],
+                features['is_holiday'],
+                features['month'],
+                features['is_heating_season'],
+                features['hour_sin'],
+                features['hour_cos'],
+                features['dow_sin'],
+                features['dow_cos'],
+            ])
+            y.append(consumption)
+        except (ValueError, KeyError, TypeError):
+            continue
+
     return np.array(X), np.array(y)
 
 
@@ -4,12 +4,31 @@ Pytest fixtures for Home Assistant battery algorithm tests.
 Mock Home Assistant 'hass' object and related entities.
 """
 
+import importlib.util
 import pytest
 from unittest.mock import MagicMock, patch
 import sys
+from pathlib import Path
 from types import ModuleType
 
 
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def load_module(relpath):
+    """
+    Load one module file of the repo, given relative to the repo root.
+
+    Integration packages import homeassistant in __init__.py, so their pure
+    modules are loaded on their own, as <package>_<module>.
+    """
+    path = REPO_ROOT / relpath
+    spec = importlib.util.spec_from_file_location(f"{path.parent.name}_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 class MockState:
     """Mock Home Assistant state object."""
 
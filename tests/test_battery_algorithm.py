@@ -1,42 +1,29 @@
 """
-Tests for battery_algorithm.py - Huawei Luna 2000 battery management algorithm.
+Tests for battery_algorithm/engine.py - Huawei Luna 2000 battery management algorithm.
 
-Since the script runs in Home Assistant python_scripts context with injected 'hass',
-we use exec() to load the code with mocked hass object.
+The engine reads and writes through a module-level 'hass' set by its coordinator,
+so each test loads a fresh copy of the module and sets a mocked hass object.
 """
 
 import pytest
 import os
-from pathlib import Path
-from conftest import MockHass, MockState, create_test_data
+from conftest import MockHass, MockState, create_test_data, load_module
 
 
-# Path to the algorithm file
-ALGORITHM_PATH = Path(__file__).parent.parent / "config" / "python_scripts" / "battery_algorithm.py"
+# Path to the algorithm engine, relative to the repo root
+ALGORITHM_PATH = "config/custom_components/battery_algorithm/engine.py"
 
 
 def load_algorithm_functions(mock_hass):
     """
-    Load algorithm functions with mocked hass object.
+    Load the engine with mocked hass object.
 
-    Returns a dict of all functions and constants from the algorithm.
+    Returns the module namespace: all functions and constants of the algorithm.
+    The engine has no Home Assistant imports, so it is loaded from its file.
     """
-    with open(ALGORITHM_PATH, 'r', encoding='utf-8') as f:
-        code = f.read()
-
-    # Remove the final try/except block that calls execute_strategy()
-    # Find the last 'try:' which starts the main execution block
-    last_try_index = code.rfind('\ntry:\n    execute_strategy()')
-    if last_try_index > 0:
-        code = code[:last_try_index]
-
-    # Create namespace with mocked hass
-    namespace = {'hass': mock_hass}
-
-    # Execute the code in the namespace
-    exec(code, namespace)
-
-    return namespace
+    module = load_module(ALGORITHM_PATH)
+    module.hass = mock_hass
+    return vars(module)
 
 
 class TestConstants:
@@ -1500,6 +1487,204 @@ class TestDailyCycleIntegration:
             f"Step 4: expensive hour 9h → sell, got {s4['mode']}"
 
 
+# ============================================
+# TESTY: PROGNOZA GODZINOWA PV (pv_calibration)
+# ============================================
+
+def _pv_hourly(values):
+    """Helper: 24-hour kWh array from {hour: kWh}."""
+    return [float(values.get(h, 0.0)) for h in range(24)]
+
+
+class TestHourlyPvForecast:
+    """Planners use the calibrated hourly PV array when it is available."""
+
+    def test_get_pv_hourly_reads_sensor(self, mock_hass):
+        """Array comes from sensor.pv_prognoza_skorygowana, None when unavailable or malformed."""
+        ns = load_algorithm_functions(mock_hass)
+        assert ns['get_pv_hourly']('today') is None
+
+        mock_hass.states.set('sensor.pv_prognoza_skorygowana', '12.0', {
+            'today': [1] * 24, 'tomorrow': [0.5] * 10,
+        })
+        assert ns['get_pv_hourly']('today') == [1.0] * 24
+        assert ns['get_pv_hourly']('tomorrow') is None
+
+    def test_sun_window_from_array(self, mock_hass):
+        """Window runs from the first to the last hour with production."""
+        ns = load_algorithm_functions(mock_hass)
+        pv = _pv_hourly({7: 0.02, 8: 0.3, 12: 2.0, 15: 0.4, 16: 0.01})
+        assert ns['get_pv_sun_window'](pv) == (8, 16)
+        assert ns['get_pv_sun_window'](_pv_hourly({})) is None
+        assert ns['get_pv_sun_window'](None) is None
+
+    def test_weak_cheap_hour_adds_more_hours(self, mock_hass):
+        """A cheap hour with little PV does not count as a full hour of storage."""
+        mock_hass.states.set('binary_sensor.dzien_roboczy', 'on')
+        today_prices = {h: 500 for h in range(6, 18)}
+        today_prices[7] = 20    # cheapest, but early morning
+        today_prices[12] = 50
+        today_prices[13] = 60
+        today_prices[14] = 70
+
+        _setup_rce_mocks(mock_hass, '2026-03-05', today_prices=today_prices)
+        ns = load_algorithm_functions(mock_hass)
+
+        pv = _pv_hourly({6: 0.1, 7: 0.3, 8: 1, 9: 2, 10: 3, 11: 4, 12: 4, 13: 4, 14: 3, 15: 2, 16: 1, 17: 0.2})
+        data = create_test_data({
+            'soc': 30, 'target_soc': 85, 'hour': 10, 'month': 3,
+            'forecast_today': 27.6, 'forecast_tomorrow': 15,
+            'pv_hourly_today': pv,
+        })
+
+        is_cheap, reason, cheapest = ns['calculate_cheapest_hours_to_store'](data)
+
+        # 8.25 kWh to store: 7h (0.3) + 12h (4) + 13h (4) = 8.3
+        assert sorted(cheapest) == [7, 12, 13]
+
+    def test_first_cheap_hour_uses_tomorrow_window(self, mock_hass):
+        """Hours outside tomorrow's PV window are skipped even if cheapest."""
+        tomorrow_prices = {h: 500 for h in range(6, 18)}
+        tomorrow_prices[6] = 20    # cheapest, no PV tomorrow at 6h
+        tomorrow_prices[9] = 40
+        tomorrow_prices[11] = 50
+        tomorrow_prices[12] = 60
+
+        _setup_rce_mocks(mock_hass, '2026-03-04', tomorrow_prices=tomorrow_prices)
+        ns = load_algorithm_functions(mock_hass)
+
+        pv = _pv_hourly({h: 5.0 for h in range(8, 16)})
+        data = create_test_data({
+            'month': 3, 'soc_min': 15, 'soc_max': 85,
+            'forecast_tomorrow': 40, 'pv_hourly_tomorrow': pv,
+        })
+
+        assert ns['get_first_cheap_pv_hour'](data) == 9
+
+    def test_without_array_keeps_average_estimate(self, mock_hass):
+        """No hourly array → N cheapest hours from the daily average, as before."""
+        mock_hass.states.set('binary_sensor.dzien_roboczy', 'on')
+        today_prices = {h: 500 for h in range(6, 18)}
+        today_prices[7] = 20
+        today_prices[12] = 50
+
+        _setup_rce_mocks(mock_hass, '2026-03-05', today_prices=today_prices)
+        ns = load_algorithm_functions(mock_hass)
+
+        data = create_test_data({
+            'soc': 30, 'target_soc': 85, 'hour': 10, 'month': 3,
+            'forecast_today': 60, 'forecast_tomorrow': 15,
+        })
+
+        is_cheap, reason, cheapest = ns['calculate_cheapest_hours_to_store'](data)
+
+        # 8.25 kWh / (60 / 12) kWh per hour → 1 + 1 = 2 hours
+        assert sorted(cheapest) == [7, 12]
+
+
+class TestSunWindow:
+    """Sun hours come from the solar_ephemeris sensor, seasonal table only as fallback."""
+
+    def test_get_sun_window_reads_sensor(self, mock_hass):
+        ns = load_algorithm_functions(mock_hass)
+        assert ns['get_sun_window']('today') is None
+
+        mock_hass.states.set('sensor.efemeryda_slonca', '12.1', {
+            'today_window': [7, 17], 'tomorrow_window': None,
+        })
+        assert ns['get_sun_window']('today') == (7, 17)
+        assert ns['get_sun_window']('tomorrow') is None
+
+    def test_cheapest_hours_use_ephemeris_window(self, mock_hass):
+        """Cheap hour 6 is outside the ephemeris window (7-17) even though March table starts at 6."""
+        mock_hass.states.set('binary_sensor.dzien_roboczy', 'on')
+        today_prices = {h: 500 for h in range(6, 18)}
+        today_prices[6] = 20
+        today_prices[12] = 50
+
+        _setup_rce_mocks(mock_hass, '2026-03-20', today_prices=today_prices)
+        ns = load_algorithm_functions(mock_hass)
+
+        data = create_test_data({
+            'soc': 30, 'target_soc': 85, 'hour': 10, 'month': 3,
+            'forecast_today': 120, 'forecast_tomorrow': 15,
+            'sun_window_today': (7, 17),
+        })
+
+        is_cheap, reason, cheapest = ns['calculate_cheapest_hours_to_store'](data)
+
+        assert cheapest == [12]
+
+    def test_first_cheap_hour_uses_tomorrow_ephemeris(self, mock_hass):
+        """Winter table would allow 7h; ephemeris says the sun hours start at 9h."""
+        tomorrow_prices = {h: 500 for h in range(7, 16)}
+        tomorrow_prices[7] = 20
+        tomorrow_prices[8] = 30
+        tomorrow_prices[11] = 40
+
+        _setup_rce_mocks(mock_hass, '2026-01-14', tomorrow_prices=tomorrow_prices)
+        ns = load_algorithm_functions(mock_hass)
+
+        data = create_test_data({
+            'month': 1, 'soc_min': 20, 'soc_max': 80,
+            'forecast_tomorrow': 60, 'sun_window_tomorrow': (9, 15),
+        })
+
+        assert ns['get_first_cheap_pv_hour'](data) == 11
+
+
+class TestEngineRun:
+    """run() entry point used by the battery_algorithm coordinator."""
+
+    def test_run_returns_plan(self, setup_hass_states):
+        ns = load_algorithm_functions(setup_hass_states)
+        plan = ns['run']()
+        assert plan['strategy']['mode']
+        assert plan['data']['soc'] == 50.0
+        assert 'balance' in plan
+
+    def test_run_error_sets_safe_mode(self, setup_hass_states):
+        ns = load_algorithm_functions(setup_hass_states)
+
+        def broken():
+            raise RuntimeError("boom")
+
+        ns['execute_strategy'] = broken
+        plan = ns['run']()
+        assert plan['strategy']['mode'] == 'error'
+        assert 'boom' in plan['error']
+        options = [c['data'].get('option') for c in setup_hass_states.services.calls]
+        assert 'maximise_self_consumption' in options
+
+    def test_log_decision_writes_valid_json(self, setup_hass_states):
+        import json
+
+        ns = load_algorithm_functions(setup_hass_states)
+        strategy = {'mode': 'idle', 'priority': 'normal', 'reason': 'Cena "RCE" wysoka\\'}
+        ns['log_decision']({}, {}, strategy, True)
+        call = [c for c in setup_hass_states.services.calls
+                if c['data'].get('entity_id') == 'input_text.event_log_1'][0]
+        event = json.loads(call['data']['value'])
+        assert event['ts'] == '2025-01-15T12:00:00'
+        assert event['cat'] == 'PRICE'
+        assert event['msg'] == "Cena 'RCE' wysoka\\"
+
+    def test_run_times_phases(self, setup_hass_states):
+        timing = load_module("config/custom_components/battery_algorithm/timing.py")
+
+        ns = load_algorithm_functions(setup_hass_states)
+        ns['timer'] = timing.SpanTimer()
+        ns['run']()
+        spans = ns['timer'].as_dict()
+        for phase in ('collect', 'cheapest_hours', 'decide', 'apply', 'log_decision'):
+            assert spans[phase]['count'] == 1
+
+    def test_tomorrow_across_year_and_leap_day(self, mock_hass):
+        ns = load_algorithm_functions(mock_hass)
+        assert ns['get_tomorrow_str']('2025-12-31') == '2026-01-01'
+        assert ns['get_tomorrow_str']('2028-02-28') == '2028-02-29'
+
+
 # ============================================
 # TESTY: EDGE CASES NAJTAŃSZYCH GODZIN
 # ============================================
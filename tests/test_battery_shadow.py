@@ -0,0 +1,105 @@
+"""
+Tests for battery_algorithm/shadow.py - projected cost and A/B statistics.
+"""
+
+from conftest import load_module
+
+
+shadow = load_module("config/custom_components/battery_algorithm/shadow.py")
+
+
+def _data(**overrides):
+    data = {"soc": 50.0, "soc_min": 10, "soc_max": 80, "tariff_zone": "L2", "rce_now": 0.4}
+    data.update(overrides)
+    return data
+
+
+def _balance(pv, load):
+    return {"pv": pv, "load": load, "surplus": max(pv - load, 0), "deficit": max(load - pv, 0)}
+
+
+class TestBatteryPower:
+    """Battery power of the next hour per mode, limited by SOC."""
+
+    def test_charge_from_grid_full_power(self):
+        assert shadow.battery_power({"mode": "charge_from_grid"}, _data(soc=30), _balance(0, 1)) == 5.0
+
+    def test_charge_limited_by_soc_max(self):
+        # 78% -> 80% of 15 kWh leaves 0.3 kWh
+        power = shadow.battery_power({"mode": "charge_from_grid"}, _data(soc=78), _balance(0, 1))
+        assert round(power, 3) == 0.3
+
+    def test_discharge_to_home_covers_deficit(self):
+        assert shadow.battery_power({"mode": "discharge_to_home"}, _data(), _balance(1, 3)) == -2.0
+
+    def test_discharge_limited_by_soc_min(self):
+        power = shadow.battery_power({"mode": "discharge_to_grid"}, _data(soc=12), _balance(0, 1))
+        assert round(power, 3) == -0.3
+
+    def test_idle_is_self_consumption(self):
+        assert shadow.battery_power({"mode": "idle"}, _data(), _balance(4, 1)) == 3.0
+        assert shadow.battery_power({"mode": "idle"}, _data(), _balance(1, 2)) == -1.0
+
+    def test_grid_to_home_leaves_battery(self):
+        assert shadow.battery_power({"mode": "grid_to_home"}, _data(), _balance(0, 2)) == 0.0
+
+
+class TestProjectHourCost:
+    """Import at the zone price, export at RCE x 1.23, battery change credited."""
+
+    def test_import_in_cheap_zone(self):
+        result = shadow.project_hour_cost({"mode": "grid_to_home"}, _data(), _balance(0, 2))
+        assert result == {"battery_kwh": 0.0, "grid_kwh": 2.0, "cost": 1.56}
+
+    def test_export_earns_rce(self):
+        result = shadow.project_hour_cost({"mode": "grid_to_home"}, _data(), _balance(3, 1))
+        assert result["grid_kwh"] == -2.0
+        assert result["cost"] == round(-2 * 0.4 * 1.23, 4)
+
+    def test_charging_is_credited_at_stored_value(self):
+        # Charging from the grid in L2 costs the same as the energy is worth
+        result = shadow.project_hour_cost({"mode": "charge_from_grid"}, _data(soc=30), _balance(0, 0))
+        assert result["battery_kwh"] == 5.0
+        assert result["cost"] == 0.0
+
+    def test_discharge_cheaper_than_import_in_peak(self):
+        data, balance = _data(tariff_zone="L1"), _balance(0, 2)
+        grid = shadow.project_hour_cost({"mode": "grid_to_home"}, data, balance)
+        battery = shadow.project_hour_cost({"mode": "discharge_to_home"}, data, balance)
+        assert battery["cost"] < grid["cost"]
+
+
+class TestShadowStats:
+    """Per-day sums of runs, disagreements and projected costs."""
+
+    def test_add_and_totals(self):
+        stats = shadow.ShadowStats()
+        stats.add("2026-01-10", {"mode": "idle", "cost": 1.0}, {"mode": "idle", "cost": 1.0})
+        stats.add("2026-01-10", {"mode": "idle", "cost": 1.0}, {"mode": "charge_from_grid", "cost": 0.5})
+        stats.add("2026-01-11", {"mode": "idle", "cost": 2.0}, {"mode": "idle", "cost": 2.5})
+        assert stats.totals() == {
+            "days": 2,
+            "runs": 3,
+            "disagreements": 1,
+            "live_cost": 4.0,
+            "candidate_cost": 4.0,
+            "difference": 0.0,
+        }
+
+    def test_old_days_dropped(self):
+        stats = shadow.ShadowStats()
+        for day in range(shadow.HISTORY_DAYS + 5):
+            stats.add(f"2026-{1 + day // 28:02d}-{1 + day % 28:02d}", {"mode": "idle", "cost": 1.0}, {"mode": "idle", "cost": 0.0})
+        assert len(stats.days) == shadow.HISTORY_DAYS
+        assert "2026-01-01" not in stats.days
+
+    def test_round_trip(self):
+        stats = shadow.ShadowStats()
+        stats.add("2026-01-10", {"mode": "idle", "cost": 1.2}, {"mode": "idle", "cost": 0.7})
+        restored = shadow.ShadowStats.from_dict(stats.as_dict())
+        assert restored.days == stats.days
+
+    def test_from_dict_skips_broken_entries(self):
+        restored = shadow.ShadowStats.from_dict({"days": {"2026-01-10": {"runs": "x"}}})
+        assert restored.days == {}
+        assert shadow.ShadowStats.from_dict(None).days == {}
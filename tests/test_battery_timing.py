@@ -0,0 +1,83 @@
+"""
+Tests for battery_algorithm/timing.py - span timing and rolling percentiles.
+"""
+
+from conftest import load_module
+
+
+timing = load_module("config/custom_components/battery_algorithm/timing.py")
+
+
+class TestPercentile:
+    """Linear interpolation between the closest ranks."""
+
+    def test_empty(self):
+        assert timing.percentile([], 50) is None
+
+    def test_median_and_p95(self):
+        values = list(range(1, 101))
+        assert timing.percentile(values, 50) == 50.5
+        assert round(timing.percentile(values, 95), 2) == 95.05
+
+    def test_single_value(self):
+        assert timing.percentile([7.0], 95) == 7.0
+
+
+class TestSpanTimer:
+    """Spans with the same name add up, with a count."""
+
+    def test_spans_add_up(self):
+        timer = timing.SpanTimer()
+        timer.add("state_read", 0.001)
+        timer.add("state_read", 0.002)
+        timer.add("decide", 0.010)
+        assert timer.as_dict() == {
+            "state_read": {"ms": 3.0, "count": 2},
+            "decide": {"ms": 10.0, "count": 1},
+        }
+
+    def test_span_recorded_on_exception(self):
+        timer = timing.SpanTimer()
+        try:
+            with timer.span("apply"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        assert timer.as_dict()["apply"]["count"] == 1
+
+
+class TestRunTimings:
+    """Rolling window of flat samples with p50/p95 per key."""
+
+    def test_sample_is_flat(self):
+        runs = timing.RunTimings()
+        sample = runs.add(12.345, {"service_call": {"ms": 8.0, "count": 6}})
+        assert sample == {"total_ms": 12.35, "service_call_ms": 8.0, "service_call_count": 6}
+
+    def test_window_keeps_last_runs(self):
+        runs = timing.RunTimings(size=3)
+        for total in (100, 1, 2, 3):
+            runs.add(total, {})
+        assert [run["total_ms"] for run in runs.runs] == [1, 2, 3]
+
+    def test_summary_percentiles(self):
+        runs = timing.RunTimings()
+        for total in range(1, 101):
+            runs.add(total, {"decide": {"ms": 1.0, "count": 1}})
+        summary = runs.summary()
+        assert summary["runs"] == 100
+        assert summary["total_ms_p50"] == 50.5
+        assert summary["total_ms_p95"] == 95.05
+        assert summary["decide_ms_p95"] == 1.0
+
+    def test_missing_span_counts_as_zero(self):
+        runs = timing.RunTimings()
+        runs.add(10, {"cheapest_hours": {"ms": 4.0, "count": 1}})
+        runs.add(10, {})
+        assert runs.summary()["cheapest_hours_ms_p50"] == 2.0
+
+    def test_slow_runs(self):
+        runs = timing.RunTimings()
+        for total in (500, 2500, 3000):
+            runs.add(total, {})
+        assert runs.slow_runs(2000) == 2
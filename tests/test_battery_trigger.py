@@ -0,0 +1,79 @@
+"""
+Tests for battery_trigger/run_queue.py - debounced run queue and snapshots.
+"""
+
+from conftest import load_module
+
+
+rq = load_module("config/custom_components/battery_trigger/run_queue.py")
+
+
+class TestRunQueue:
+    """Requests are merged into debounced runs with a minimum spacing."""
+
+    def test_first_request_waits_for_debounce(self):
+        queue = rq.RunQueue(debounce=5, min_interval=30)
+        assert queue.add("hourly", False, now=100) == 5
+
+    def test_requests_merged_until_taken(self):
+        queue = rq.RunQueue(debounce=5, min_interval=30)
+        queue.add("hourly", False, now=100)
+        assert queue.add("key_moment 06:00", True, now=101) is None
+        assert queue.add("hourly", False, now=102) is None
+        assert queue.take() == (["hourly", "key_moment 06:00"], True)
+        assert queue.pending == []
+
+    def test_not_forced_when_no_request_forced(self):
+        queue = rq.RunQueue(debounce=5, min_interval=30)
+        queue.add("hourly", False, now=0)
+        assert queue.take() == (["hourly"], False)
+
+    def test_minimum_spacing_after_run(self):
+        queue = rq.RunQueue(debounce=5, min_interval=30)
+        queue.add("hourly", False, now=0)
+        queue.take()
+        queue.mark_run(5)
+        # 10 s after the run: wait until 30 s have passed
+        assert queue.add("soc_threshold", True, now=15) == 20
+        queue.take()
+        # Long after: only the debounce
+        assert queue.add("soc_threshold", True, now=500) == 5
+
+    def test_new_schedule_after_take(self):
+        queue = rq.RunQueue(debounce=5, min_interval=30)
+        queue.add("hourly", False, now=0)
+        queue.take()
+        assert queue.add("startup", True, now=1) == 5
+
+
+class TestSnapshot:
+    """Material changes of the algorithm inputs."""
+
+    def test_price_bucket(self):
+        assert rq.price_bucket(0.2, 0.3, 0.5) == "low"
+        assert rq.price_bucket(0.3, 0.3, 0.5) == "mid"
+        assert rq.price_bucket(0.6, 0.3, 0.5) == "high"
+        assert rq.price_bucket(None, 0.3, 0.5) is None
+
+    def test_everything_changed_without_previous(self):
+        current = {"soc": 50.0, "price_bucket": "low", "tariff_zone": "L2", "hour": 12}
+        assert rq.snapshot_changes(None, current, 2.0) == ["soc", "price_bucket", "tariff_zone", "hour"]
+
+    def test_small_soc_change_is_not_material(self):
+        previous = {"soc": 50.0, "price_bucket": "low", "tariff_zone": "L2", "hour": 12}
+        assert rq.snapshot_changes(previous, {**previous, "soc": 51.5}, 2.0) == []
+        assert rq.snapshot_changes(previous, {**previous, "soc": 47.9}, 2.0) == ["soc"]
+
+    def test_bucket_and_zone_changes(self):
+        previous = {"soc": 50.0, "price_bucket": "low", "tariff_zone": "L2", "hour": 12}
+        current = {"soc": 50.0, "price_bucket": "high", "tariff_zone": "L1", "hour": 12}
+        assert rq.snapshot_changes(previous, current, 2.0) == ["price_bucket", "tariff_zone"]
+
+    def test_soc_becoming_unavailable_is_a_change(self):
+        previous = {"soc": 50.0, "price_bucket": "low", "tariff_zone": "L2", "hour": 12}
+        assert rq.snapshot_changes(previous, {**previous, "soc": None}, 2.0) == ["soc"]
+
+    def test_new_hour_is_a_change(self):
+        # The hourly tick must not be skipped: the hour may be a planned storage hour
+        previous = {"soc": 50.0, "price_bucket": "low", "tariff_zone": "L2", "hour": 12}
+        assert rq.snapshot_changes(previous, {**previous, "hour": 13}, 2.0) == ["hour"]
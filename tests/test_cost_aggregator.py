@@ -0,0 +1,95 @@
+"""
+Tests for pstryk/cost_aggregator.py - incremental month and year cost totals.
+"""
+
+from conftest import load_module
+
+
+ca = load_module("config/custom_components/pstryk/cost_aggregator.py")
+
+
+def cost_frame(month, balance, sold, cost):
+    return {
+        "start": f"2025-{month:02d}-01T00:00:00+01:00",
+        "energy_balance_value": balance,
+        "energy_sold_value": sold,
+        "fae_cost": cost,
+    }
+
+
+def usage_frame(month, fae, rae):
+    return {"start": f"2025-{month:02d}-01T00:00:00+01:00", "fae_usage": fae, "rae": rae}
+
+
+def year_response():
+    cost = {"frames": [cost_frame(1, -100, 20, -120), cost_frame(2, -80, 30, -110)]}
+    usage = {"frames": [usage_frame(1, 200, 40), usage_frame(2, 180, 60)]}
+    return cost, usage
+
+
+class TestCostAggregator:
+    """Test CostAggregator."""
+
+    def test_month_totals(self):
+        agg = ca.CostAggregator()
+        agg.fold(*year_response())
+
+        month = agg.month("2025-02")
+        assert month["total_balance"] == -80
+        assert month["total_sold"] == 30
+        assert month["total_cost"] == 110
+        assert month["fae_usage"] == 180
+        assert month["rae_usage"] == 60
+        assert month["frame"]["start"].startswith("2025-02")
+
+    def test_year_total_sums_months(self):
+        agg = ca.CostAggregator()
+        agg.fold(*year_response())
+
+        year = agg.year(2025)
+        assert year["total_balance"] == -180
+        assert year["total_cost"] == 230
+        assert year["fae_usage"] == 380
+        assert year["frame"] == {}
+
+    def test_unchanged_frames_are_skipped(self):
+        agg = ca.CostAggregator()
+        agg.fold(*year_response())
+
+        assert agg.fold(*year_response()) == set()
+
+    def test_current_month_update_rebuilds_year(self):
+        agg = ca.CostAggregator()
+        agg.fold(*year_response())
+        assert agg.year(2025)["total_cost"] == 230
+
+        changed = agg.fold(
+            {"frames": [cost_frame(2, -90, 30, -125)]},
+            {"frames": [usage_frame(2, 190, 60)]},
+        )
+
+        assert changed == {"2025-02"}
+        assert agg.year(2025)["total_cost"] == 245
+        assert agg.year(2025)["fae_usage"] == 390
+        assert agg.month("2025-01")["total_cost"] == 120
+
+    def test_returned_totals_are_copies(self):
+        agg = ca.CostAggregator()
+        agg.fold(*year_response())
+
+        agg.year(2025)["total_cost"] = 0
+        agg.month("2025-01")["total_cost"] = 0
+
+        assert agg.year(2025)["total_cost"] == 230
+        assert agg.month("2025-01")["total_cost"] == 120
+
+    def test_prune_drops_previous_years(self):
+        agg = ca.CostAggregator()
+        agg.fold(*year_response())
+        agg.mark_year_loaded(2025)
+
+        agg.prune(2026)
+
+        assert not agg.has_month("2025-01")
+        assert not agg.is_year_loaded(2025)
+        assert agg.year(2026)["total_cost"] == 0
@@ -0,0 +1,114 @@
+"""
+Tests for panasonic_cc/energy_history.py - hourly energy built from daily totals.
+"""
+
+import json
+from datetime import date, datetime
+
+from conftest import load_module
+
+
+eh = load_module("config/custom_components/panasonic_cc/energy_history.py")
+
+DAY = date(2025, 1, 15)
+
+
+def at(hour, minute=0, day=15):
+    return datetime(2025, 1, day, hour, minute)
+
+
+def totals(consumption, heating=None, cooling=0.0):
+    return {
+        "consumption": consumption,
+        "heating_consumption": consumption if heating is None else heating,
+        "cooling_consumption": cooling,
+    }
+
+
+class TestHourlyEnergyHistory:
+    """Test HourlyEnergyHistory."""
+
+    def test_first_reading_is_only_a_baseline(self):
+        history = eh.HourlyEnergyHistory()
+
+        assert history.add_reading(at(10), totals(5.0)) is False
+        assert history.day(DAY) is None
+
+    def test_deltas_within_an_hour_stay_in_that_hour(self):
+        history = eh.HourlyEnergyHistory()
+        history.add_reading(at(10, 5), totals(5.0))
+
+        assert history.add_reading(at(10, 30), totals(5.4)) is True
+        history.add_reading(at(10, 55), totals(5.6))
+        history.add_reading(at(10, 59), totals(5.6))
+
+        hourly = history.day(DAY)
+        assert hourly[10] == 0.6
+        assert sum(hourly) == 0.6
+
+    def test_gap_is_spread_over_missed_hours(self):
+        history = eh.HourlyEnergyHistory()
+        history.add_reading(at(10, 30), totals(5.0))
+
+        history.add_reading(at(12, 30), totals(7.0))
+
+        hourly = history.day(DAY)
+        assert hourly[10:13] == [0.5, 1.0, 0.5]
+
+    def test_new_day_counts_from_zero(self):
+        history = eh.HourlyEnergyHistory()
+        history.add_reading(at(23, 55), totals(20.0))
+
+        history.add_reading(at(0, 5, day=16), totals(0.3))
+
+        assert history.day(date(2025, 1, 16))[0] == 0.3
+
+    def test_downward_correction_is_a_new_baseline(self):
+        history = eh.HourlyEnergyHistory()
+        history.add_reading(at(10), totals(5.0))
+        history.add_reading(at(11), totals(4.0))
+
+        history.add_reading(at(12), totals(4.5))
+
+        assert history.day(DAY)[11] == 0.5
+        assert sum(history.day(DAY)) == 0.5
+
+    def test_fields_are_tracked_separately(self):
+        history = eh.HourlyEnergyHistory()
+        history.add_reading(at(10), totals(5.0, heating=4.0))
+
+        history.add_reading(at(11), totals(6.0, heating=4.2))
+
+        assert history.day(DAY, "consumption")[10] == 1.0
+        assert history.day(DAY, "heating_consumption")[10] == 0.2
+        assert history.day(DAY, "cooling_consumption")[10] == 0.0
+
+    def test_restart_continues_from_saved_reading(self):
+        history = eh.HourlyEnergyHistory()
+        history.add_reading(at(10), totals(5.0))
+        history.add_reading(at(11), totals(6.0))
+        saved = json.loads(json.dumps(history.as_dict()))
+
+        restored = eh.HourlyEnergyHistory.from_dict(saved)
+        restored.add_reading(at(12), totals(6.5))
+
+        assert restored.day(DAY)[10:12] == [1.0, 0.5]
+
+    def test_hourly_pairs_skip_days_without_data(self):
+        history = eh.HourlyEnergyHistory()
+        history.add_reading(at(10), totals(5.0))
+        history.add_reading(at(11), totals(6.0))
+
+        pairs = history.hourly(date(2025, 1, 14), date(2025, 1, 15))
+
+        assert len(pairs) == 24
+        assert pairs[10] == ("2025-01-15 10", 1.0)
+
+    def test_old_days_are_pruned(self):
+        history = eh.HourlyEnergyHistory(retention_days=2)
+        history.add_reading(at(10, day=10), totals(1.0))
+        history.add_reading(at(11, day=10), totals(2.0))
+        history.add_reading(at(1, day=15), totals(1.0))
+
+        assert history.day(date(2025, 1, 10)) is None
+        assert history.day(DAY)[0] == 1.0
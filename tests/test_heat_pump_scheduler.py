@@ -0,0 +1,209 @@
+"""
+Tests for heat_pump_scheduler/engine.py - CWU and space-heating shifting into cheap hours.
+"""
+
+from datetime import datetime, timedelta
+
+from conftest import MockHass, load_module
+
+
+SCHEDULER_PATH = "config/custom_components/heat_pump_scheduler/engine.py"
+
+# A Wednesday, far from today so binary_sensor.dzien_roboczy is not consulted
+START = datetime(2025, 1, 15, 22, 0)
+
+
+def load_scheduler(mock_hass):
+    """Load a fresh copy of the engine with mocked hass; returns the module."""
+    module = load_module(SCHEDULER_PATH)
+    module.hass = mock_hass
+    return module
+
+
+def rce_entries(day, prices_by_hour):
+    """RCE 'prices' attribute: 4 quarter-hours per hour, dtime = END of period."""
+    entries = []
+    for hour, price in prices_by_hour.items():
+        start = day.replace(hour=hour, minute=0)
+        for q in range(4):
+            end = start + timedelta(minutes=15 * (q + 1))
+            entries.append({'dtime': end.strftime('%Y-%m-%d %H:%M:%S'), 'period': '', 'rce_pln': price * 1000})
+    return entries
+
+
+class TestRceHourly:
+    """Test get_rce_hourly()."""
+
+    def test_quarter_hours_averaged_per_hour(self):
+        hass = MockHass()
+        day = datetime(2025, 1, 15)
+        entries = rce_entries(day, {10: 0.4})
+        entries[0]['rce_pln'] = 800  # first quarter 0.8
+        hass.states.set('sensor.rce_pse_cena', '0.4', {'prices': entries})
+        ns = load_scheduler(hass)
+
+        hourly = ns.get_rce_hourly()
+
+        assert hourly == {'2025-01-15 10': 0.5}
+
+
+class TestPlan:
+    """Test make_plan()."""
+
+    def test_cwu_in_cheapest_hour_of_each_window(self):
+        hass = MockHass()
+        ns = load_scheduler(hass)
+        rce = {(START + timedelta(hours=i)).strftime('%Y-%m-%d %H'): 0.5 for i in range(24)}
+        rce.update({
+            '2025-01-16 03': 0.10,  # cheapest night hour
+            '2025-01-16 13': 0.05,  # cheapest midday hour (L2)
+            '2025-01-16 11': 0.00,  # cheap RCE but L1
+        })
+
+        plan = ns.make_plan(START, 21.0, 5.0, False, rce, None)
+        cwu = [p['hour'] for p in plan if p['cwu']]
+
+        assert '2025-01-16 03:00' in cwu
+        assert '2025-01-16 13:00' in cwu
+        assert len(cwu) == 2
+
+    def test_missing_rce_is_not_treated_as_free(self):
+        hass = MockHass()
+        ns = load_scheduler(hass)
+        rce = {(START + timedelta(hours=i)).strftime('%Y-%m-%d %H'): 0.5 for i in range(12)}
+        rce['2025-01-16 03'] = 0.2
+
+        plan = ns.make_plan(START, 21.0, 5.0, False, rce, None)
+
+        assert '2025-01-16 03:00' in [p['hour'] for p in plan if p['cwu']]
+
+    def test_no_setpoint_changes_outside_heating(self):
+        hass = MockHass()
+        ns = load_scheduler(hass)
+
+        plan = ns.make_plan(START, 21.0, 15.0, False, {}, None)
+
+        assert all(p['offset'] == 0 and p['setpoint'] is None for p in plan)
+
+    def test_setback_in_l1_and_preheat_before_it_within_bounds(self):
+        hass = MockHass()
+        ns = load_scheduler(hass)
+        profile = {'by_hour': {str(h): (3.0 if h == 17 else 1.0) for h in range(24)}}
+
+        plan = ns.make_plan(START, 21.0, 6.0, True, {}, profile, min_temp=16, max_temp=22)
+        by_hour = {p['hour'][11:16]: p for p in plan}
+
+        assert by_hour['17:00']['offset'] < 0
+        assert by_hour['17:00']['tariff'] == 'L1'
+        assert all(16 <= p['setpoint'] <= 22 for p in plan)
+        # 14:00 is the L2 midday hour inside the look-back window before 17:00
+        assert by_hour['14:00']['offset'] > 0
+        assert by_hour['14:00']['setpoint'] == 22
+
+    def test_cold_weather_disables_setback(self):
+        hass = MockHass()
+        ns = load_scheduler(hass)
+
+        plan = ns.make_plan(START, 21.0, -15.0, True, {}, None)
+
+        assert all(p['offset'] >= 0 for p in plan)
+
+
+class TestReplan:
+    """Test incremental re-planning."""
+
+    def test_past_hours_are_kept(self):
+        hass = MockHass()
+        ns = load_scheduler(hass)
+        old = ns.make_plan(START, 21.0, 5.0, True, {}, None)
+        now_hour = START + timedelta(hours=5)
+        new = ns.make_plan(now_hour, 21.0, 5.0, True, {'2025-01-16 04': 0.3}, None)
+
+        merged = ns.replan(old, now_hour, new)
+
+        assert merged[:5] == old[:5]
+        assert merged[5]['hour'] == '2025-01-16 03:00'
+        assert merged[5] == new[0]
+
+    def test_signature_changes_on_temperature_jump(self):
+        hass = MockHass()
+        ns = load_scheduler(hass)
+
+        assert ns.inputs_signature({}, 1.0, True) == ns.inputs_signature({}, 2.0, True)
+        assert ns.inputs_signature({}, 1.0, True) != ns.inputs_signature({}, 5.0, True)
+
+    def test_signature_changes_on_price_change(self):
+        hass = MockHass()
+        ns = load_scheduler(hass)
+        old = {'2025-01-16 10': 0.40, '2025-01-16 11': 0.50}
+        new = {'2025-01-16 10': 0.40, '2025-01-16 11': 0.45}
+
+        assert ns.inputs_signature(old, 5.0, True) == ns.inputs_signature(dict(old), 5.0, True)
+        assert ns.inputs_signature(old, 5.0, True) != ns.inputs_signature(new, 5.0, True)
+
+
+class TestBaseSetpoint:
+    """The daily plan keeps its base setpoint across days."""
+
+    def test_rebase_keeps_base_while_zone_holds_applied_setpoint(self):
+        ns = load_scheduler(MockHass())
+        assert ns.rebase_setpoint(21.0, 19.0, 19.0) == 21.0
+
+    def test_rebase_follows_manual_change(self):
+        ns = load_scheduler(MockHass())
+        assert ns.rebase_setpoint(21.0, 22.0, 19.0) == 22.0
+        assert ns.rebase_setpoint(None, 20.5, None) == 20.5
+
+    def test_base_does_not_drift_over_days(self):
+        hass = MockHass()
+        hass.states.set('binary_sensor.sezon_grzewczy', 'on')
+        hass.states.set('sensor.temperatura_zewnetrzna', '5')
+        hass.states.set('input_boolean.pc_harmonogram_aktywny', 'on')
+        hass.states.set('climate.bodynek_nb_zone_1', 'heat', {'temperature': 21.0, 'min_temp': 10, 'max_temp': 30})
+        ns = load_scheduler(hass)
+
+        clock = {'now': START}
+
+        class FixedDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return clock['now']
+
+        ns.datetime = FixedDatetime
+        result = None
+        setpoints = []
+        for hour in range(24 * 4):
+            moment = datetime(2025, 1, 13, 0, 1) + timedelta(hours=hour)
+            for mode, minute in (('auto', 1), ('plan', 10)):
+                if mode == 'plan' and moment.hour != 21:
+                    continue
+                clock['now'] = moment.replace(minute=minute)
+                hass.services.calls.clear()
+                result = ns.run_scheduler(mode, result)
+                for call in hass.services.calls:
+                    if call['service'] == 'set_temperature':
+                        zone = hass.states.get('climate.bodynek_nb_zone_1')
+                        hass.states.set('climate.bodynek_nb_zone_1', 'heat',
+                                        {**zone.attributes, 'temperature': call['data']['temperature']})
+                setpoints.append(hass.states.get('climate.bodynek_nb_zone_1').attributes['temperature'])
+
+        assert result['base_setpoint'] == 21.0
+        assert min(setpoints) >= 21.0 - ns.SETBACK_OFFSET
+        assert min(setpoints) < 21.0
+
+
+class TestProfile:
+    """The ML profile is read from the path the coordinator passes."""
+
+    def test_profile_read_from_path(self, tmp_path):
+        ns = load_scheduler(MockHass())
+        path = tmp_path / 'ml_hourly_profile.json'
+        path.write_text('{"by_hour": {"17": 3.0}}')
+
+        assert ns.load_ml_profile(str(path)) == {'by_hour': {'17': 3.0}}
+
+    def test_missing_profile_falls_back_to_default(self, tmp_path):
+        ns = load_scheduler(MockHass())
+
+        assert ns.load_ml_profile(None) is None
+        assert ns.load_ml_profile(str(tmp_path / 'missing.json')) is None
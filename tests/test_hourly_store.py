@@ -0,0 +1,141 @@
+"""
+Tests for energy_recorder/hourly_store.py - the columnar hourly energy store.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from conftest import load_module
+
+
+hs = load_module("config/custom_components/energy_recorder/hourly_store.py")
+
+TZ = hs.ZoneInfo(hs.DEFAULT_TIMEZONE)
+
+
+def hour(h, day=15):
+    return int(datetime(2025, 1, day, h, tzinfo=TZ).timestamp())
+
+
+def values(consumption, zone="L2"):
+    return {"consumption_kwh": consumption, "pv_production_kwh": 0.0, "tariff_zone": zone, "soc_percent": 50.0}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = hs.HourlyEnergyStore(str(tmp_path / "hourly"))
+    store.open()
+    yield store
+    store.close()
+
+
+class TestHourlyEnergyStore:
+    """Test HourlyEnergyStore."""
+
+    def test_rows_read_back_like_the_csv(self, store):
+        store.append(hour(10), values(1.5, "L1"))
+        store.append(hour(11), values(2.0))
+
+        rows = store.rows()
+
+        assert rows[0]["timestamp"] == "2025-01-15 10:00:00"
+        assert rows[0]["consumption_kwh"] == 1.5
+        assert rows[0]["tariff_zone"] == "L1"
+        assert rows[1]["tariff_zone"] == "L2"
+        assert rows[0]["temperature_c"] is None
+
+    def test_duplicate_and_older_hours_are_dropped(self, store):
+        assert store.append(hour(10), values(1.0)) is True
+
+        assert store.append(hour(10), values(9.0)) is False
+        assert store.append(hour(9), values(9.0)) is False
+        assert [row["consumption_kwh"] for row in store.rows()] == [1.0]
+
+    def test_read_range_and_columns(self, store):
+        for h in range(6):
+            store.append(hour(h), values(float(h)))
+
+        data = store.read(datetime(2025, 1, 15, 2), datetime(2025, 1, 15, 4), columns=["consumption_kwh"])
+
+        assert data == {"timestamp": [hour(2), hour(3)], "consumption_kwh": [2.0, 3.0]}
+
+    def test_reader_sees_appended_rows_without_opening(self, store):
+        store.append(hour(10), values(1.0))
+
+        reader = hs.HourlyEnergyStore(store.path)
+
+        assert len(reader) == 1
+        assert reader.rows()[0]["consumption_kwh"] == 1.0
+
+    def test_partial_row_is_dropped_on_open(self, store):
+        store.append(hour(10), values(1.0))
+        store.close()
+        # An append interrupted after the timestamp was written
+        with open(Path(store.path) / "timestamp.col", "ab") as file:
+            file.write(b"\0" * 8)
+
+        store.open()
+
+        assert len(store) == 1
+        assert store.append(hour(11), values(2.0)) is True
+        assert [row["consumption_kwh"] for row in store.rows()] == [1.0, 2.0]
+
+    def test_second_writer_is_refused(self, store):
+        with pytest.raises(hs.StoreLockedError):
+            hs.HourlyEnergyStore(store.path).open()
+
+    def test_new_column_is_backfilled(self, store):
+        store.append(hour(10), values(1.0))
+        store.close()
+
+        wider = hs.HourlyEnergyStore(store.path, columns=hs.COLUMNS + (("outdoor_c", hs.FLOAT),))
+        wider.open()
+        wider.append(hour(11), {**values(2.0), "outdoor_c": -3.0})
+
+        assert [row["outdoor_c"] for row in wider.rows()] == [None, -3.0]
+        wider.close()
+
+    def test_version_1_store_gets_grid_import(self, tmp_path):
+        old = hs.HourlyEnergyStore(str(tmp_path / "old"), columns=hs.COLUMNS[:-1])
+        old.open()
+        old.append(hour(10), values(1.0))
+        old.close()
+        schema_path = Path(old.path) / "schema.json"
+        schema = json.loads(schema_path.read_text())
+        schema["version"] = 1
+        schema_path.write_text(json.dumps(schema))
+
+        store = hs.HourlyEnergyStore(old.path)
+        store.open()
+        store.append(hour(11), {**values(2.0), "grid_import_kwh": 2.5})
+
+        assert json.loads(schema_path.read_text())["version"] == hs.SCHEMA_VERSION
+        assert [row["grid_import_kwh"] for row in store.rows()] == [None, 2.5]
+        store.close()
+
+    def test_newer_schema_version_is_refused(self, store):
+        store.close()
+        schema_path = Path(store.path) / "schema.json"
+        schema = json.loads(schema_path.read_text())
+        schema["version"] = hs.SCHEMA_VERSION + 1
+        schema_path.write_text(json.dumps(schema))
+
+        with pytest.raises(hs.SchemaError):
+            store.open()
+
+    def test_import_csv_floors_to_the_hour(self, store, tmp_path):
+        csv_path = tmp_path / "hourly_energy.csv"
+        csv_path.write_text(
+            "timestamp,consumption_kwh,tariff_zone\n"
+            "2025-01-15 10:59:00,1.2,L1\n"
+            "2025-01-15 10:59:30,9.9,L1\n"
+            "2025-01-15 11:59:00,unknown,L2\n"
+        )
+
+        assert store.import_csv(str(csv_path)) == 2
+        rows = store.rows()
+        assert [row["timestamp"] for row in rows] == ["2025-01-15 10:00:00", "2025-01-15 11:00:00"]
+        assert rows[1]["consumption_kwh"] is None
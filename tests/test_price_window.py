@@ -0,0 +1,133 @@
+"""
+Tests for pstryk/price_window.py - cheapest contiguous price window search.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from conftest import load_module
+
+
+pw = load_module("config/custom_components/pstryk/price_window.py")
+
+DAY = datetime(2025, 1, 15)
+
+
+def hourly_slots(prices, start=DAY):
+    """Build hourly slots starting at `start`."""
+    return [(start + timedelta(hours=i), p) for i, p in enumerate(prices)]
+
+
+class TestFindCheapestWindow:
+    """Test find_cheapest_window()."""
+
+    def test_cheapest_three_hours(self):
+        slots = hourly_slots([0.9, 0.8, 0.3, 0.2, 0.4, 0.7, 0.1, 0.9])
+        window = pw.find_cheapest_window(slots, timedelta(hours=3))
+
+        assert window['start'] == DAY + timedelta(hours=2)
+        assert window['end'] == DAY + timedelta(hours=5)
+        assert window['expected_cost'] == pytest.approx(0.9)
+        assert window['average_price'] == pytest.approx(0.3)
+
+    def test_sell_mode_picks_most_expensive(self):
+        slots = hourly_slots([0.9, 0.8, 0.3, 0.2, 0.4, 0.7, 0.1, 0.9])
+        window = pw.find_cheapest_window(slots, timedelta(hours=2), mode='sell')
+
+        assert window['start'] == DAY
+        assert window['expected_cost'] == pytest.approx(1.7)
+
+    def test_deadline_limits_window_end(self):
+        slots = hourly_slots([0.9, 0.8, 0.5, 0.6, 0.1, 0.1])
+        window = pw.find_cheapest_window(
+            slots, timedelta(hours=2), deadline=DAY + timedelta(hours=4)
+        )
+
+        assert window['start'] == DAY + timedelta(hours=2)
+        assert window['end'] == DAY + timedelta(hours=4)
+
+    def test_not_before_skips_past_slots(self):
+        slots = hourly_slots([0.1, 0.1, 0.9, 0.5, 0.4])
+        window = pw.find_cheapest_window(
+            slots, timedelta(hours=2), not_before=DAY + timedelta(hours=2, minutes=30)
+        )
+
+        # The slot in progress (02:00) counts, the earlier cheap ones do not
+        assert window['start'] == DAY + timedelta(hours=3)
+
+    def test_gap_breaks_contiguity(self):
+        slots = hourly_slots([0.1, 0.1]) + hourly_slots([0.1, 0.5, 0.5], start=DAY + timedelta(hours=5))
+        window = pw.find_cheapest_window(slots, timedelta(hours=3))
+
+        assert window['start'] == DAY + timedelta(hours=5)
+
+    def test_energy_profile_weights_hours(self):
+        slots = hourly_slots([0.2, 0.8, 0.8, 0.2])
+        # Heavy first hour → prefer window starting where the first hour is cheap
+        window = pw.find_cheapest_window(slots, timedelta(hours=2), energy_profile=[5.0, 1.0])
+
+        assert window['start'] == DAY
+        assert window['expected_cost'] == pytest.approx(0.2 * 5 + 0.8 * 1)
+        assert window['energy'] == pytest.approx(6.0)
+
+    def test_hourly_profile_on_quarter_hour_prices(self):
+        slots = [(DAY + timedelta(minutes=15 * i), 0.4) for i in range(8)]
+        window = pw.find_cheapest_window(slots, timedelta(hours=1), energy_profile=[2.0])
+
+        assert window['slots'] == 4
+        assert window['expected_cost'] == pytest.approx(0.8)
+
+    def test_invalid_profile_length(self):
+        slots = hourly_slots([0.2, 0.8, 0.8, 0.2])
+        with pytest.raises(ValueError):
+            pw.find_cheapest_window(slots, timedelta(hours=2), energy_profile=[1.0, 1.0, 1.0])
+
+    def test_no_window_fits(self):
+        slots = hourly_slots([0.2, 0.3])
+        assert pw.find_cheapest_window(slots, timedelta(hours=3)) is None
+        assert pw.find_cheapest_window([], timedelta(hours=1)) is None
+
+
+class TestPriceAdapters:
+    """Test conversion of Pstryk and RCE price lists to slots."""
+
+    def test_pstryk_prices(self):
+        prices = [
+            {'start': '2025-01-15T01:00:00', 'price': 0.5},
+            {'start': '2025-01-15T00:00:00', 'price': 0.4},
+            {'start': 'bad', 'price': 0.3},
+        ]
+        slots = pw.pstryk_prices_to_slots(prices)
+
+        assert slots == [(DAY, 0.4), (DAY + timedelta(hours=1), 0.5)]
+
+    def test_rce_prices_use_period_start_and_kwh(self):
+        prices = [
+            {'dtime': '2025-01-15 00:15:00', 'rce_pln': 452.86},
+            {'dtime': '2025-01-15 00:30:00', 'rce_pln': 0.41},
+        ]
+        slots = pw.rce_prices_to_slots(prices)
+
+        assert slots[0][0] == DAY
+        assert slots[0][1] == pytest.approx(0.45286)
+        # Small RCE prices are still PLN/MWh
+        assert slots[1][0] == DAY + timedelta(minutes=15)
+        assert slots[1][1] == pytest.approx(0.00041)
+
+    def test_negative_rce_prices_are_converted(self):
+        prices = [
+            {'dtime': '2025-01-15 13:15:00', 'rce_pln': -5.0},
+            {'dtime': '2025-01-15 13:30:00', 'rce_pln': -120.0},
+            {'dtime': '2025-01-15 13:45:00', 'rce_pln': 8.0},
+        ]
+        slots = pw.rce_prices_to_slots(prices)
+
+        assert [price for _, price in slots] == pytest.approx([-0.005, -0.12, 0.008])
+        best = pw.find_cheapest_window(slots, timedelta(minutes=15))
+        assert best['start'] == datetime(2025, 1, 15, 13, 15)
+
+    def test_price_key_is_pln_per_kwh(self):
+        slots = pw.rce_prices_to_slots([{'dtime': '2025-01-15 00:15:00', 'price': 12.0}])
+
+        assert slots == [(DAY, 12.0)]
@@ -0,0 +1,156 @@
+"""
+Benchmarks for the Pstryk price sensor attribute path (pytest-benchmark).
+
+Builds a PstrykPriceSensor over synthetic price lists (48h and 7 days, hourly
+and quarter-hour) and measures native_value, extra_state_attributes,
+_get_next_hour_price and MQTT (EVCC) formatting, plus peak allocations per call.
+
+Requires homeassistant and pytest-benchmark (skipped otherwise):
+    pip install homeassistant -r requirements-dev.txt
+    pytest tests/test_pstryk_sensor_benchmark.py --benchmark-autosave
+    pytest tests/test_pstryk_sensor_benchmark.py --benchmark-compare --benchmark-compare-fail=mean:25%
+
+The cases only measure: times depend on the machine, so regressions are caught
+by comparing against a saved run on the same machine (--benchmark-compare-fail).
+The peak allocation per call and the number of price entries are reported in
+each benchmark's extra_info.
+"""
+
+import sys
+import tracemalloc
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pytest_benchmark")
+
+import homeassistant.util.dt as dt_util  # noqa: E402
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+if str(CONFIG_DIR) not in sys.path:
+    sys.path.insert(0, str(CONFIG_DIR))
+
+from custom_components.pstryk.const import DOMAIN  # noqa: E402
+from custom_components.pstryk.mqtt_publisher import PstrykMqttPublisher  # noqa: E402
+from custom_components.pstryk.sensor import PstrykPriceSensor  # noqa: E402
+
+
+ENTRY_ID = "benchmark"
+
+# (name, days, minutes per price entry)
+DATASETS = [
+    ("48h_hourly", 2, 60),
+    ("7d_hourly", 7, 60),
+    ("48h_15min", 2, 15),
+    ("7d_15min", 7, 15),
+]
+
+
+def build_prices(days, step_minutes):
+    """Prices from local midnight today, in the coordinator's format."""
+    start = dt_util.start_of_local_day()
+    count = days * 24 * 60 // step_minutes
+    prices = []
+    for i in range(count):
+        slot_start = start + timedelta(minutes=i * step_minutes)
+        # Deterministic price curve with a daily shape
+        price = round(0.4 + 0.3 * ((slot_start.hour * 7 + i) % 24) / 24, 4)
+        prices.append({"start": slot_start.strftime("%Y-%m-%dT%H:%M:%S"), "price": price})
+    today_str = start.strftime("%Y-%m-%d")
+    return {
+        "prices": prices,
+        "prices_today": [p for p in prices if p["start"].startswith(today_str)],
+        "current": prices[0]["price"],
+        "is_cached": False,
+    }
+
+
+@pytest.fixture(autouse=True)
+def warsaw_time_zone():
+    """Run with the production time zone."""
+    previous = dt_util.get_default_time_zone()
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Warsaw"))
+    yield
+    dt_util.set_default_time_zone(previous)
+
+
+@pytest.fixture(params=DATASETS, ids=[name for name, _, _ in DATASETS])
+def dataset(request):
+    """Coordinator data for one dataset."""
+    _, days, step = request.param
+    return build_prices(days, step)
+
+
+@pytest.fixture
+def pstryk_hass(mock_hass):
+    """Mock hass with the sun entity and pstryk data the sensor reads."""
+    now = dt_util.utcnow()
+    mock_hass.states.set("sun.sun", "above_horizon", {
+        "next_rising": (now + timedelta(hours=18)).isoformat(),
+        "next_setting": (now + timedelta(hours=6)).isoformat(),
+    })
+    mock_hass.data = {DOMAIN: {f"{ENTRY_ID}_mqtt_48h_mode": True}}
+    return mock_hass
+
+
+@pytest.fixture
+def sensor(pstryk_hass, dataset):
+    """PstrykPriceSensor wired to a coordinator holding the dataset."""
+    coordinator = SimpleNamespace(
+        data=dataset,
+        mqtt_48h_mode=True,
+        last_update_success=True,
+    )
+    entity = PstrykPriceSensor(coordinator, "buy", 5, 5, ENTRY_ID)
+    entity.hass = pstryk_hass
+    return entity
+
+
+@pytest.fixture
+def publisher(pstryk_hass):
+    """MQTT publisher using the mock hass."""
+    return PstrykMqttPublisher(pstryk_hass, ENTRY_ID)
+
+
+def peak_allocation(func):
+    """Peak bytes allocated by a single call."""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def record_info(benchmark, func, entries):
+    """Attach the entry count and the peak allocation of one call to the benchmark."""
+    benchmark.extra_info["entries"] = entries
+    benchmark.extra_info["alloc_peak_bytes"] = peak_allocation(func)
+    benchmark.extra_info["mean_us_per_entry"] = round(benchmark.stats.stats.mean * 1e6 / entries, 3)
+
+
+class TestPriceSensorBenchmark:
+    """Latency and allocations of the price sensor state and attributes."""
+
+    def test_native_value(self, benchmark, sensor, dataset):
+        result = benchmark(lambda: sensor.native_value)
+        assert result is not None
+        record_info(benchmark, lambda: sensor.native_value, len(dataset["prices"]))
+
+    def test_extra_state_attributes(self, benchmark, sensor, dataset):
+        result = benchmark(lambda: sensor.extra_state_attributes)
+        assert result["mqtt_48h_mode"] is True
+        record_info(benchmark, lambda: sensor.extra_state_attributes, len(dataset["prices"]))
+
+    def test_next_hour_price(self, benchmark, sensor, dataset):
+        benchmark(sensor._get_next_hour_price)
+        record_info(benchmark, sensor._get_next_hour_price, len(dataset["prices"]))
+
+    def test_mqtt_format(self, benchmark, publisher, dataset):
+        result = benchmark(publisher._format_prices_for_evcc, dataset, "buy")
+        assert result
+        record_info(benchmark, lambda: publisher._format_prices_for_evcc(dataset, "buy"), len(dataset["prices"]))
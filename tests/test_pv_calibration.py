@@ -0,0 +1,125 @@
+"""
+Tests for pv_calibration/calibration.py - per-plane PV forecast calibration.
+"""
+
+import json
+from datetime import date
+
+from conftest import load_module
+
+
+pc = load_module("config/custom_components/pv_calibration/calibration.py")
+
+DAY = date(2025, 6, 15)
+
+# Plane shapes (kWh): east peaks in the morning, west in the evening
+EAST = {7: 2.0, 8: 2.5, 9: 2.0, 10: 1.5, 11: 1.0, 12: 0.8, 13: 0.5, 14: 0.3, 15: 0.2, 16: 0.1}
+SOUTH = {8: 0.5, 9: 1.0, 10: 1.5, 11: 2.0, 12: 2.2, 13: 2.0, 14: 1.5, 15: 1.0, 16: 0.5}
+WEST = {10: 0.1, 11: 0.2, 12: 0.4, 13: 0.8, 14: 1.2, 15: 1.6, 16: 1.8, 17: 1.6, 18: 1.0}
+
+
+def plane_hour(hour):
+    return [EAST.get(hour, 0.0), SOUTH.get(hour, 0.0), WEST.get(hour, 0.0)]
+
+
+class TestHourlyEnergy:
+    """Test hourly_energy()."""
+
+    def test_hourly_points_are_integrated_per_hour(self):
+        watts = {
+            "2025-06-15 05:00:00": 0,
+            "2025-06-15 06:00:00": 1000,
+            "2025-06-15 07:00:00": 1000,
+            "2025-06-15 08:00:00": 0,
+            "2025-06-16 06:00:00": 5000,
+        }
+
+        hourly = pc.hourly_energy(watts, DAY)
+
+        assert hourly[5:8] == [0.5, 1.0, 0.5]
+        assert sum(hourly) == 2.0
+
+    def test_segment_crossing_hours_is_split(self):
+        watts = {"2025-06-15 04:30:00": 0, "2025-06-15 05:30:00": 2000}
+
+        hourly = pc.hourly_energy(watts, DAY)
+
+        assert hourly[4] == 0.25
+        assert hourly[5] == 0.75
+
+    def test_missing_watts_give_zero_day(self):
+        assert pc.hourly_energy(None, DAY) == [0.0] * 24
+
+
+class TestPvCalibration:
+    """Test PvCalibration."""
+
+    def test_starts_from_seasonal_defaults(self):
+        calibration = pc.PvCalibration()
+
+        assert calibration.factors(1) == {"east": 0.5, "south": 0.5, "west": 0.5}
+        assert calibration.correct_hour(6, 12, [1.0, 1.0, 1.0]) == 2.7
+
+    def test_rls_separates_planes_by_their_hours(self):
+        calibration = pc.PvCalibration()
+        # East actually produces 60 % of its forecast, south and west 100 %
+        for _ in range(30):
+            for hour in range(6, 20):
+                east, south, west = plane_hour(hour)
+                calibration.add_hour(6, hour, [east, south, west], 0.6 * east + south + west)
+
+        factors = calibration.factors(6)
+
+        assert abs(factors["east"] - 0.6) < 0.05
+        assert abs(factors["south"] - 1.0) < 0.05
+        assert abs(factors["west"] - 1.0) < 0.05
+
+    def test_hour_ratio_learns_shading(self):
+        calibration = pc.PvCalibration()
+        for _ in range(60):
+            for hour in range(6, 20):
+                forecasts = plane_hour(hour)
+                # Shading at 17:00 halves production
+                actual = sum(forecasts) * (0.5 if hour == 17 else 1.0)
+                calibration.add_hour(6, hour, forecasts, actual)
+
+        corrected = calibration.correct_hour(6, 17, plane_hour(17))
+
+        assert corrected < 0.8 * sum(plane_hour(17))
+
+    def test_dark_hours_are_ignored(self):
+        calibration = pc.PvCalibration()
+
+        assert calibration.add_hour(6, 3, [0.0, 0.0, 0.01], 0.0) is False
+        assert calibration.samples(6) == 0
+
+    def test_factors_stay_within_limits(self):
+        calibration = pc.PvCalibration()
+        for _ in range(50):
+            calibration.add_hour(6, 12, [1.0, 1.0, 1.0], 20.0)
+
+        assert all(factor <= pc.FACTOR_LIMITS[1] for factor in calibration.factors(6).values())
+
+    def test_correct_day_uses_each_plane(self):
+        calibration = pc.PvCalibration({6: 1.0})
+        planes = {
+            "east": [EAST.get(hour, 0.0) for hour in range(24)],
+            "south": [SOUTH.get(hour, 0.0) for hour in range(24)],
+            "west": [WEST.get(hour, 0.0) for hour in range(24)],
+        }
+
+        hourly = calibration.correct_day(6, planes)
+
+        assert hourly[8] == 3.0
+        assert hourly[17] == 1.6
+
+    def test_restore_continues_learning(self):
+        calibration = pc.PvCalibration()
+        calibration.add_hour(6, 12, plane_hour(12), 3.0)
+        saved = json.loads(json.dumps(calibration.as_dict()))
+
+        restored = pc.PvCalibration.from_dict(saved)
+
+        assert restored.factors(6) == calibration.factors(6)
+        assert restored.samples(6) == 1
+        assert restored.correct_hour(6, 12, plane_hour(12)) == calibration.correct_hour(6, 12, plane_hour(12))
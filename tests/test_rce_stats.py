@@ -0,0 +1,89 @@
+"""
+Tests for rce_stats/stats.py - RCE thresholds and daily statistics.
+"""
+
+from conftest import load_module
+
+
+rs = load_module("config/custom_components/rce_stats/stats.py")
+
+DAY = "2026-03-05"
+
+
+def quarter_prices(day, hourly_mwh):
+    """RCE PSE entries: four 15-minute prices (PLN/MWh) per hour."""
+    entries = []
+    for hour, price in hourly_mwh.items():
+        for minute in (15, 30, 45):
+            entries.append({"dtime": f"{day} {hour:02d}:{minute:02d}:00", "rce_pln": price})
+        if hour < 23:
+            entries.append({"dtime": f"{day} {hour + 1:02d}:00:00", "rce_pln": price})
+    return entries
+
+
+class TestSummarizeDay:
+    """Thresholds and statistics in one pass."""
+
+    def test_percentiles_match_template_indexing(self):
+        prices = [{"dtime": f"{DAY} {h:02d}:00:00", "rce_pln": 100 * (h - 5)} for h in range(6, 22)]
+        summary = rs.summarize_day(prices, DAY, (6, 21))
+        values = sorted(0.1 * (h - 5) for h in range(6, 22))
+        assert summary["p33"] == round(values[int(16 * 0.33)], 2)
+        assert summary["p66"] == round(values[int(16 * 0.66)], 2)
+        assert summary["min_price"] == 0.1
+        assert summary["max_price"] == 1.6
+        assert summary["count"] == 16
+
+    def test_hours_outside_window_skipped_for_thresholds(self):
+        prices = quarter_prices(DAY, {3: 2000, 10: 300, 11: 400})
+        summary = rs.summarize_day(prices, DAY, (6, 21))
+        assert summary["max_price"] == 0.4
+        # ...but still in the hourly averages
+        assert summary["hourly"][4] == 2.0
+
+    def test_other_days_skipped(self):
+        prices = quarter_prices(DAY, {10: 300}) + quarter_prices("2026-03-06", {10: 900})
+        summary = rs.summarize_day(prices, DAY)
+        assert summary["max_price"] == 0.3
+        assert summary["count"] == 4
+
+    def test_hourly_average_of_quarters(self):
+        prices = [
+            {"dtime": f"{DAY} 12:15:00", "rce_pln": 100},
+            {"dtime": f"{DAY} 12:30:00", "rce_pln": 200},
+            {"dtime": f"{DAY} 12:45:00", "rce_pln": 300},
+        ]
+        summary = rs.summarize_day(prices, DAY)
+        assert summary["hourly"][12] == 0.2
+        assert summary["hourly"][11] is None
+        assert summary["average"] == 0.2
+
+    def test_iso_dtime_and_bad_entries(self):
+        prices = [
+            {"dtime": f"{DAY}T10:00:00", "rce_pln": 500},
+            {"dtime": None, "rce_pln": 100},
+            {"rce_pln": 100},
+            {"dtime": f"{DAY} 11:00:00", "rce_pln": "n/a"},
+        ]
+        summary = rs.summarize_day(prices, DAY)
+        assert summary["count"] == 1
+        assert summary["p33"] == 0.5
+
+    def test_no_prices_gives_defaults(self):
+        summary = rs.summarize_day(None, DAY)
+        assert summary["p33"] == 0.40 and summary["p66"] == 0.60
+        assert summary["average"] is None
+        assert summary["hourly"] == [None] * 24
+
+
+class TestAverageBetween:
+    """Evening average from hourly prices."""
+
+    def test_average_of_available_hours(self):
+        hourly = [None] * 24
+        hourly[19], hourly[20], hourly[21], hourly[22] = 0.6, 0.8, 1.0, 5.0
+        assert abs(rs.average_between(hourly, 19, 22) - 0.8) < 1e-9
+
+    def test_none_without_prices(self):
+        assert rs.average_between([None] * 24, 19, 22) is None
+        assert rs.average_between([0.5] * 24, 22, 22) is None
@@ -0,0 +1,96 @@
+"""
+Tests for solar_ephemeris/ephemeris.py - sunrise, sunset and clear-sky table.
+"""
+
+from datetime import date
+
+from conftest import load_module
+
+
+se = load_module("config/custom_components/solar_ephemeris/ephemeris.py")
+
+# Location from configuration.yaml
+LATITUDE = 54.163651
+LONGITUDE = 16.106855
+
+
+def make_ephemeris():
+    return se.SolarEphemeris(LATITUDE, LONGITUDE, "Europe/Warsaw")
+
+
+def minutes(hhmm):
+    hours, mins = hhmm.split(":")
+    return int(hours) * 60 + int(mins)
+
+
+class TestSunTimes:
+    """Sunrise and sunset in local time, daylight saving included."""
+
+    def test_summer_solstice(self):
+        day = make_ephemeris().day(date(2026, 6, 21))
+        # Koszalin: sunrise ~04:22 CEST, sunset ~21:31 CEST
+        assert abs(minutes(day["sunrise"]) - minutes("04:22")) <= 5
+        assert abs(minutes(day["sunset"]) - minutes("21:31")) <= 5
+        assert 17 < day["daylight"] < 17.5
+
+    def test_winter_solstice(self):
+        day = make_ephemeris().day(date(2026, 12, 21))
+        # Koszalin: sunrise ~08:12 CET, sunset ~15:34 CET
+        assert abs(minutes(day["sunrise"]) - minutes("08:12")) <= 5
+        assert abs(minutes(day["sunset"]) - minutes("15:34")) <= 5
+
+    def test_daylight_saving_shifts_local_times(self):
+        ephemeris = make_ephemeris()
+        before = ephemeris.day(date(2026, 3, 28))
+        after = ephemeris.day(date(2026, 3, 29))
+        # Clocks go forward on 29 March: sunrise jumps ~1h later
+        assert minutes(after["sunrise"]) - minutes(before["sunrise"]) > 50
+
+
+class TestClearSky:
+    """Clear-sky energy per local hour."""
+
+    def test_zero_at_night_and_peak_around_noon(self):
+        day = make_ephemeris().day(date(2026, 6, 21))
+        clear_sky = day["clear_sky"]
+        assert len(clear_sky) == 24
+        assert clear_sky[0] == 0 and clear_sky[23] == 0
+        # Solar noon ~13:00 CEST at 16.1E
+        assert clear_sky.index(max(clear_sky)) in (12, 13)
+        assert 0.7 < max(clear_sky) < 1.0
+        assert day["clear_sky_kwh_m2"] == round(sum(clear_sky), 2)
+
+    def test_summer_brighter_than_winter(self):
+        ephemeris = make_ephemeris()
+        assert ephemeris.day(date(2026, 6, 21))["clear_sky_kwh_m2"] > 5 * ephemeris.day(date(2026, 12, 21))["clear_sky_kwh_m2"]
+
+    def test_window_covers_hours_with_sun(self):
+        day = make_ephemeris().day(date(2026, 3, 20))
+        start, end = day["window"]
+        assert all(day["clear_sky"][hour] >= se.SUN_HOUR_MIN_KWH_M2 for hour in range(start, end))
+        assert day["clear_sky"][start - 1] < se.SUN_HOUR_MIN_KWH_M2
+        assert day["clear_sky"][end] < se.SUN_HOUR_MIN_KWH_M2
+
+
+class TestTable:
+    """Year-long lookup built once."""
+
+    def test_build_and_lookup(self):
+        ephemeris = make_ephemeris()
+        ephemeris.build(date(2026, 1, 1), 366)
+        assert len(ephemeris) == 366
+        assert date(2026, 7, 1) in ephemeris
+        assert date(2027, 1, 2) not in ephemeris
+        assert ephemeris.day(date(2026, 7, 1))["date"] == "2026-07-01"
+
+    def test_day_outside_table_is_computed(self):
+        ephemeris = make_ephemeris()
+        ephemeris.build(date(2026, 1, 1), 1)
+        assert ephemeris.day(date(2026, 6, 21)) == make_ephemeris().day(date(2026, 6, 21))
+        assert len(ephemeris) == 1
+
+    def test_polar_night_has_no_sunrise(self):
+        ephemeris = se.SolarEphemeris(78.22, 15.65, "Europe/Oslo")
+        day = ephemeris.day(date(2026, 12, 21))
+        assert day["sunrise"] is None and day["sunset"] is None
+        assert day["window"] is None
@@ -0,0 +1,78 @@
+"""
+Tests for startup_profiler/profile.py - the startup timings report.
+"""
+
+import json
+
+from conftest import load_module
+
+
+sp = load_module("config/custom_components/startup_profiler/profile.py")
+
+
+class TestStartupProfile:
+    """Test StartupProfile."""
+
+    def test_setup_is_summed_over_entries(self):
+        profile = sp.StartupProfile(["pstryk"])
+        profile.record_setup("pstryk", "a", "Buy", 1.25, True)
+        profile.record_setup("pstryk", "b", "Sell", 0.5, True)
+
+        report = profile.as_dict()
+
+        assert report["integrations"]["pstryk"]["setup_seconds"] == 1.75
+        assert len(report["integrations"]["pstryk"]["entries"]) == 2
+
+    def test_only_first_setup_of_an_entry_is_kept(self):
+        profile = sp.StartupProfile(["pstryk"])
+        profile.record_setup("pstryk", "a", "Buy", 1.0, False)
+        profile.record_setup("pstryk", "a", "Buy", 3.0, True)
+
+        assert profile.as_dict()["integrations"]["pstryk"]["entries"][0]["seconds"] == 1.0
+
+    def test_coordinators_with_same_name_are_kept_apart(self):
+        profile = sp.StartupProfile(["panasonic_cc"])
+        profile.record_first_refresh("panasonic_cc", "device", 2.0, True)
+        profile.record_first_refresh("panasonic_cc", "device", 4.0, False)
+
+        data = profile.as_dict()["integrations"]["panasonic_cc"]
+
+        assert set(data["coordinators"]) == {"device", "device #2"}
+        assert data["slowest_first_refresh_seconds"] == 4.0
+
+    def test_first_state_keeps_earliest_entity_and_counts(self):
+        profile = sp.StartupProfile(["huawei_solar"])
+        profile.record_first_state("huawei_solar", "sensor.a", 30.0)
+        profile.record_first_state("huawei_solar", "sensor.b", 31.0)
+
+        data = profile.as_dict()["integrations"]["huawei_solar"]
+
+        assert data["first_state_seconds"] == 30.0
+        assert data["first_state_entity"] == "sensor.a"
+        assert data["entities"] == 2
+
+    def test_slowest_setup_falls_back_to_homeassistant_timing(self):
+        profile = sp.StartupProfile(["hacs", "pstryk"])
+        profile.record_homeassistant_setup("hacs", 9.0)
+        profile.record_setup("pstryk", "a", "Buy", 2.0, True)
+
+        assert profile.as_dict()["slowest_setup"] == "hacs"
+
+    def test_untimed_integrations_are_reported_empty(self):
+        profile = sp.StartupProfile(["hacs"])
+
+        report = profile.as_dict()
+
+        assert report["slowest_setup"] is None
+        assert report["integrations"]["hacs"]["setup_seconds"] is None
+        assert profile.summary()["hacs"]["import_seconds"] is None
+
+    def test_report_is_json_serializable(self):
+        profile = sp.StartupProfile(["pstryk"])
+        profile.record_import("pstryk", 0.1234)
+        profile.record_started(42.0)
+
+        report = json.loads(json.dumps(profile.as_dict()))
+
+        assert report["started_seconds"] == 42.0
+        assert report["integrations"]["pstryk"]["import_seconds"] == 0.123
@@ -0,0 +1,171 @@
+"""
+Tests for tariff_compare/costs.py - import cost of the hourly history per tariff.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from conftest import load_module
+
+
+TZ = "Europe/Warsaw"
+
+costs = load_module("config/custom_components/tariff_compare/costs.py")
+hourly_store = load_module("config/custom_components/energy_recorder/hourly_store.py")
+
+
+def history(rows):
+    """Columns as HourlyEnergyStore.read() returns them, from (local datetime, values) rows."""
+    zone = ZoneInfo(TZ)
+    data = {"timestamp": [int(moment.replace(tzinfo=zone).timestamp()) for moment, _ in rows]}
+    for column in costs.COLUMNS:
+        data[column] = [values.get(column) for _, values in rows]
+    return data
+
+
+def hour(day, hour_, grid_import=1.0, **values):
+    return datetime.fromisoformat(f"{day}T{hour_:02d}:00"), {"grid_import_kwh": grid_import, **values}
+
+
+# 2026-03-05 is a Thursday, 2026-03-07 a Saturday
+WORKDAY, SATURDAY = "2026-03-05", "2026-03-07"
+
+# Example offers, the defaults only hold the tariffs with known rates
+G11 = {"type": "flat", "rate": 1.04}
+G12 = {"type": "zones", "peak": 1.22, "offpeak": 0.80, "weekend_offpeak": False}
+
+
+class TestHourlyInputs:
+    """Grid import comes from its own column, old hours from consumption and the battery flows."""
+
+    def test_recorded_grid_import(self):
+        inputs = costs.hourly_inputs(
+            history([hour(WORKDAY, 10, 0.4, consumption_kwh=0.0, battery_charge_kwh=3.0)]), TZ
+        )
+        assert inputs["import_kwh"] == [0.4]
+        assert inputs["missing"] == [False]
+
+    def test_old_hour_reverses_recorder_consumption(self):
+        inputs = costs.hourly_inputs(
+            history([hour(WORKDAY, 10, None, consumption_kwh=2.0, battery_charge_kwh=1.0, battery_discharge_kwh=0.5)]),
+            TZ,
+        )
+        assert inputs["import_kwh"] == [2.5]
+
+    def test_old_clamped_hour_is_missing(self):
+        # Charging from PV: consumption was clamped at 0, the import is lost
+        inputs = costs.hourly_inputs(history([hour(WORKDAY, 12, None, consumption_kwh=0.0, battery_charge_kwh=3.0)]), TZ)
+        assert inputs["import_kwh"] == [0.0]
+        assert inputs["missing"] == [True]
+
+    def test_missing_import(self):
+        inputs = costs.hourly_inputs(history([hour(WORKDAY, 10, None)]), TZ)
+        assert inputs["import_kwh"] == [0.0]
+        assert inputs["missing"] == [True]
+
+    def test_missing_rce_uses_default(self):
+        inputs = costs.hourly_inputs(history([hour(WORKDAY, 10)]), TZ)
+        assert inputs["rce_kwh"] == [costs.DEFAULT_RCE_MWH / 1000]
+
+    def test_local_day_and_hour(self):
+        inputs = costs.hourly_inputs(history([hour(WORKDAY, 23), hour(SATURDAY, 0)]), TZ)
+        assert inputs["day"] == [WORKDAY, SATURDAY]
+        assert inputs["hour"] == [23, 0]
+        assert inputs["weekend"] == [False, True]
+
+
+class TestHourlyPrices:
+    """Price of every hour per tariff type."""
+
+    def _inputs(self, rows):
+        return costs.hourly_inputs(history(rows), TZ)
+
+    def test_flat(self):
+        inputs = self._inputs([hour(WORKDAY, 3), hour(WORKDAY, 18)])
+        assert costs.hourly_prices(G11, inputs) == [1.04, 1.04]
+
+    def test_g12_zones_by_hour(self):
+        inputs = self._inputs([hour(SATURDAY, 13), hour(SATURDAY, 15), hour(SATURDAY, 22)])
+        assert costs.hourly_prices(G12, inputs) == [0.80, 1.22, 0.80]
+
+    def test_g12w_weekend_offpeak(self):
+        inputs = self._inputs([hour(WORKDAY, 18), hour(SATURDAY, 18)])
+        assert costs.hourly_prices(costs.TARIFFS["g12w"], inputs) == [1.16, 0.78]
+
+    def test_g12w_recorded_zone_wins(self):
+        # A holiday on a workday: the recorder's zone already says L2
+        inputs = self._inputs([hour(WORKDAY, 18, tariff_zone="L2")])
+        assert costs.hourly_prices(costs.TARIFFS["g12w"], inputs) == [0.78]
+
+    def test_dynamic_follows_rce(self):
+        inputs = self._inputs([hour(WORKDAY, 12, rce_price_pln_mwh=200.0)])
+        assert costs.hourly_prices(costs.TARIFFS["dynamic"], inputs) == [(0.2 + 0.155) * 1.23]
+
+
+class TestDailyCosts:
+    """All tariffs summed per day in one pass."""
+
+    def test_costs_per_day(self):
+        rows = [
+            hour(WORKDAY, 12, 2.0, tariff_zone="L1", rce_price_pln_mwh=300.0),
+            hour(WORKDAY, 13, 1.0, tariff_zone="L2", rce_price_pln_mwh=100.0, grid_export_kwh=3.0),
+            hour(SATURDAY, 18, 1.0, tariff_zone="L2", rce_price_pln_mwh=500.0),
+        ]
+        days = costs.daily_costs(history(rows), {**costs.TARIFFS, "g11": G11, "g12": G12}, TZ)
+        assert sorted(days) == [WORKDAY, SATURDAY]
+        workday = days[WORKDAY]
+        assert workday["hours"] == 2
+        assert workday["import_kwh"] == 3.0
+        assert workday["export_value"] == round(3.0 * 0.1 * 1.23, 4)
+        assert workday["costs"]["g11"] == 3.12
+        assert workday["costs"]["g12w"] == round(2 * 1.16 + 0.78, 4)
+        assert workday["costs"]["dynamic"] == round(2 * 0.455 * 1.23 + 0.255 * 1.23, 4)
+        assert days[SATURDAY]["costs"]["g12"] == 1.22
+
+    def test_defaults_leave_out_unpriced_offers(self):
+        assert sorted(costs.TARIFFS) == ["dynamic", "g12w"]
+
+    def test_custom_tariffs_only(self):
+        tariffs = {"cheap": {"type": "flat", "rate": 0.5}}
+        days = costs.daily_costs(history([hour(WORKDAY, 10, 4.0)]), tariffs, TZ)
+        assert days[WORKDAY]["costs"] == {"cheap": 2.0}
+
+    def test_empty_history(self):
+        assert costs.daily_costs(history([]), costs.TARIFFS, TZ) == {}
+
+    def test_reads_from_hourly_store(self, tmp_path):
+        store = hourly_store.HourlyEnergyStore(str(tmp_path / "store"))
+        store.open()
+        zone = ZoneInfo(TZ)
+        for moment, values in (hour(WORKDAY, 10, 1.0, tariff_zone="L1"), hour(WORKDAY, 22, 2.0, tariff_zone="L2")):
+            store.append(int(moment.replace(tzinfo=zone).timestamp()), values)
+        data = store.read(columns=list(costs.COLUMNS), tz=TZ)
+        store.close()
+        days = costs.daily_costs(data, costs.TARIFFS, TZ)
+        assert days[WORKDAY]["costs"]["g12w"] == round(1.16 + 2 * 0.78, 4)
+
+
+class TestSummarize:
+    """Totals over days, cheapest tariff and the saving against the current one."""
+
+    def test_totals_and_saving(self):
+        days = {
+            "2026-03-01": {"hours": 24, "missing": 0, "import_kwh": 10.0, "export_kwh": 0.0, "export_value": 0.0,
+                           "costs": {"g12w": 9.0, "dynamic": 7.0}},
+            "2026-03-02": {"hours": 23, "missing": 1, "import_kwh": 5.0, "export_kwh": 2.0, "export_value": 0.8,
+                           "costs": {"g12w": 4.0, "dynamic": 4.5}},
+        }
+        summary = costs.summarize(days, "g12w")
+        assert summary["days"] == 2
+        assert summary["hours"] == 47
+        assert summary["missing"] == 1
+        assert summary["import_kwh"] == 15.0
+        assert summary["costs"] == {"g12w": 13.0, "dynamic": 11.5}
+        assert summary["cheapest"] == "dynamic"
+        assert summary["saving"] == 1.5
+
+    def test_no_days(self):
+        summary = costs.summarize({}, "g12w")
+        assert summary["costs"] == {}
+        assert summary["cheapest"] is None
+        assert summary["saving"] is None